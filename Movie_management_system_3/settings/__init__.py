@@ -0,0 +1,18 @@
+"""
+Settings profiles for the Movie_management_system_3 project.
+
+The DJANGO_ENV environment variable picks the profile:
+
+- ``development`` (default): DEBUG on, local SQLite, per-process cache
+- ``production``: DEBUG off, configured from the environment (see production.py)
+
+A profile can also be selected directly with
+DJANGO_SETTINGS_MODULE=Movie_management_system_3.settings.production.
+"""
+
+import os
+
+if os.environ.get('DJANGO_ENV', 'development') == 'production':
+    from .production import *  # noqa: F401,F403
+else:
+    from .development import *  # noqa: F401,F403
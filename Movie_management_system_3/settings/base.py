@@ -1,5 +1,5 @@
 """
-Django settings for Movie_management_system_3 project.
+Settings shared by every profile of the Movie_management_system_3 project.
 
 Generated by 'django-admin startproject' using Django 5.2.7.
 
@@ -10,22 +10,15 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
-BASE_DIR = Path(__file__).resolve().parent.parent
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 
-# Quick-start development settings - unsuitable for production
-# See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
-
-# SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = 'django-insecure-da55(c=$52n359!b8wkqw6(5xg6&e$=p2f&^_*k_@1es!!03v#'
-
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
-
-ALLOWED_HOSTS = []
+DEBUG = False
 
 
 # Application definition
@@ -70,8 +63,21 @@ TEMPLATES = [
     },
 ]
 
+# Compile every template in movies/ and accounts/ when a WSGI/ASGI worker boots,
+# so no request pays the parse cost. Django keeps compiled templates in its
+# cached loader; `python manage.py check_templates` renders each one to check it.
+PRELOAD_TEMPLATES = True
+
 WSGI_APPLICATION = 'Movie_management_system_3.wsgi.application'
 
+# Serve the async catalog and dashboard views (movies.async_views); asgi.py
+# turns this on, WSGI servers and runserver keep the sync views
+ASYNC_VIEWS = os.environ.get('DJANGO_ASYNC_VIEWS') == '1'
+
+# Serve anonymous catalog pages from the shared cache (movies.page_cache);
+# benchmark_home turns it off to measure the views themselves
+PAGE_CACHE = os.environ.get('DJANGO_PAGE_CACHE', '1') == '1'
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
@@ -83,6 +89,10 @@ DATABASES = {
     }
 }
 
+# Catalog pages and dashboard aggregates read from DATABASES['replica'] when
+# one is configured (see movies.routers); everything else uses 'default'
+DATABASE_ROUTERS = ['movies.routers.ReplicaRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -137,6 +147,17 @@ LOGOUT_REDIRECT_URL = '/accounts/login/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# Serve STATIC_ROOT from Django itself (movies.static_assets.serve_static),
+# for deployments without a web server in front of it
+SERVE_STATIC = False
+
 # Media files configuration
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+
+# Uploads are streamed to temporary files in chunks, never held in memory.
+# Images are checked against these limits from their headers, before
+# anything decodes them (see movies.uploads).
+FILE_UPLOAD_HANDLERS = ['movies.uploads.LimitedTemporaryFileUploadHandler']
+IMAGE_UPLOAD_MAX_SIZE = int(os.environ.get('IMAGE_UPLOAD_MAX_SIZE', 10 * 1024 * 1024))  # bytes
+IMAGE_UPLOAD_MAX_DIMENSION = int(os.environ.get('IMAGE_UPLOAD_MAX_DIMENSION', 4000))  # pixels per side
@@ -0,0 +1,28 @@
+"""
+Development settings - unsuitable for production
+See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
+"""
+
+import os
+
+from .base import *  # noqa: F401,F403
+from .base import DATABASES
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = 'django-insecure-da55(c=$52n359!b8wkqw6(5xg6&e$=p2f&^_*k_@1es!!03v#'
+
+DEBUG = True
+
+ALLOWED_HOSTS = []
+
+# Templates are reloaded on change by runserver instead
+PRELOAD_TEMPLATES = False
+
+# Optional local read replica: a second SQLite file (e.g. a copy of
+# db.sqlite3) to exercise the replica router with
+if os.environ.get('SQLITE_REPLICA_PATH'):
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ['SQLITE_REPLICA_PATH'],
+        'TEST': {'MIRROR': 'default'},
+    }
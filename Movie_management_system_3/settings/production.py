@@ -0,0 +1,97 @@
+"""
+Production settings, configured from the environment.
+
+Required:
+    SECRET_KEY, ALLOWED_HOSTS (comma-separated)
+Optional:
+    SQLITE_PATH          database file (default: db.sqlite3 in the project root)
+    SQLITE_REPLICA_PATH  read replica for catalog pages and the dashboard
+    CONN_MAX_AGE         seconds a worker keeps its database connection (default: 600)
+    REDIS_URL            shared cache; without it a file cache under CACHE_DIR is used
+    CACHE_DIR            file cache location (default: .cache in the project root)
+    SERVE_STATIC         1 to serve collected static files from Django (default: 0)
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .base import *  # noqa: F401,F403
+from .base import BASE_DIR
+
+
+def env(name, default=None):
+    value = os.environ.get(name, default)
+    if value is None:
+        raise ImproperlyConfigured(f'The {name} environment variable is required in production')
+    return value
+
+
+SECRET_KEY = env('SECRET_KEY')
+
+DEBUG = False
+
+ALLOWED_HOSTS = [host.strip() for host in env('ALLOWED_HOSTS').split(',') if host.strip()]
+
+
+# Database
+# Connections are kept open across requests and checked before reuse. The
+# PRAGMAs run on every new connection: WAL lets page reads proceed while a
+# booking is being written, and synchronous=NORMAL is durable under WAL
+# without an fsync per commit. The driver's timeout (SQLite's busy timeout,
+# in seconds) makes writers queue for the lock instead of failing.
+# IMMEDIATE transactions take the write lock up front, so a read-then-write
+# booking transaction can't deadlock on lock upgrade.
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': env('SQLITE_PATH', str(BASE_DIR / 'db.sqlite3')),
+        'CONN_MAX_AGE': int(env('CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 5,
+            'init_command': (
+                'PRAGMA journal_mode=WAL;'
+                'PRAGMA synchronous=NORMAL;'
+                'PRAGMA mmap_size=268435456;'
+            ),
+        },
+    }
+}
+
+if os.environ.get('SQLITE_REPLICA_PATH'):
+    DATABASES['replica'] = {**DATABASES['default'], 'NAME': os.environ['SQLITE_REPLICA_PATH']}
+
+
+# Cache
+# Shared by all workers: page and fragment caches, site settings and the
+# autocomplete index versions all rely on it.
+
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': env('CACHE_DIR', str(BASE_DIR / '.cache')),
+        }
+    }
+
+
+# Static files
+# collectstatic writes content-hashed copies plus pre-compressed .gz/.br
+# siblings; pages link to the hashed names, which are cached for a year.
+
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'movies.static_assets.CompressedManifestStaticFilesStorage'},
+}
+
+SERVE_STATIC = env('SERVE_STATIC', '0') == '1'
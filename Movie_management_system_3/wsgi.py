@@ -9,8 +9,14 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Movie_management_system_3.settings')
 
 application = get_wsgi_application()
+
+if settings.PRELOAD_TEMPLATES:
+    from movies.template_bundle import preload_templates
+
+    preload_templates()
@@ -4,6 +4,7 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from .models import Account
 from .forms import RegisterForm, LoginForm, UpdateProfileForm, ChangePasswordForm
+from movies.pagination import keyset_paginate
 
 
 def register_view(request):
@@ -100,10 +101,11 @@ def my_bookings_view(request):
     """
     User bookings view - Shows all user bookings
     """
-    bookings = request.user.bookings.all().order_by('-booking_date')
+    page_obj = keyset_paginate(request, request.user.bookings.select_related('movie'), 'booking_date')
     
     context = {
-        'bookings': bookings,
+        'bookings': page_obj,
+        'page_obj': page_obj,
     }
     
     return render(request, 'my_bookings.html', context)
@@ -114,10 +116,11 @@ def my_reviews_view(request):
     """
     User reviews view - Shows all user reviews
     """
-    reviews = request.user.reviews.all().order_by('-created_at')
+    page_obj = keyset_paginate(request, request.user.reviews.select_related('movie'), 'created_at')
     
     context = {
-        'reviews': reviews,
+        'reviews': page_obj,
+        'page_obj': page_obj,
     }
     
     return render(request, 'my_reviews.html', context)
@@ -1,5 +1,10 @@
 from django.contrib import admin
-from .models import Genre, Movie, Booking, Review, SiteSetting
+from django.db import models
+from .models import Genre, Movie, Person, MovieCredit, Showtime, Booking, Review, DailyMovieStat, SiteSetting, StoredFile
+from .uploads import HeaderValidatedImageField
+
+# Same upload limits as the dashboard forms
+IMAGE_FIELD_OVERRIDES = {models.ImageField: {'form_class': HeaderValidatedImageField}}
 
 
 @admin.register(Genre)
@@ -9,18 +14,55 @@ class GenreAdmin(admin.ModelAdmin):
     ordering = ['name']
 
 
+class MovieCreditInline(admin.TabularInline):
+    model = MovieCredit
+    fields = ['person', 'order']
+    readonly_fields = ['person', 'order']
+    extra = 0
+    can_delete = False
+    
+    def has_add_permission(self, request, obj=None):
+        # Credits are derived from the cast field
+        return False
+
+
 @admin.register(Movie)
 class MovieAdmin(admin.ModelAdmin):
-    list_display = ['title', 'genre', 'director', 'release_date', 'status', 'ticket_price', 'available_seats', 'rating']
+    list_display = ['title', 'genre', 'director', 'release_date', 'status', 'ticket_price', 'available_seats', 'rating', 'review_count']
     list_filter = ['status', 'genre', 'release_date']
-    search_fields = ['title', 'director', 'cast']
+    search_fields = ['title', 'director', '^credits__person__normalized_name']
     ordering = ['-release_date']
     list_editable = ['status', 'ticket_price', 'available_seats']
+    # Derived from the approved reviews
+    readonly_fields = ['rating', 'review_count']
+    inlines = [MovieCreditInline]
+    formfield_overrides = IMAGE_FIELD_OVERRIDES
+
+
+@admin.register(Person)
+class PersonAdmin(admin.ModelAdmin):
+    list_display = ['name', 'created_at']
+    search_fields = ['^normalized_name']
+    ordering = ['name']
+
+
+@admin.register(Showtime)
+class ShowtimeAdmin(admin.ModelAdmin):
+    list_display = ['movie', 'auditorium', 'start_time', 'capacity', 'available_seats']
+    list_filter = ['auditorium', 'start_time']
+    search_fields = ['movie__title', 'auditorium']
+    ordering = ['start_time']
+    
+    def get_readonly_fields(self, request, obj=None):
+        # The seat map is sized at creation, so capacity can't change afterwards
+        if obj:
+            return ['capacity']
+        return []
 
 
 @admin.register(Booking)
 class BookingAdmin(admin.ModelAdmin):
-    list_display = ['user', 'movie', 'show_date', 'show_time', 'number_of_seats', 'total_price', 'status', 'booking_date']
+    list_display = ['user', 'movie', 'showtime', 'show_date', 'show_time', 'number_of_seats', 'total_price', 'status', 'booking_date']
     list_filter = ['status', 'show_date', 'booking_date']
     search_fields = ['user__username', 'movie__title']
     ordering = ['-booking_date']
@@ -35,9 +77,26 @@ class ReviewAdmin(admin.ModelAdmin):
     ordering = ['-created_at']
 
 
+@admin.register(DailyMovieStat)
+class DailyMovieStatAdmin(admin.ModelAdmin):
+    list_display = ['date', 'movie', 'bookings', 'seats_sold', 'revenue', 'reviews']
+    list_filter = ['date', 'movie__genre']
+    search_fields = ['movie__title']
+    ordering = ['-date']
+    list_select_related = ['movie']
+    
+    def has_add_permission(self, request):
+        # Rows are maintained by signals and the rebuild_daily_stats command
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(SiteSetting)
 class SiteSettingAdmin(admin.ModelAdmin):
     list_display = ['site_name', 'site_email', 'enable_review', 'maintenance_mode', 'updated_at']
+    formfield_overrides = IMAGE_FIELD_OVERRIDES
     
     def has_add_permission(self, request):
         # Only allow one settings instance
@@ -46,3 +105,17 @@ class SiteSettingAdmin(admin.ModelAdmin):
     def has_delete_permission(self, request, obj=None):
         # Don't allow deletion of settings
         return False
+
+
+@admin.register(StoredFile)
+class StoredFileAdmin(admin.ModelAdmin):
+    list_display = ['name', 'references', 'updated_at']
+    search_fields = ['name']
+    ordering = ['name']
+    
+    def has_add_permission(self, request):
+        # Rows are maintained by signals and the collect_media_garbage command
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
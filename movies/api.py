@@ -0,0 +1,279 @@
+import base64
+import json
+from functools import wraps
+
+from django.core.exceptions import ValidationError
+from django.http import HttpResponse
+from django.views.decorators.http import require_safe
+
+from .models import Genre, Movie, Review, Showtime
+from .routers import read_from_replica
+from .storage import content_addressed_storage
+
+try:
+    import orjson
+except ImportError:  # Optional: the standard json module writes the same output, only slower
+    orjson = None
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 100  # Rows per page, and ids per batch fetch
+
+
+class ApiError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def clean_id(field, value, message, status=400):
+    """
+    `value` as an id for the integer `field`, or ApiError(message, status)
+
+    Rejects what int() would (including digits like '²' that pass
+    isdigit()) and ids outside the column's range, which the database
+    driver would otherwise fail on.
+    """
+    try:
+        return field.clean(value, None)
+    except ValidationError:
+        raise ApiError(message, status=status) from None
+
+
+def media_url(name):
+    return content_addressed_storage.url(name) if name else None
+
+
+class Resource:
+    """
+    A read-only API collection: its rows and the fields clients can select
+
+    FIELDS maps each public field name to the ORM lookup it is read from, or
+    to (lookup, convert) when the stored value needs converting for JSON.
+    Only the columns of the requested fields are selected, joins included,
+    so ?fields=id,title reads two columns. FILTERS maps query parameters to
+    ORM lookups (?movie=3).
+    """
+    FIELDS = {}
+    FILTERS = {}
+
+    def get_queryset(self):
+        raise NotImplementedError
+
+    def parse_fields(self, value):
+        """Field names requested with ?fields=a,b (all fields without it)"""
+        if not value:
+            return list(self.FIELDS)
+        names = list(dict.fromkeys(name.strip() for name in value.split(',') if name.strip()))
+        unknown = [name for name in names if name not in self.FIELDS]
+        if unknown:
+            raise ApiError(f'Unknown fields: {", ".join(unknown)}. Available: {", ".join(self.FIELDS)}')
+        return names
+
+    def filter(self, params):
+        queryset = self.get_queryset()
+        for param, lookup in self.FILTERS.items():
+            value = params.get(param)
+            if value is None:
+                continue
+            if lookup.endswith('_id'):
+                field = queryset.model._meta.get_field(lookup).target_field
+                value = clean_id(field, value, f'{param} must be an id')
+            queryset = queryset.filter(**{lookup: value})
+        return queryset
+
+    def read(self, queryset, names):
+        """(pk, row) for each row of `queryset`, a row holding the fields in `names`"""
+        specs = [spec if isinstance(spec, tuple) else (spec, None) for spec in (self.FIELDS[name] for name in names)]
+        converters = [(index, convert) for index, (_, convert) in enumerate(specs) if convert]
+        rows = []
+        for pk, *values in queryset.values_list('pk', *(lookup for lookup, _ in specs)):
+            for index, convert in converters:
+                if values[index] is not None:
+                    values[index] = convert(values[index])
+            rows.append((pk, dict(zip(names, values))))
+        return rows
+
+
+class MovieResource(Resource):
+    FIELDS = {
+        'id': 'id',
+        'title': 'title',
+        'description': 'description',
+        'genre': 'genre_id',
+        'genre_name': 'genre__name',
+        'director': 'director',
+        'cast': 'cast',
+        'duration': 'duration',
+        'release_date': 'release_date',
+        'status': 'status',
+        'rating': ('rating', float),
+        'review_count': 'review_count',
+        'ticket_price': ('ticket_price', str),  # Exact decimal, e.g. "12.50"
+        'available_seats': 'available_seats',
+        'poster': ('poster', media_url),
+        'trailer_url': 'trailer_url',
+        'updated_at': 'updated_at',
+    }
+    FILTERS = {'status': 'status', 'genre': 'genre_id'}
+
+    def get_queryset(self):
+        return Movie.objects.all()
+
+
+class GenreResource(Resource):
+    FIELDS = {
+        'id': 'id',
+        'name': 'name',
+        'description': 'description',
+    }
+
+    def get_queryset(self):
+        return Genre.objects.all()
+
+
+class ShowtimeResource(Resource):
+    FIELDS = {
+        'id': 'id',
+        'movie': 'movie_id',
+        'auditorium': 'auditorium',
+        'start_time': 'start_time',
+        'capacity': 'capacity',
+        'available_seats': 'available_seats',
+    }
+    FILTERS = {'movie': 'movie_id'}
+
+    def get_queryset(self):
+        return Showtime.objects.upcoming()
+
+
+class ReviewResource(Resource):
+    FIELDS = {
+        'id': 'id',
+        'movie': 'movie_id',
+        'user': 'user__username',
+        'rating': 'rating',
+        'comment': 'comment',
+        'created_at': 'created_at',
+    }
+    FILTERS = {'movie': 'movie_id'}
+
+    def get_queryset(self):
+        # Only approved reviews are public, whatever the approval setting
+        return Review.objects.filter(is_approved=True)
+
+
+RESOURCES = {
+    'movies': MovieResource(),
+    'genres': GenreResource(),
+    'showtimes': ShowtimeResource(),
+    'reviews': ReviewResource(),
+}
+
+
+def get_resource(name):
+    try:
+        return RESOURCES[name]
+    except KeyError:
+        raise ApiError('Not found', status=404) from None
+
+
+def encode_cursor(pk):
+    return base64.urlsafe_b64encode(str(pk).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, pk_field):
+    try:
+        value = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+    except ValueError:
+        raise ApiError('Invalid cursor') from None
+    return clean_id(pk_field, value, 'Invalid cursor')
+
+
+def parse_ids(value, pk_field):
+    ids = [pk for pk in value.split(',') if pk.strip()]
+    if len(ids) > MAX_LIMIT:
+        raise ApiError(f'At most {MAX_LIMIT} ids can be fetched at once')
+    return [clean_id(pk_field, pk, 'ids must be a comma-separated list of ids') for pk in ids]
+
+
+def parse_limit(value):
+    if value is None:
+        return DEFAULT_LIMIT
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = None
+    if limit is None or not 1 <= limit <= MAX_LIMIT:
+        raise ApiError(f'limit must be between 1 and {MAX_LIMIT}')
+    return limit
+
+
+def _json_default(value):
+    # Dates and datetimes as orjson writes them (ISO 8601)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def dumps(payload):
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, default=_json_default, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def api_response(payload, status=200):
+    return HttpResponse(dumps(payload), status=status, content_type='application/json')
+
+
+def api_view(view):
+    """Read-only JSON endpoint: GET/HEAD only, read from the replica, ApiError as a JSON error"""
+    @require_safe
+    @read_from_replica
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        try:
+            return view(request, *args, **kwargs)
+        except ApiError as error:
+            return api_response({'error': str(error)}, status=error.status)
+    return wrapper
+
+
+@api_view
+def resource_list(request, resource):
+    """
+    Rows of a collection, oldest first
+
+    ?fields=id,title selects fields, ?ids=3,1,2 fetches those rows (in that
+    order) in one request, and otherwise rows come in pages of ?limit= with
+    a cursor for the next one in "next" (?after=<cursor>).
+    """
+    resource = get_resource(resource)
+    fields = resource.parse_fields(request.GET.get('fields'))
+    queryset = resource.filter(request.GET)
+    pk_field = queryset.model._meta.pk
+
+    if 'ids' in request.GET:
+        ids = parse_ids(request.GET['ids'], pk_field)
+        rows = dict(resource.read(queryset.filter(pk__in=ids), fields))
+        return api_response({'data': [rows[pk] for pk in dict.fromkeys(ids) if pk in rows]})
+
+    limit = parse_limit(request.GET.get('limit'))
+    if request.GET.get('after'):
+        queryset = queryset.filter(pk__gt=decode_cursor(request.GET['after'], pk_field))
+    rows = resource.read(queryset.order_by('pk')[:limit + 1], fields)
+    next_cursor = encode_cursor(rows[limit - 1][0]) if len(rows) > limit else None
+    return api_response({'data': [row for _, row in rows[:limit]], 'next': next_cursor})
+
+
+@api_view
+def resource_detail(request, resource, pk):
+    """One row of a collection, with ?fields= like the list"""
+    resource = get_resource(resource)
+    fields = resource.parse_fields(request.GET.get('fields'))
+    queryset = resource.get_queryset()
+    # No row can have an id the column can't hold
+    pk = clean_id(queryset.model._meta.pk, pk, 'Not found', status=404)
+    rows = resource.read(queryset.filter(pk=pk), fields)
+    if not rows:
+        raise ApiError('Not found', status=404)
+    return api_response({'data': rows[0][1]})
@@ -0,0 +1,135 @@
+from asgiref.sync import sync_to_async
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import render, redirect, aget_object_or_404
+from .conditional import conditional_page
+from .dashboard import DashboardStats
+from .models import Movie, SiteSetting
+from .page_cache import cache_anonymous_page, tag_response
+from .pagination import apaginate
+from .routers import read_from_replica
+from .views import (
+    home_sections, home_page_tags, filter_catalog, movie_list_page_tags,
+    movie_detail_page_tags, movie_list_validators, movie_detail_validators,
+    recent_activity,
+)
+
+# Async versions of the catalog pages and the dashboard, served instead of
+# the ones in views.py when settings.ASYNC_VIEWS is on (as it is under
+# asgi.py). Queries are awaited one after another, as Django's async ORM
+# would run them on its shared worker thread anyway: the gain is that the
+# event loop serves other requests meanwhile, not parallel queries.
+# Templates are rendered in a worker thread once all data is loaded.
+
+_render = sync_to_async(render)
+
+
+async def _list(queryset):
+    return [obj async for obj in queryset]
+
+
+async def _featured_movie(sections):
+    return await sections['featured'].afirst() or await sections['featured_fallback'].afirst()
+
+
+# ==================== PUBLIC VIEWS ====================
+
+@cache_anonymous_page
+@read_from_replica
+async def home_view(request):
+    """
+    Home page - show featured movies
+    """
+    sections = home_sections()
+    
+    context = {
+        'featured_movie': await _featured_movie(sections),
+        'now_showing': await _list(sections['now_showing']),
+        'coming_soon': await _list(sections['coming_soon']),
+        'genres': await _list(sections['genres']),
+    }
+    
+    response = await _render(request, 'User/home.html', context)
+    
+    return tag_response(response, *home_page_tags(context))
+
+
+@conditional_page(movie_list_validators)
+@cache_anonymous_page
+@read_from_replica
+async def movie_list_view(request):
+    """
+    List all movies with search and filter
+    """
+    # The search form validates its genre against the database
+    movies, form, person, filtered_genres = await sync_to_async(filter_catalog)(request)
+    
+    page_obj = await apaginate(request, movies)
+    
+    context = {
+        'movies': page_obj,
+        'page_obj': page_obj,
+        'form': form,
+        'person': person,
+    }
+    
+    response = await _render(request, 'User/movie_list.html', context)
+    
+    return tag_response(response, *movie_list_page_tags(page_obj, filtered_genres))
+
+
+@conditional_page(movie_detail_validators)
+@cache_anonymous_page
+@read_from_replica
+async def movie_detail_view(request, movie_id):
+    """
+    Movie detail page with reviews
+    """
+    settings = await sync_to_async(SiteSetting.get_cached_settings)()
+    
+    movie = await aget_object_or_404(Movie.objects.select_related('genre').with_showtime_seats(), id=movie_id)
+    
+    reviews = movie.reviews.select_related('user').order_by('-created_at')
+    if settings.require_approval:
+        reviews = reviews.filter(is_approved=True)
+    reviews = await _list(reviews)
+    
+    credits = await _list(movie.credits.select_related('person'))
+    
+    # Average the reviews already fetched instead of running a separate aggregate
+    avg_rating = sum(review.rating for review in reviews) / len(reviews) if reviews else None
+    
+    context = {
+        'movie': movie,
+        'credits': credits,
+        'reviews': reviews,
+        'avg_rating': avg_rating,
+        'enable_review': settings.enable_review,
+    }
+    
+    response = await _render(request, 'User/movie_detail.html', context)
+    
+    return tag_response(response, *movie_detail_page_tags(movie))
+
+
+# ==================== ADMIN VIEWS ====================
+
+@login_required
+@read_from_replica
+async def admin_dashboard(request):
+    """
+    Admin dashboard - only accessible to admin users
+    """
+    # Hand the loaded user to the template too, instead of loading it again there
+    request.user = user = await request.auser()
+    if not user.is_admin():
+        messages.error(request, 'Access denied! Admin only.')
+        return redirect('home')
+    
+    stats = await DashboardStats().async_dashboard_context()
+    recent = {name: await _list(queryset) for name, queryset in recent_activity().items()}
+    
+    # The template embeds the chart data with json_script
+    context = {**stats, **recent}
+    
+    return await _render(request, 'Admin/dashboard.html', context)
@@ -0,0 +1,137 @@
+import re
+import threading
+import time
+import uuid
+from bisect import bisect_left, insort
+
+from django.core.cache import cache
+
+
+class SuggestionIndex:
+    """
+    In-memory typeahead index over now-showing movie titles, directors and cast
+
+    Suggestions live in a sorted array of (key, kind, label) tuples, with one
+    key per word start of the label ("tom hanks" and "hanks"), so a prefix
+    lookup is a bisect plus a short forward scan and never touches the
+    database. Movie saves update the array in place (see movies.signals).
+
+    Each worker process keeps its own copy. Writers publish a new version
+    token in the shared cache; other workers check it at most every
+    VERSION_CHECK_INTERVAL seconds and reload when it has changed.
+    """
+    VERSION_KEY = 'movies:autocomplete:version'
+    VERSION_CHECK_INTERVAL = 5
+    MIN_PREFIX = 2
+    LIMIT = 8
+
+    def __init__(self):
+        self._entries = []
+        self._labels = {}  # (kind, label) -> number of movies using it
+        self._movies = {}  # movie id -> set of (kind, label)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._version = None
+        self._checked_at = 0.0
+
+    @staticmethod
+    def movie_labels(title, director, cast):
+        labels = {('title', title.strip()), ('director', director.strip())}
+        labels.update(('cast', name.strip()) for name in cast.split(','))
+        return {(kind, label) for kind, label in labels if label}
+
+    @staticmethod
+    def keys(label):
+        words = label.casefold()
+        return {words[match.start():] for match in re.finditer(r'\w+', words)}
+
+    def _add_label(self, item):
+        count = self._labels.get(item, 0)
+        self._labels[item] = count + 1
+        if not count:
+            kind, label = item
+            for key in self.keys(label):
+                insort(self._entries, (key, kind, label))
+
+    def _remove_label(self, item):
+        count = self._labels.pop(item, 0) - 1
+        if count > 0:
+            self._labels[item] = count
+            return
+        kind, label = item
+        for key in self.keys(label):
+            index = bisect_left(self._entries, (key, kind, label))
+            if index < len(self._entries) and self._entries[index] == (key, kind, label):
+                del self._entries[index]
+
+    def _set_movie(self, movie_id, labels):
+        old = self._movies.pop(movie_id, set())
+        for item in old - labels:
+            self._remove_label(item)
+        for item in labels - old:
+            self._add_label(item)
+        if labels:
+            self._movies[movie_id] = labels
+
+    def load(self):
+        """(Re)build the whole index from the database"""
+        from .models import Movie
+
+        version = cache.get(self.VERSION_KEY)
+        rows = Movie.objects.filter(status='now_showing').values_list('id', 'title', 'director', 'cast')
+        with self._lock:
+            self._entries, self._labels, self._movies = [], {}, {}
+            for movie_id, title, director, cast in rows:
+                self._set_movie(movie_id, self.movie_labels(title, director, cast))
+            self._loaded = True
+            self._version = version
+            self._checked_at = time.monotonic()
+
+    def update_movie(self, movie):
+        """Apply one movie's current state (a no-op until the index is first used)"""
+        labels = set()
+        if movie.status == 'now_showing':
+            labels = self.movie_labels(movie.title, movie.director, movie.cast)
+        self._apply(movie.pk, labels)
+
+    def remove_movie(self, movie_id):
+        self._apply(movie_id, set())
+
+    def _apply(self, movie_id, labels):
+        version = uuid.uuid4().hex
+        cache.set(self.VERSION_KEY, version, None)
+        with self._lock:
+            if self._loaded:
+                self._set_movie(movie_id, labels)
+                self._version = version
+
+    def _ensure_current(self):
+        now = time.monotonic()
+        if self._loaded and now - self._checked_at < self.VERSION_CHECK_INTERVAL:
+            return
+        self._checked_at = now
+        if not self._loaded or cache.get(self.VERSION_KEY) != self._version:
+            self.load()
+
+    def suggest(self, prefix, limit=LIMIT):
+        """Up to `limit` (kind, label) pairs with a word starting with `prefix`"""
+        prefix = prefix.strip().casefold()
+        if len(prefix) < self.MIN_PREFIX:
+            return []
+        self._ensure_current()
+        entries = self._entries
+        results = []
+        seen = set()
+        index = bisect_left(entries, (prefix,))
+        while index < len(entries) and len(results) < limit:
+            key, kind, label = entries[index]
+            if not key.startswith(prefix):
+                break
+            if (kind, label) not in seen:
+                seen.add((kind, label))
+                results.append((kind, label))
+            index += 1
+        return results
+
+
+suggestion_index = SuggestionIndex()
@@ -0,0 +1,106 @@
+import hashlib
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+
+from django.contrib.messages import get_messages
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+from .models import SiteSetting
+
+
+def latest(*moments):
+    """The most recent of some modification times, ignoring None"""
+    return max((moment for moment in moments if moment), default=None)
+
+
+def _page_validators(request, state, last_modified):
+    """
+    ETag and Last-Modified (a timestamp) of a page
+
+    Besides its own `state` every page renders the site settings and the
+    visitor: the logged-in user, or the CSRF token in the login modals.
+    """
+    site_settings = SiteSetting.get_cached_settings()
+    user = request.user
+    visitor = (user.pk, user.updated_at) if user.is_authenticated else None
+    # The CSRF secret the response will carry, including a new one made while rendering
+    csrf_secret = request.META.get('CSRF_COOKIE')
+    digest = hashlib.md5(repr((state, site_settings.updated_at, visitor, csrf_secret)).encode()).hexdigest()
+    last_modified = latest(last_modified, site_settings.updated_at, visitor and visitor[1])
+    # Weak: every render masks the CSRF token differently
+    return f'W/"{digest}"', last_modified and int(last_modified.timestamp())
+
+
+def _is_conditional(request):
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    # Pending flash messages are rendered into (and consumed by) the page
+    return not len(get_messages(request))
+
+
+def _check(request, validators, args, kwargs):
+    """(page_state, response); the response is a 304 when the client's copy is current"""
+    if not _is_conditional(request):
+        return None, None
+    page_state = validators(request, *args, **kwargs)
+    if page_state is None:
+        # e.g. the movie doesn't exist; the view renders the error
+        return None, None
+    etag, last_modified = _page_validators(request, *page_state)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        _add_headers(request, response, page_state)
+    return page_state, response
+
+
+def _add_headers(request, response, page_state):
+    if response.status_code not in (200, 304):
+        return
+    etag, last_modified = _page_validators(request, *page_state)
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified)
+    # Browsers revalidate every time instead of guessing a freshness lifetime
+    # from Last-Modified; the validators depend on the session and CSRF cookies
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ['Cookie'])
+
+
+def conditional_page(validators):
+    """
+    Answer GET requests for a page the client already has with 304 Not Modified
+
+    `validators(request, *args, **kwargs)` returns (state, last_modified) for
+    the page the view would render, or None to skip the check: `state` is
+    anything that changes whenever the page would (timestamps, counts) and
+    only goes into the ETag hash. It should cost one small query; the view,
+    and the page cache around it, only run when the client's ETag (or,
+    without one, its Last-Modified date) no longer matches. Apply it outside
+    cache_anonymous_page. Works for sync and async views.
+    """
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                page_state, response = await sync_to_async(_check)(request, validators, args, kwargs)
+                if response is not None:
+                    return response
+                response = await view(request, *args, **kwargs)
+                if page_state:
+                    await sync_to_async(_add_headers)(request, response, page_state)
+                return response
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            page_state, response = _check(request, validators, args, kwargs)
+            if response is not None:
+                return response
+            response = view(request, *args, **kwargs)
+            if page_state:
+                _add_headers(request, response, page_state)
+            return response
+        return wrapper
+    return decorator
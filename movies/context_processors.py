@@ -5,7 +5,7 @@ def site_settings(request):
     """
     Context processor to make site settings available in all templates
     """
-    settings = SiteSetting.get_settings()
+    settings = SiteSetting.get_cached_settings()
     return {
         'site_settings': settings,
     }
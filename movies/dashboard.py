@@ -0,0 +1,150 @@
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from accounts.models import Account
+from .models import Movie, Genre, Booking, DailyMovieStat
+
+
+def growth_percent(current, previous):
+    """Percentage change from previous to current (0 when there is no baseline)"""
+    if previous > 0:
+        return round((current - previous) / previous * 100, 1)
+    return 0
+
+
+class DashboardStats:
+    """
+    Statistics for the admin dashboard, computed with grouped aggregates
+
+    Movies and users are read by one conditional-count aggregate each.
+    Booking and review figures (totals, growth, rating buckets and the
+    monthly chart) come from the DailyMovieStat rollup, one row per movie
+    per day, so the dashboard never scans the bookings and reviews tables.
+    """
+    GROWTH_WINDOW = timedelta(days=30)
+    ACTIVITY_MONTHS = 6
+
+    def __init__(self, now=None):
+        self.now = now or timezone.now()
+        self.window_start = self.now - self.GROWTH_WINDOW
+        self.previous_window_start = self.window_start - self.GROWTH_WINDOW
+
+    def _window_counts(self, field):
+        """Conditional counts for the current and previous growth windows"""
+        return {
+            'this_month': Count('id', filter=Q(**{f'{field}__gte': self.window_start})),
+            'last_month': Count('id', filter=Q(**{
+                f'{field}__gte': self.previous_window_start,
+                f'{field}__lt': self.window_start,
+            })),
+        }
+
+    def movie_counts(self):
+        return Movie.objects.aggregate(total=Count('id'), **self._window_counts('created_at'))
+
+    def user_counts(self):
+        return Account.objects.filter(role='user').aggregate(total=Count('id'), **self._window_counts('created_at'))
+
+    def activity_counts(self):
+        """Booking and review totals, review growth windows and rating buckets from the daily rollup"""
+        window = timezone.localdate(self.window_start)
+        previous_window = timezone.localdate(self.previous_window_start)
+        ratings = {field: Sum(field) for field in DailyMovieStat.RATING_FIELDS}
+        counts = DailyMovieStat.objects.aggregate(
+            total_bookings=Sum('bookings'),
+            total_reviews=Sum('reviews'),
+            reviews_this_month=Sum('reviews', filter=Q(date__gte=window)),
+            reviews_last_month=Sum('reviews', filter=Q(date__gte=previous_window, date__lt=window)),
+            **ratings,
+        )
+        return {key: value or 0 for key, value in counts.items()}
+
+    def totals(self):
+        """Headline counts used by the dashboard and the admin profile"""
+        activity = DailyMovieStat.objects.aggregate(total_bookings=Sum('bookings'), total_reviews=Sum('reviews'))
+        return {
+            'total_movies': Movie.objects.count(),
+            'total_users': Account.objects.filter(role='user').count(),
+            'total_bookings': activity['total_bookings'] or 0,
+            'total_reviews': activity['total_reviews'] or 0,
+        }
+
+    def activity_months(self):
+        """Start of each of the last ACTIVITY_MONTHS calendar months, oldest first"""
+        month = timezone.localtime(self.now).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        months = [month]
+        for _ in range(self.ACTIVITY_MONTHS - 1):
+            month = (month - timedelta(days=1)).replace(day=1)
+            months.append(month)
+        return months[::-1]
+
+    def monthly_activity(self):
+        months = self.activity_months()
+        rows = (
+            DailyMovieStat.objects.filter(date__gte=months[0].date())
+            .annotate(month=TruncMonth('date'))
+            .values('month')
+            .annotate(total_bookings=Sum('bookings'), total_reviews=Sum('reviews'))
+            .order_by()
+        )
+        activity = {(row['month'].year, row['month'].month): row for row in rows}
+        empty = {'total_bookings': 0, 'total_reviews': 0}
+        return [
+            {
+                'month': month.strftime('%b'),
+                'bookings': activity.get((month.year, month.month), empty)['total_bookings'],
+                'reviews': activity.get((month.year, month.month), empty)['total_reviews'],
+            }
+            for month in months
+        ]
+
+    def movies_by_genre(self):
+        genres = (
+            Genre.objects.annotate(count=Count('movies'))
+            .filter(count__gt=0)
+            .values('name', 'count')
+        )
+        return [{'genre': genre['name'], 'count': genre['count']} for genre in genres]
+
+    def pending_bookings(self):
+        return Booking.objects.filter(status='pending').count()
+
+    def as_context(self):
+        """Everything the dashboard template needs, apart from the recent-items lists"""
+        movies = self.movie_counts()
+        users = self.user_counts()
+        activity = self.activity_counts()
+        return {
+            'total_movies': movies['total'],
+            'total_users': users['total'],
+            'total_bookings': activity['total_bookings'],
+            'total_reviews': activity['total_reviews'],
+            'pending_bookings': self.pending_bookings(),
+            'movies_growth': growth_percent(movies['this_month'], movies['last_month']),
+            'users_growth': growth_percent(users['this_month'], users['last_month']),
+            'reviews_growth': growth_percent(activity['reviews_this_month'], activity['reviews_last_month']),
+            'monthly_activity': self.monthly_activity(),
+            'movies_by_genre': self.movies_by_genre(),
+            'rating_distribution': [
+                {
+                    'rating': f'{rating} Star{"s" if rating > 1 else ""}',
+                    'count': activity[f'rating_{rating}'],
+                }
+                for rating in range(1, 6)
+            ],
+        }
+
+    async def async_dashboard_context(self):
+        """
+        as_context() for async views
+
+        Runs every query in one trip to the ORM's worker thread. The async
+        ORM executes a request's queries one after another on that thread
+        anyway, so gathering them would only add thread hops.
+        """
+        return await sync_to_async(self.as_context)()
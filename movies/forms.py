@@ -1,5 +1,8 @@
 from django import forms
-from .models import Movie, Genre, Booking, Review
+from django.utils import timezone
+from django.urls import reverse_lazy
+from .models import Movie, Genre, Booking, Review, Showtime
+from .uploads import HeaderValidatedImageField
 
 
 class MovieForm(forms.ModelForm):
@@ -9,8 +12,9 @@ class MovieForm(forms.ModelForm):
     class Meta:
         model = Movie
         fields = ['title', 'description', 'genre', 'duration', 'release_date', 
-                  'director', 'cast', 'poster', 'trailer_url', 'rating', 
+                  'director', 'cast', 'poster', 'trailer_url', 
                   'status', 'ticket_price', 'available_seats']
+        field_classes = {'poster': HeaderValidatedImageField}
         widgets = {
             'title': forms.TextInput(attrs={
                 'class': 'form-control',
@@ -48,12 +52,6 @@ class MovieForm(forms.ModelForm):
                 'class': 'form-control',
                 'placeholder': 'Enter trailer URL'
             }),
-            'rating': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'step': '0.1',
-                'min': '0',
-                'max': '10'
-            }),
             'status': forms.Select(attrs={
                 'class': 'form-control'
             }),
@@ -92,11 +90,17 @@ class GenreForm(forms.ModelForm):
 class BookingForm(forms.ModelForm):
     """
     Form for booking movie tickets
+    
+    When the movie has upcoming showtimes the user picks one of them and the
+    show date/time come from it; otherwise the date and time are entered freely.
     """
     class Meta:
         model = Booking
-        fields = ['show_date', 'show_time', 'number_of_seats', 'payment_method']
+        fields = ['showtime', 'show_date', 'show_time', 'number_of_seats', 'payment_method']
         widgets = {
+            'showtime': forms.Select(attrs={
+                'class': 'form-control'
+            }),
             'show_date': forms.DateInput(attrs={
                 'class': 'form-control',
                 'type': 'date'
@@ -115,6 +119,27 @@ class BookingForm(forms.ModelForm):
                 'placeholder': 'Enter payment method (e.g., Credit Card, Cash)'
             }),
         }
+    
+    def __init__(self, *args, movie=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        showtimes = movie.showtimes.bookable() if movie is not None else Showtime.objects.none()
+        if showtimes.exists():
+            self.fields['showtime'].queryset = showtimes
+            self.fields['showtime'].required = True
+            self.fields['showtime'].empty_label = 'Select a showtime'
+            del self.fields['show_date']
+            del self.fields['show_time']
+        else:
+            del self.fields['showtime']
+    
+    def clean(self):
+        cleaned_data = super().clean()
+        showtime = cleaned_data.get('showtime')
+        if showtime:
+            start = timezone.localtime(showtime.start_time)
+            self.instance.show_date = start.date()
+            self.instance.show_time = start.time()
+        return cleaned_data
 
 
 class ReviewForm(forms.ModelForm):
@@ -156,7 +181,9 @@ class MovieSearchForm(forms.Form):
     """
     search = forms.CharField(required=False, max_length=200, widget=forms.TextInput(attrs={
         'class': 'form-control',
-        'placeholder': 'Search by title, director, or cast...'
+        'placeholder': 'Search by title, director, or cast...',
+        'autocomplete': 'off',
+        'data-autocomplete-url': reverse_lazy('movie_autocomplete'),
     }))
     genre = forms.ModelChoiceField(
         queryset=Genre.objects.all(),
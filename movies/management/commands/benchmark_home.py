@@ -0,0 +1,131 @@
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import AsyncClient, Client
+
+MODES = ('wsgi', 'asgi')
+
+
+class Command(BaseCommand):
+    help = 'Compare home page latency under concurrent load between the sync (WSGI) and async (ASGI) views'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Requests per mode (default: 200)')
+        parser.add_argument('--concurrency', type=int, default=20, help='Requests in flight at once (default: 20)')
+        parser.add_argument('--path', default='/', help='Page to request (default: /)')
+        # Internal: each mode runs in its own process, since urls.py picks
+        # the sync or async views once at import time
+        parser.add_argument('--mode', choices=MODES, help='Benchmark a single mode and print the results as JSON')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1 or options['concurrency'] < 1:
+            raise CommandError('--requests and --concurrency must be at least 1')
+        
+        if options['mode']:
+            timings, elapsed = self.run_mode(options)
+            self.stdout.write(json.dumps({'timings': timings, 'elapsed': elapsed}))
+            return
+        
+        self.stdout.write(self.style.WARNING(
+            f"Requesting {options['path']} {options['requests']} times per mode, "
+            f"{options['concurrency']} at a time (page cache off)..."
+        ))
+        
+        for mode in MODES:
+            timings, elapsed = self.run_subprocess(mode, options)
+            latencies = [timing * 1000 for timing in timings]
+            percentiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+            self.stdout.write(
+                f'  {mode.upper()}: mean {statistics.mean(latencies):.1f} ms, '
+                f'p50 {percentiles[49]:.1f} ms, p95 {percentiles[94]:.1f} ms, '
+                f'{len(timings) / elapsed:.0f} req/s'
+            )
+        
+        self.stdout.write(self.style.SUCCESS('\n✓ Benchmark finished!'))
+
+    def run_subprocess(self, mode, options):
+        env = dict(
+            os.environ,
+            DJANGO_ASYNC_VIEWS='1' if mode == 'asgi' else '0',
+            DJANGO_PAGE_CACHE='0',
+        )
+        result = subprocess.run(
+            [
+                sys.executable, str(settings.BASE_DIR / 'manage.py'), 'benchmark_home',
+                '--mode', mode,
+                '--requests', str(options['requests']),
+                '--concurrency', str(options['concurrency']),
+                '--path', options['path'],
+            ],
+            env=env, capture_output=True, text=True,
+        )
+        if result.returncode:
+            raise CommandError(f'{mode} benchmark failed:\n{result.stderr}')
+        output = json.loads(result.stdout.strip().splitlines()[-1])
+        return output['timings'], output['elapsed']
+
+    def run_mode(self, options):
+        # Requests come from the test clients, as under the test runner
+        settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, 'testserver']
+        if options['mode'] == 'asgi':
+            return asyncio.run(self.run_asgi(options))
+        return self.run_wsgi(options)
+
+    def run_wsgi(self, options):
+        local = threading.local()
+        
+        def timed_request(_):
+            if not hasattr(local, 'client'):
+                local.client = Client()
+            started = time.perf_counter()
+            response = local.client.get(options['path'])
+            timing = time.perf_counter() - started
+            check_response(response, options['path'])
+            return timing
+        
+        def close_connections(_):
+            connections.close_all()
+        
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            # Warm up every worker thread (connection, templates) before timing
+            list(pool.map(timed_request, range(options['concurrency'])))
+            started = time.perf_counter()
+            timings = list(pool.map(timed_request, range(options['requests'])))
+            elapsed = time.perf_counter() - started
+            list(pool.map(close_connections, range(options['concurrency'])))
+        
+        return timings, elapsed
+
+    async def run_asgi(self, options):
+        client = AsyncClient()
+        slots = asyncio.Semaphore(options['concurrency'])
+        
+        async def timed_request():
+            async with slots:
+                started = time.perf_counter()
+                response = await client.get(options['path'])
+                timing = time.perf_counter() - started
+            check_response(response, options['path'])
+            return timing
+        
+        await asyncio.gather(*(timed_request() for _ in range(options['concurrency'])))
+        started = time.perf_counter()
+        timings = await asyncio.gather(*(timed_request() for _ in range(options['requests'])))
+        elapsed = time.perf_counter() - started
+        
+        return timings, elapsed
+
+
+def check_response(response, path):
+    if response.status_code != 200:
+        raise CommandError(f'Got HTTP {response.status_code} from {path}')
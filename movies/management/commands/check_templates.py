@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+from movies.template_bundle import template_names, warm_up_template
+
+
+class Command(BaseCommand):
+    help = 'Compile and render every project template once to validate it and warm the template cache'
+
+    def handle(self, *args, **options):
+        names = template_names()
+        failed = 0
+        
+        self.stdout.write(self.style.WARNING(f'Checking {len(names)} templates...'))
+        
+        for name in names:
+            try:
+                warm_up_template(name)
+            except Exception as error:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f'✗ {name}: {type(error).__name__}: {error}'))
+            else:
+                self.stdout.write(f'  {name}')
+        
+        if failed:
+            raise CommandError(f'{failed} of {len(names)} templates failed to render')
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'\n✓ Checked {len(names)} templates successfully!')
+        )
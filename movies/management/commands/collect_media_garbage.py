@@ -0,0 +1,99 @@
+import datetime
+import posixpath
+import re
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from movies.models import Movie, StoredFile
+from movies.storage import content_addressed_storage, is_content_addressed
+
+# Poster variants are named after their poster: "<stem>.240w.webp"
+VARIANT_NAME = re.compile(r'^(?P<stem>.+)\.\d+w\.[a-z]+$')
+
+
+class Command(BaseCommand):
+    help = 'Delete poster and logo files that no movie or site setting uses anymore'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--grace', type=int, default=60,
+            help='Keep unused files modified within this many minutes, as a save may still be using them (default: 60)',
+        )
+        parser.add_argument(
+            '--rehash', action='store_true',
+            help='First move files stored before content addressing to their content-hash names, merging duplicates',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Report what would be deleted without deleting it')
+
+    def handle(self, *args, **options):
+        storage = content_addressed_storage
+
+        if options['rehash'] and not options['dry_run']:
+            self.rehash_files(storage)
+
+        self.stdout.write(self.style.WARNING('Counting file references...'))
+        referenced = StoredFile.recount()
+        live_stems = {posixpath.splitext(name)[0] for name in referenced}
+        cutoff = timezone.now() - datetime.timedelta(minutes=options['grace'])
+
+        deleted = freed = 0
+        for directory in self.directories():
+            try:
+                _, filenames = storage.listdir(directory)
+            except FileNotFoundError:
+                continue
+            for filename in filenames:
+                name = posixpath.join(directory, filename)
+                variant = VARIANT_NAME.match(name)
+                if name in referenced or (variant and variant['stem'] in live_stems):
+                    continue
+                if storage.get_modified_time(name) > cutoff:
+                    continue
+                size = storage.size(name)
+                if not options['dry_run']:
+                    storage.delete(name)
+                deleted += 1
+                freed += size
+                self.stdout.write(f'  {name} ({size // 1024} KB)')
+
+        if not options['dry_run']:
+            StoredFile.objects.filter(references=0, updated_at__lt=cutoff).delete()
+
+        action = 'Would delete' if options['dry_run'] else 'Deleted'
+        self.stdout.write(
+            self.style.SUCCESS(f'\n✓ {action} {deleted} unused files ({freed // 1024} KB) successfully!')
+        )
+
+    def directories(self):
+        """Upload directories of the content-addressed image fields"""
+        return sorted({
+            model._meta.get_field(field_name).upload_to.rstrip('/')
+            for model, field_name in StoredFile.file_fields()
+        })
+
+    def rehash_files(self, storage):
+        """Store each pre-content-addressing file under its hash and point its rows at it"""
+        rows_by_name = defaultdict(list)
+        for model, field_name in StoredFile.file_fields():
+            for instance in model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True}):
+                name = getattr(instance, field_name).name
+                if not is_content_addressed(name):
+                    rows_by_name[name].append((instance, field_name))
+
+        self.stdout.write(self.style.WARNING(f'Rehashing {len(rows_by_name)} files...'))
+
+        for name, rows in rows_by_name.items():
+            try:
+                with storage.open(name) as content:
+                    new_name = storage.save(name, content)
+            except FileNotFoundError:
+                self.stdout.write(self.style.ERROR(f'✗ {name}: file is missing'))
+                continue
+            self.stdout.write(f'  {name} -> {new_name}')
+            for instance, field_name in rows:
+                getattr(instance, field_name).name = new_name
+                instance.save(update_fields=[field_name])
+                if isinstance(instance, Movie):
+                    # Variants are named after the poster
+                    instance.generate_poster_variants()
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from movies.models import Movie
+
+
+class Command(BaseCommand):
+    help = 'Generate the resized poster copies served through srcset for posters that have none yet'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Regenerate the variants of every poster')
+
+    def handle(self, *args, **options):
+        movies = Movie.objects.exclude(poster='').exclude(poster__isnull=True).order_by('pk')
+        if not options['all']:
+            movies = movies.filter(poster_width__isnull=True)
+        
+        self.stdout.write(self.style.WARNING(f'Generating variants for {movies.count()} posters...'))
+        
+        generated = failed = 0
+        for movie in movies.iterator():
+            try:
+                movie.generate_poster_variants()
+            except (OSError, ValueError) as error:
+                # Missing or unreadable file; the page keeps using the original
+                failed += 1
+                self.stdout.write(self.style.ERROR(f'✗ {movie.poster.name}: {error}'))
+            else:
+                generated += 1
+                widths = ', '.join(str(width) for width in movie.poster_variants or []) or 'none needed'
+                self.stdout.write(f'  {movie.poster.name}: {widths}')
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'\n✓ Generated variants for {generated} posters successfully!')
+        )
+        if failed:
+            self.stdout.write(self.style.WARNING(f'{failed} posters could not be read'))
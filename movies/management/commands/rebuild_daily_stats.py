@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from movies.models import DailyMovieStat
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the daily movie rollup used by the dashboard from the bookings and reviews tables'
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.WARNING('Rebuilding daily movie stats...'))
+        
+        rows = DailyMovieStat.rebuild()
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'✓ Rebuilt {rows} daily stat rows successfully!')
+        )
@@ -3,31 +3,32 @@ from movies.models import Movie
 
 
 class Command(BaseCommand):
-    help = 'Update all movie ratings based on approved reviews'
+    help = 'Reconcile the denormalized review count and rating of every movie with its approved reviews'
 
     def handle(self, *args, **options):
         movies = Movie.objects.all()
         updated_count = 0
         
-        self.stdout.write(self.style.WARNING(f'Updating ratings for {movies.count()} movies...'))
+        self.stdout.write(self.style.WARNING(f'Reconciling ratings for {movies.count()} movies...'))
         
         for movie in movies:
-            old_rating = movie.rating
+            old_state = (movie.review_count, movie.rating_sum, float(movie.rating))
             movie.update_rating()
-            new_rating = movie.rating
+            new_state = (movie.review_count, movie.rating_sum, float(movie.rating))
             
-            if old_rating != new_rating:
+            if old_state != new_state:
                 updated_count += 1
                 self.stdout.write(
                     self.style.SUCCESS(
-                        f'✓ {movie.title}: {old_rating} → {new_rating} ({movie.get_review_count()} reviews)'
+                        f'✓ {movie.title}: {old_state[2]} → {movie.rating} '
+                        f'({old_state[0]} → {movie.review_count} reviews)'
                     )
                 )
             else:
                 self.stdout.write(
-                    f'  {movie.title}: {new_rating} (unchanged, {movie.get_review_count()} reviews)'
+                    f'  {movie.title}: {movie.rating} (unchanged, {movie.review_count} reviews)'
                 )
         
         self.stdout.write(
-            self.style.SUCCESS(f'\n✓ Updated {updated_count} movie ratings successfully!')
+            self.style.SUCCESS(f'\n✓ Reconciled {updated_count} movie ratings successfully!')
         )
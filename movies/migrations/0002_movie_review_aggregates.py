@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:45
+
+from django.db import migrations, models
+
+
+def backfill_review_aggregates(apps, schema_editor):
+    Movie = apps.get_model('movies', 'Movie')
+    Review = apps.get_model('movies', 'Review')
+    totals = (
+        Review.objects.filter(is_approved=True)
+        .values('movie_id')
+        .annotate(count=models.Count('id'), total=models.Sum('rating'))
+    )
+    for row in totals:
+        Movie.objects.filter(pk=row['movie_id']).update(
+            review_count=row['count'],
+            rating_sum=row['total'] or 0,
+        )
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='rating_sum',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='review_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_review_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:53
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0002_movie_review_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='seat_numbers',
+            field=models.CharField(blank=True, help_text='Comma-separated seat numbers', max_length=500),
+        ),
+        migrations.CreateModel(
+            name='Showtime',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('auditorium', models.CharField(max_length=50)),
+                ('start_time', models.DateTimeField()),
+                ('capacity', models.PositiveIntegerField(default=100, validators=[django.core.validators.MinValueValidator(1)])),
+                ('available_seats', models.IntegerField(editable=False)),
+                ('seat_map', models.BinaryField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('movie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='showtimes', to='movies.movie')),
+            ],
+            options={
+                'verbose_name': 'Showtime',
+                'verbose_name_plural': 'Showtimes',
+                'db_table': 'showtimes',
+                'ordering': ['start_time'],
+                'unique_together': {('auditorium', 'start_time')},
+            },
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='showtime',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='bookings', to='movies.showtime'),
+        ),
+    ]
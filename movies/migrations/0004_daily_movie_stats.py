@@ -0,0 +1,91 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def backfill_daily_stats(apps, schema_editor):
+    """
+    Fill the new table from the existing bookings and reviews
+
+    A deliberate frozen copy of DailyMovieStat.rebuild() as of this migration,
+    run against the historical models. Later changes to the rollup belong in
+    rebuild() (and `manage.py rebuild_daily_stats`), not here.
+    """
+    Booking = apps.get_model('movies', 'Booking')
+    Review = apps.get_model('movies', 'Review')
+    DailyMovieStat = apps.get_model('movies', 'DailyMovieStat')
+    rows = {}
+
+    def row(entry):
+        key = (entry['day'], entry['movie_id'])
+        if key not in rows:
+            rows[key] = DailyMovieStat(date=entry['day'], movie_id=entry['movie_id'])
+        return rows[key]
+
+    sold = ~models.Q(status='cancelled')
+    bookings = (
+        Booking.objects.annotate(day=TruncDate('booking_date'))
+        .values('day', 'movie_id')
+        .annotate(
+            count=models.Count('id'),
+            seats=models.Sum('number_of_seats', filter=sold),
+            revenue=models.Sum('total_price', filter=sold),
+        )
+        .order_by()
+    )
+    for entry in bookings:
+        stat = row(entry)
+        stat.bookings = entry['count']
+        stat.seats_sold = entry['seats'] or 0
+        stat.revenue = entry['revenue'] or 0
+
+    ratings = {f'rating_{rating}': models.Count('id', filter=models.Q(rating=rating)) for rating in range(1, 6)}
+    reviews = (
+        Review.objects.annotate(day=TruncDate('created_at'))
+        .values('day', 'movie_id')
+        .annotate(count=models.Count('id'), **ratings)
+        .order_by()
+    )
+    for entry in reviews:
+        stat = row(entry)
+        stat.reviews = entry['count']
+        for field in ratings:
+            setattr(stat, field, entry[field])
+
+    DailyMovieStat.objects.bulk_create(rows.values(), batch_size=500)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0003_showtime'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyMovieStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('bookings', models.IntegerField(default=0)),
+                ('seats_sold', models.IntegerField(default=0, help_text='Seats in bookings that are not cancelled')),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('reviews', models.IntegerField(default=0)),
+                ('rating_1', models.IntegerField(default=0)),
+                ('rating_2', models.IntegerField(default=0)),
+                ('rating_3', models.IntegerField(default=0)),
+                ('rating_4', models.IntegerField(default=0)),
+                ('rating_5', models.IntegerField(default=0)),
+                ('movie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='movies.movie')),
+            ],
+            options={
+                'verbose_name': 'Daily Movie Stat',
+                'verbose_name_plural': 'Daily Movie Stats',
+                'db_table': 'daily_movie_stats',
+                'ordering': ['-date'],
+                'unique_together': {('date', 'movie')},
+            },
+        ),
+        migrations.RunPython(backfill_daily_stats, migrations.RunPython.noop),
+    ]
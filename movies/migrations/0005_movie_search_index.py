@@ -0,0 +1,84 @@
+from django.db import migrations
+
+
+# Frozen as of this migration; SQLiteSearchBackend.TRIGGERS holds the live
+# trigger definitions that repair_index() restores.
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE movies_fts USING fts5(
+        title, director, "cast", description,
+        content='movies', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER movies_fts_insert AFTER INSERT ON movies BEGIN
+        INSERT INTO movies_fts(rowid, title, director, "cast", description)
+        VALUES (new.id, new.title, new.director, new."cast", new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER movies_fts_delete AFTER DELETE ON movies BEGIN
+        INSERT INTO movies_fts(movies_fts, rowid, title, director, "cast", description)
+        VALUES ('delete', old.id, old.title, old.director, old."cast", old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER movies_fts_update AFTER UPDATE OF title, director, "cast", description ON movies BEGIN
+        INSERT INTO movies_fts(movies_fts, rowid, title, director, "cast", description)
+        VALUES ('delete', old.id, old.title, old.director, old."cast", old.description);
+        INSERT INTO movies_fts(rowid, title, director, "cast", description)
+        VALUES (new.id, new.title, new.director, new."cast", new.description);
+    END
+    """,
+    "INSERT INTO movies_fts(movies_fts) VALUES ('rebuild')",
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS movies_fts_update",
+    "DROP TRIGGER IF EXISTS movies_fts_delete",
+    "DROP TRIGGER IF EXISTS movies_fts_insert",
+    "DROP TABLE IF EXISTS movies_fts",
+]
+
+POSTGRESQL_FORWARD = [
+    """
+    ALTER TABLE movies ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(director, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce("cast", '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'D')
+    ) STORED
+    """,
+    "CREATE INDEX movies_search_vector_idx ON movies USING GIN (search_vector)",
+]
+
+POSTGRESQL_REVERSE = [
+    "DROP INDEX IF EXISTS movies_search_vector_idx",
+    "ALTER TABLE movies DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+    """
+    Full-text index behind movies.search (FTS5 on SQLite, tsvector on
+    PostgreSQL). Other databases fall back to unindexed icontains search.
+    """
+
+    dependencies = [
+        ('movies', '0004_daily_movie_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRESQL_FORWARD}),
+            run_for_vendor({'sqlite': SQLITE_REVERSE, 'postgresql': POSTGRESQL_REVERSE}),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def normalize(name):
+    return ' '.join(name.split()).casefold()[:200]
+
+
+def backfill_credits(apps, schema_editor):
+    Movie = apps.get_model('movies', 'Movie')
+    Person = apps.get_model('movies', 'Person')
+    MovieCredit = apps.get_model('movies', 'MovieCredit')
+    people = {}
+    credits = []
+    for movie_id, cast in Movie.objects.values_list('id', 'cast'):
+        seen = set()
+        for name in cast.split(','):
+            name = ' '.join(name.split())[:200]
+            key = normalize(name)
+            if not name or key in seen:
+                continue
+            seen.add(key)
+            if key not in people:
+                people[key] = Person.objects.create(name=name, normalized_name=key)
+            credits.append(MovieCredit(movie_id=movie_id, person=people[key], order=len(seen) - 1))
+    MovieCredit.objects.bulk_create(credits, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0005_movie_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Person',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('normalized_name', models.CharField(editable=False, max_length=200, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Person',
+                'verbose_name_plural': 'People',
+                'db_table': 'people',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='MovieCredit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('order', models.PositiveSmallIntegerField(default=0, help_text='Billing order within the cast')),
+                ('movie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='credits', to='movies.movie')),
+                ('person', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='credits', to='movies.person')),
+            ],
+            options={
+                'verbose_name': 'Movie Credit',
+                'verbose_name_plural': 'Movie Credits',
+                'db_table': 'movie_credits',
+                'ordering': ['order'],
+                'unique_together': {('movie', 'person')},
+            },
+        ),
+        migrations.RunPython(backfill_credits, migrations.RunPython.noop),
+    ]
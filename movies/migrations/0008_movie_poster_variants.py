@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0007_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='poster_variants',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='poster_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+    ]
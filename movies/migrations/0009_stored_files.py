@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:35
+
+from collections import Counter
+
+import movies.storage
+from django.db import migrations, models
+
+
+def count_references(apps, schema_editor):
+    StoredFile = apps.get_model('movies', 'StoredFile')
+    counts = Counter()
+    for model_name, field_name in (('Movie', 'poster'), ('SiteSetting', 'site_logo')):
+        names = apps.get_model('movies', model_name).objects.values_list(field_name, flat=True)
+        counts.update(name for name in names if name)
+    StoredFile.objects.bulk_create(StoredFile(name=name, references=count) for name, count in counts.items())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0008_movie_poster_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('references', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Stored File',
+                'verbose_name_plural': 'Stored Files',
+                'db_table': 'stored_files',
+            },
+        ),
+        # Only the storage changes, which has no column; an AlterField would
+        # make SQLite rebuild the movies table and drop its full-text triggers
+        migrations.SeparateDatabaseAndState(state_operations=[
+            migrations.AlterField(
+                model_name='movie',
+                name='poster',
+                field=models.ImageField(blank=True, null=True, storage=movies.storage.ContentAddressedStorage(), upload_to='movies/posters/'),
+            ),
+            migrations.AlterField(
+                model_name='sitesetting',
+                name='site_logo',
+                field=models.ImageField(blank=True, null=True, storage=movies.storage.ContentAddressedStorage(), upload_to='site/'),
+            ),
+        ]),
+        migrations.RunPython(count_references, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,16 @@
-from django.db import models
+import time
+from collections import Counter
+
+from django.apps import apps
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Cast, Round, TruncDate
 from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
+from . import posters
+from .storage import content_addressed_storage
 
 
 class Genre(models.Model):
@@ -22,6 +32,13 @@ class Genre(models.Model):
         return self.name
 
 
+class MovieQuerySet(models.QuerySet):
+    def with_showtime_seats(self):
+        """Annotate showtime_seats, the seats left in each movie's bookable showtimes (None without any)"""
+        seats = Showtime.objects.bookable().filter(movie=OuterRef('pk')).order_by().values('movie')
+        return self.annotate(showtime_seats=Subquery(seats.values(total=Sum('available_seats'))))
+
+
 class Movie(models.Model):
     """
     Movie model for storing movie information
@@ -39,27 +56,92 @@ class Movie(models.Model):
     release_date = models.DateField()
     director = models.CharField(max_length=100)
     cast = models.TextField(help_text='Comma-separated list of actors')
-    poster = models.ImageField(upload_to='movies/posters/', blank=True, null=True)
+    poster = models.ImageField(upload_to='movies/posters/', storage=content_addressed_storage, blank=True, null=True)
+    # Widths of the resized poster copies stored next to it, and of the
+    # poster itself (see movies.posters). Nullable so SQLite can add the columns
+    # in place; rebuilding the table would drop the full-text search triggers.
+    poster_variants = models.JSONField(blank=True, null=True, editable=False)
+    poster_width = models.PositiveIntegerField(blank=True, null=True, editable=False)
     trailer_url = models.URLField(blank=True, null=True)
     rating = models.DecimalField(max_digits=3, decimal_places=1, default=0.0, 
                                   validators=[MinValueValidator(0.0), MaxValueValidator(10.0)])
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='now_showing')
     ticket_price = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
     available_seats = models.IntegerField(default=100)
+    # Denormalized aggregates over approved reviews, maintained by Review writes
+    review_count = models.IntegerField(default=0, editable=False)
+    rating_sum = models.IntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = MovieQuerySet.as_manager()
+    
     class Meta:
         db_table = 'movies'
         verbose_name = 'Movie'
         verbose_name_plural = 'Movies'
         ordering = ['-release_date']
+        # Ascending columns: scanned backwards they also serve the newest-first
+        # (column DESC, id DESC) keyset order without a sort step
+        indexes = [
+            # Catalog pages: filter by status, order by recency, rating or release date
+            models.Index(fields=['status', 'created_at'], name='movie_status_created_idx'),
+            models.Index(fields=['status', 'rating', 'created_at'], name='movie_status_rating_idx'),
+            models.Index(fields=['status', 'release_date'], name='movie_status_release_idx'),
+            # Admin lists, newest first
+            models.Index(fields=['created_at'], name='movie_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.release_date.year})"
     
+    # Written only by apply_review_delta() and update_rating()
+    REVIEW_AGGREGATE_FIELDS = ('review_count', 'rating_sum', 'rating')
+    
+    def save(self, *args, **kwargs):
+        if (not self._state.adding and kwargs.get('update_fields') is None
+                and not kwargs.get('force_insert') and not args):
+            # A full save of a loaded movie (forms, admin) must not write back
+            # stale aggregates over review changes made since it was loaded
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.REVIEW_AGGREGATE_FIELDS
+            ]
+        if self.poster and not self.poster._committed:
+            # Store the upload now (FileField would on save) so its variants can be named after it
+            self.poster.save(self.poster.name, self.poster.file, save=False)
+            self.poster_variants, self.poster_width = posters.generate_variants(self.poster)
+        elif not self.poster:
+            self.poster_variants, self.poster_width = None, None
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'poster' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'poster_variants', 'poster_width'}
+        super().save(*args, **kwargs)
+    
+    def generate_poster_variants(self):
+        """(Re)build the resized copies of the current poster"""
+        if not self.poster:
+            return
+        self.poster_variants, self.poster_width = posters.generate_variants(self.poster)
+        self.save(update_fields=['poster_variants', 'poster_width', 'updated_at'])
+    
+    def poster_srcset(self):
+        """srcset for the poster, or '' until its variants have been generated"""
+        if not self.poster or not self.poster_width:
+            return ''
+        return posters.poster_srcset(self.poster, self.poster_variants or [], self.poster_width)
+    
+    def bookable_seats(self):
+        """
+        Seats left to book: those of the bookable showtimes when the movie has
+        any (BookingForm then only offers those), else the movie's own count
+        """
+        if 'showtime_seats' not in self.__dict__:
+            self.showtime_seats = self.showtimes.bookable().aggregate(total=Sum('available_seats'))['total']
+        return self.available_seats if self.showtime_seats is None else self.showtime_seats
+    
     def is_available(self):
-        return self.available_seats > 0 and self.status == 'now_showing'
+        return self.bookable_seats() > 0 and self.status == 'now_showing'
     
     def get_trailer_embed_url(self):
         """Convert YouTube URL to embed URL"""
@@ -109,20 +191,233 @@ class Movie(models.Model):
         return ''
     
     def average_rating(self):
-        """Calculate average rating from user reviews"""
-        reviews = self.reviews.filter(is_approved=True)
-        if reviews.exists():
-            return round(reviews.aggregate(models.Avg('rating'))['rating__avg'], 1)
+        """Average rating of approved reviews, from the denormalized columns"""
+        if self.review_count > 0:
+            return round(self.rating_sum / self.review_count, 1)
         return 0.0
     
+    @classmethod
+    def apply_review_delta(cls, movie_id, count_delta, sum_delta):
+        """
+        Atomically adjust the approved review aggregates of a movie.
+        
+        Issues a single UPDATE built from F-expressions, so the cost does not
+        depend on how many reviews the movie has and concurrent review writes
+        cannot overwrite each other's counts.
+        """
+        if not count_delta and not sum_delta:
+            return 0
+        new_count = F('review_count') + count_delta
+        new_sum = F('rating_sum') + sum_delta
+        return cls.objects.filter(pk=movie_id).update(
+            review_count=new_count,
+            rating_sum=new_sum,
+            rating=Case(
+                When(review_count__gt=-count_delta,
+                     then=Round(Cast(new_sum, models.FloatField()) / new_count, 1)),
+                default=Value(0),
+                output_field=models.DecimalField(max_digits=3, decimal_places=1),
+            ),
+            updated_at=timezone.now(),
+        )
+    
     def update_rating(self):
-        """Update the rating field based on approved reviews"""
+        """Recompute the review aggregates from scratch (reconciliation)"""
+        totals = self.reviews.filter(is_approved=True).aggregate(
+            count=models.Count('id'),
+            total=models.Sum('rating'),
+        )
+        self.review_count = totals['count']
+        self.rating_sum = totals['total'] or 0
         self.rating = self.average_rating()
-        self.save(update_fields=['rating', 'updated_at'])
+        self.save(update_fields=['review_count', 'rating_sum', 'rating', 'updated_at'])
     
     def get_review_count(self):
         """Get the number of approved reviews"""
-        return self.reviews.filter(is_approved=True).count()
+        return self.review_count
+    
+    def get_cast_names(self):
+        """Cast member names from the comma-separated cast text, in billing order"""
+        names = {}
+        for name in self.cast.split(','):
+            name = ' '.join(name.split())[:200]
+            if name:
+                names.setdefault(Person.normalize(name), name)
+        return list(names.values())
+    
+    def sync_credits(self):
+        """Rebuild this movie's MovieCredit rows from the cast text if they differ"""
+        names = self.get_cast_names()
+        current = list(self.credits.order_by('order').values_list('person__normalized_name', flat=True))
+        if current == [Person.normalize(name) for name in names]:
+            return
+        people = Person.get_or_create_many(names)
+        with transaction.atomic():
+            self.credits.all().delete()
+            MovieCredit.objects.bulk_create(
+                MovieCredit(movie=self, person=people[Person.normalize(name)], order=order)
+                for order, name in enumerate(names)
+            )
+
+
+class Person(models.Model):
+    """
+    Cast member, shared by every movie they appear in
+    """
+    name = models.CharField(max_length=200)
+    normalized_name = models.CharField(max_length=200, unique=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'people'
+        verbose_name = 'Person'
+        verbose_name_plural = 'People'
+        ordering = ['name']
+    
+    def __str__(self):
+        return self.name
+    
+    def save(self, *args, **kwargs):
+        self.normalized_name = self.normalize(self.name)
+        super().save(*args, **kwargs)
+    
+    @staticmethod
+    def normalize(name):
+        """Case- and whitespace-insensitive key, so "tom  Hanks" and "Tom Hanks" are one person"""
+        return ' '.join(name.split()).casefold()[:200]
+    
+    @classmethod
+    def get_or_create_many(cls, names):
+        """Map normalized name -> Person for `names`, creating missing people in one insert"""
+        keys = {cls.normalize(name): name for name in names}
+        people = {person.normalized_name: person for person in cls.objects.filter(normalized_name__in=keys)}
+        missing = [cls(name=name, normalized_name=key) for key, name in keys.items() if key not in people]
+        if missing:
+            # ignore_conflicts: a concurrent save may have added the same person
+            cls.objects.bulk_create(missing, ignore_conflicts=True)
+            people.update(
+                (person.normalized_name, person)
+                for person in cls.objects.filter(normalized_name__in=[person.normalized_name for person in missing])
+            )
+        return people
+
+
+class MovieCredit(models.Model):
+    """
+    A person's appearance in a movie's cast (kept in sync with Movie.cast)
+    """
+    movie = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name='credits')
+    person = models.ForeignKey(Person, on_delete=models.CASCADE, related_name='credits')
+    order = models.PositiveSmallIntegerField(default=0, help_text='Billing order within the cast')
+    
+    class Meta:
+        db_table = 'movie_credits'
+        verbose_name = 'Movie Credit'
+        verbose_name_plural = 'Movie Credits'
+        ordering = ['order']
+        unique_together = ['movie', 'person']
+        indexes = [
+            # A movie's cast in billing order
+            models.Index(fields=['movie', 'order'], name='credit_movie_order_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.person} in {self.movie}"
+
+
+class ShowtimeQuerySet(models.QuerySet):
+    def upcoming(self):
+        return self.filter(start_time__gte=timezone.now())
+    
+    def bookable(self):
+        return self.upcoming().filter(available_seats__gt=0)
+
+
+class Showtime(models.Model):
+    """
+    Showtime model for a single screening with its own seat inventory
+    
+    Seat occupancy is kept in seat_map, one bit per seat (bit set = taken),
+    so checking or reserving a seat only touches this one row.
+    """
+    movie = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name='showtimes')
+    auditorium = models.CharField(max_length=50)
+    start_time = models.DateTimeField()
+    capacity = models.PositiveIntegerField(default=100, validators=[MinValueValidator(1)])
+    available_seats = models.IntegerField(editable=False)
+    seat_map = models.BinaryField(editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    objects = ShowtimeQuerySet.as_manager()
+    
+    class Meta:
+        db_table = 'showtimes'
+        verbose_name = 'Showtime'
+        verbose_name_plural = 'Showtimes'
+        ordering = ['start_time']
+        unique_together = ['auditorium', 'start_time']
+    
+    def __str__(self):
+        start = timezone.localtime(self.start_time)
+        return f"{start:%a %d %b, %H:%M} - {self.auditorium} ({self.available_seats} seats left)"
+    
+    def save(self, *args, **kwargs):
+        """Override save to start new showtimes with every seat free"""
+        if self._state.adding and not self.seat_map:
+            self.seat_map = bytes((self.capacity + 7) // 8)
+            self.available_seats = self.capacity
+        super().save(*args, **kwargs)
+    
+    @staticmethod
+    def _seat_bit(seat):
+        """Byte index and bit mask of a 1-based seat number"""
+        index = seat - 1
+        return index // 8, 1 << (index % 8)
+    
+    def is_seat_taken(self, seat):
+        if not 1 <= seat <= self.capacity:
+            raise ValueError(f'Seat {seat} does not exist in this showtime')
+        byte, mask = self._seat_bit(seat)
+        return bool(self.seat_map[byte] & mask)
+    
+    def taken_seats(self):
+        return [seat for seat in range(1, self.capacity + 1) if self.is_seat_taken(seat)]
+    
+    def allocate_seats(self, count, requested=None):
+        """
+        Mark seats as taken in the in-memory seat map and return their numbers
+        
+        Takes the requested seat numbers, or the first free seats when none are
+        given. Returns None if any requested seat is taken or too few are free.
+        """
+        seat_map = bytearray(self.seat_map)
+        if requested:
+            seats = sorted(set(requested))
+            if len(seats) != count or any(self.is_seat_taken(seat) for seat in seats):
+                return None
+        else:
+            seats = []
+            for seat in range(1, self.capacity + 1):
+                if not self.is_seat_taken(seat):
+                    seats.append(seat)
+                    if len(seats) == count:
+                        break
+            if len(seats) < count:
+                return None
+        for seat in seats:
+            byte, mask = self._seat_bit(seat)
+            seat_map[byte] |= mask
+        self.seat_map = bytes(seat_map)
+        return seats
+    
+    def free_seats(self, seats):
+        """Clear seats in the in-memory seat map"""
+        seat_map = bytearray(self.seat_map)
+        for seat in seats:
+            byte, mask = self._seat_bit(seat)
+            seat_map[byte] &= ~mask & 0xFF
+        self.seat_map = bytes(seat_map)
 
 
 class Booking(models.Model):
@@ -137,6 +432,8 @@ class Booking(models.Model):
     
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='bookings')
     movie = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name='bookings')
+    showtime = models.ForeignKey(Showtime, on_delete=models.PROTECT, null=True, blank=True, related_name='bookings')
+    seat_numbers = models.CharField(max_length=500, blank=True, help_text='Comma-separated seat numbers')
     booking_date = models.DateTimeField(auto_now_add=True)
     show_date = models.DateField()
     show_time = models.TimeField()
@@ -152,12 +449,31 @@ class Booking(models.Model):
         verbose_name = 'Booking'
         verbose_name_plural = 'Bookings'
         ordering = ['-booking_date']
+        indexes = [
+            # Admin list and dashboard, newest first
+            models.Index(fields=['booking_date'], name='booking_date_idx'),
+            # A user's bookings page
+            models.Index(fields=['user', 'booking_date'], name='booking_user_date_idx'),
+            # Pending count and status-filtered lists
+            models.Index(fields=['status', 'booking_date'], name='booking_status_date_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.movie.title} ({self.show_date})"
     
     def calculate_total_price(self):
         return self.movie.ticket_price * self.number_of_seats
+    
+    def get_seat_numbers(self):
+        return [int(seat) for seat in self.seat_numbers.split(',') if seat]
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if 'status' in instance.__dict__:
+            # Lets the rollup signals see status transitions (e.g. cancellation)
+            instance._loaded_status = instance.status
+        return instance
 
 
 class Review(models.Model):
@@ -178,32 +494,237 @@ class Review(models.Model):
         verbose_name_plural = 'Reviews'
         ordering = ['-created_at']
         unique_together = ['user', 'movie']  # One review per user per movie
+        indexes = [
+            # Movie detail page: a movie's reviews, newest first (is_approved is checked per row)
+            models.Index(fields=['movie', 'created_at'], name='review_movie_created_idx'),
+            # Admin list and dashboard, newest first
+            models.Index(fields=['created_at'], name='review_created_idx'),
+            # A user's reviews page
+            models.Index(fields=['user', 'created_at'], name='review_user_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.movie.title} ({self.rating}/5)"
     
+    RATING_STATE_FIELDS = ('movie_id', 'rating', 'is_approved')
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if all(name in instance.__dict__ for name in cls.RATING_STATE_FIELDS):
+            instance._remember_rating_state()
+        if 'rating' in instance.__dict__:
+            # Lets the rollup signals move an edited rating between buckets
+            instance._loaded_rating = instance.rating
+        return instance
+    
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        # The remembered state describes the old row; re-read it on the next save
+        self.__dict__.pop('_rated_movie_id', None)
+        self.__dict__.pop('_rated_value', None)
+        if all(name in self.__dict__ for name in self.RATING_STATE_FIELDS):
+            if fields is None:
+                self._remember_rating_state()
+        if fields is None or 'rating' in fields:
+            self._loaded_rating = self.__dict__.get('rating')
+    
+    def _remember_rating_state(self):
+        """Remember what this review currently contributes to the movie aggregates"""
+        self._rated_movie_id = self.movie_id if self.is_approved else None
+        self._rated_value = self.rating if self.is_approved else 0
+    
+    def _stored_rating_state(self):
+        """(movie_id, rating) this review contributes as stored, or (None, 0)"""
+        if not hasattr(self, '_rated_movie_id'):
+            # Loaded with deferred fields, or a hand-built instance with a pk
+            stored = None
+            if self.pk is not None and not self._state.adding:
+                stored = Review.objects.filter(pk=self.pk).values(*self.RATING_STATE_FIELDS).first()
+            if stored and stored['is_approved']:
+                return stored['movie_id'], stored['rating']
+            return None, 0
+        return self._rated_movie_id, self._rated_value
+    
     def save(self, *args, **kwargs):
-        """Override save to update movie rating after saving review"""
-        super().save(*args, **kwargs)
-        # Update movie rating after review is saved
-        self.movie.update_rating()
+        """Override save to apply this review's change to the movie aggregates"""
+        old_movie_id, old_value = self._stored_rating_state()
+        new_movie_id = self.movie_id if self.is_approved else None
+        new_value = self.rating if self.is_approved else 0
+        
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+            if old_movie_id == new_movie_id:
+                if new_movie_id is not None:
+                    # Rating edited on an approved review
+                    Movie.apply_review_delta(new_movie_id, 0, new_value - old_value)
+            else:
+                # Approval toggled, new review, or review moved to another movie
+                if old_movie_id is not None:
+                    Movie.apply_review_delta(old_movie_id, -1, -old_value)
+                if new_movie_id is not None:
+                    Movie.apply_review_delta(new_movie_id, 1, new_value)
+        self._remember_rating_state()
+    
+    def discard_rating(self):
+        """Remove this review's contribution from the movie aggregates (after deletion)"""
+        old_movie_id, old_value = self._stored_rating_state()
+        if old_movie_id is not None:
+            Movie.apply_review_delta(old_movie_id, -1, -old_value)
+        self._rated_movie_id = None
+        self._rated_value = 0
+
+
+class DailyMovieStat(models.Model):
+    """
+    Daily rollup of bookings and reviews per movie for dashboard analytics
     
-    def delete(self, *args, **kwargs):
-        """Override delete to update movie rating after deleting review"""
-        movie = self.movie
-        super().delete(*args, **kwargs)
-        # Update movie rating after review is deleted
-        movie.update_rating()
+    Kept up to date incrementally by movies.signals on Booking and Review
+    writes; `python manage.py rebuild_daily_stats` recomputes it from scratch.
+    Per-genre figures come from grouping these rows by movie__genre.
+    """
+    RATING_FIELDS = tuple(f'rating_{rating}' for rating in range(1, 6))
+    
+    date = models.DateField()
+    movie = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name='daily_stats')
+    bookings = models.IntegerField(default=0)
+    seats_sold = models.IntegerField(default=0, help_text='Seats in bookings that are not cancelled')
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    reviews = models.IntegerField(default=0)
+    rating_1 = models.IntegerField(default=0)
+    rating_2 = models.IntegerField(default=0)
+    rating_3 = models.IntegerField(default=0)
+    rating_4 = models.IntegerField(default=0)
+    rating_5 = models.IntegerField(default=0)
+    
+    class Meta:
+        db_table = 'daily_movie_stats'
+        verbose_name = 'Daily Movie Stat'
+        verbose_name_plural = 'Daily Movie Stats'
+        ordering = ['-date']
+        unique_together = ['date', 'movie']
+    
+    def __str__(self):
+        return f"{self.movie_id} on {self.date}"
+    
+    @classmethod
+    def add(cls, date, movie_id, **deltas):
+        """Add deltas to the (date, movie) row with a single UPDATE, creating the row if needed"""
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        rows = cls.objects.filter(date=date, movie_id=movie_id)
+        updates = {field: F(field) + delta for field, delta in deltas.items()}
+        if rows.update(**updates):
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(date=date, movie_id=movie_id, **deltas)
+        except IntegrityError:
+            # A concurrent write created the row first
+            rows.update(**updates)
+    
+    @classmethod
+    def record_booking(cls, booking, sign=1):
+        """Count a new booking (sign=1) or remove a deleted one (sign=-1)"""
+        sold = booking.status != 'cancelled'
+        cls.add(
+            timezone.localdate(booking.booking_date),
+            booking.movie_id,
+            bookings=sign,
+            seats_sold=sign * booking.number_of_seats if sold else 0,
+            revenue=sign * booking.total_price if sold else 0,
+        )
+    
+    @classmethod
+    def record_booking_status(cls, booking, old_status):
+        """Take seats and revenue out when a booking is cancelled (and back on reinstatement)"""
+        was_sold = old_status != 'cancelled'
+        is_sold = booking.status != 'cancelled'
+        if was_sold == is_sold:
+            return
+        sign = 1 if is_sold else -1
+        cls.add(
+            timezone.localdate(booking.booking_date),
+            booking.movie_id,
+            seats_sold=sign * booking.number_of_seats,
+            revenue=sign * booking.total_price,
+        )
+    
+    @classmethod
+    def record_review(cls, review, sign=1, old_rating=None):
+        """Count a new (sign=1) or deleted (sign=-1) review, or move an edited one's rating"""
+        date = timezone.localdate(review.created_at)
+        if old_rating is not None:
+            if old_rating != review.rating:
+                cls.add(date, review.movie_id, **{f'rating_{old_rating}': -1, f'rating_{review.rating}': 1})
+            return
+        cls.add(date, review.movie_id, reviews=sign, **{f'rating_{review.rating}': sign})
+    
+    @classmethod
+    @transaction.atomic
+    def rebuild(cls):
+        """
+        Recompute every row from the bookings and reviews tables; returns the row count
+        
+        Migration 0004 keeps a frozen copy of this for its one-off backfill.
+        """
+        rows = {}
+        
+        def row(entry):
+            key = (entry['day'], entry['movie_id'])
+            if key not in rows:
+                rows[key] = cls(date=entry['day'], movie_id=entry['movie_id'])
+            return rows[key]
+        
+        sold = ~Q(status='cancelled')
+        bookings = (
+            Booking.objects.annotate(day=TruncDate('booking_date'))
+            .values('day', 'movie_id')
+            .annotate(
+                count=Count('id'),
+                seats=Sum('number_of_seats', filter=sold),
+                revenue=Sum('total_price', filter=sold),
+            )
+            .order_by()
+        )
+        for entry in bookings:
+            stat = row(entry)
+            stat.bookings = entry['count']
+            stat.seats_sold = entry['seats'] or 0
+            stat.revenue = entry['revenue'] or 0
+        
+        ratings = {field: Count('id', filter=Q(rating=int(field[-1]))) for field in cls.RATING_FIELDS}
+        reviews = (
+            Review.objects.annotate(day=TruncDate('created_at'))
+            .values('day', 'movie_id')
+            .annotate(count=Count('id'), **ratings)
+            .order_by()
+        )
+        for entry in reviews:
+            stat = row(entry)
+            stat.reviews = entry['count']
+            for field in cls.RATING_FIELDS:
+                setattr(stat, field, entry[field])
+        
+        cls.objects.all().delete()
+        cls.objects.bulk_create(rows.values(), batch_size=500)
+        return len(rows)
 
 
 class SiteSetting(models.Model):
     """
     Site settings model for storing system configuration
     """
+    CACHE_KEY = 'movies:site_settings'
+    CACHE_TIMEOUT = 60 * 60  # Shared cache entry, invalidated on save
+    LOCAL_CACHE_TTL = 5  # Seconds a worker trusts its in-process copy
+    _local_cache = (None, 0.0)  # (settings, expires_at) swapped in atomically
+    
     site_name = models.CharField(max_length=200, default='Movie Management System')
     site_email = models.EmailField(default='admin@moviemanagement.com')
     items_per_page = models.IntegerField(default=10, validators=[MinValueValidator(5), MaxValueValidator(100)])
-    site_logo = models.ImageField(upload_to='site/', blank=True, null=True)
+    site_logo = models.ImageField(upload_to='site/', storage=content_addressed_storage, blank=True, null=True)
     enable_review = models.BooleanField(default=True)
     require_approval = models.BooleanField(default=False)
     enable_notification = models.BooleanField(default=True)
@@ -221,5 +742,93 @@ class SiteSetting(models.Model):
     @classmethod
     def get_settings(cls):
         """Get or create site settings (singleton pattern)"""
-        settings, created = cls.objects.get_or_create(id=1)
+        # Plain read first: get_or_create is routed as a write even when the row exists
+        settings = cls.objects.filter(id=1).first()
+        if settings is None:
+            settings, created = cls.objects.get_or_create(id=1)
+        return settings
+    
+    @classmethod
+    def get_cached_settings(cls):
+        """
+        Read-only settings for page rendering.
+        
+        Checks the in-process copy first, then the shared cache, and only
+        falls back to the database when both are cold. Callers must not
+        modify or save the returned instance; use get_settings() for that.
+        """
+        now = time.monotonic()
+        settings, expires_at = SiteSetting._local_cache
+        if settings is not None and expires_at > now:
+            return settings
+        
+        settings = cache.get(cls.CACHE_KEY)
+        if settings is None:
+            settings = cls.get_settings()
+            cache.set(cls.CACHE_KEY, settings, cls.CACHE_TIMEOUT)
+        
+        SiteSetting._local_cache = (settings, now + cls.LOCAL_CACHE_TTL)
         return settings
+    
+    @classmethod
+    def clear_cache(cls):
+        """Drop both cache layers so the next read reloads from the database"""
+        SiteSetting._local_cache = (None, 0.0)
+        cache.delete(cls.CACHE_KEY)
+
+
+class StoredFile(models.Model):
+    """
+    A file in the content-addressed media storage and how many rows use it
+
+    References are counted by movies.signals as posters and logos are set,
+    replaced and deleted; collect_media_garbage recounts them from the rows
+    before deleting anything.
+    """
+    # Image fields whose files live in the content-addressed storage
+    FILE_FIELDS = (('movies.Movie', 'poster'), ('movies.SiteSetting', 'site_logo'))
+    
+    name = models.CharField(max_length=255, unique=True)
+    references = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'stored_files'
+        verbose_name = 'Stored File'
+        verbose_name_plural = 'Stored Files'
+    
+    def __str__(self):
+        return f"{self.name} ({self.references} references)"
+    
+    @classmethod
+    def add_references(cls, name, delta):
+        """Atomically adjust the reference count of `name`, registering it if new"""
+        if not name or not delta:
+            return
+        # ignore_conflicts: a concurrent save may have registered the same file
+        cls.objects.bulk_create([cls(name=name)], ignore_conflicts=True)
+        cls.objects.filter(name=name).update(references=F('references') + delta, updated_at=timezone.now())
+    
+    @classmethod
+    def file_fields(cls):
+        return [(apps.get_model(label), field_name) for label, field_name in cls.FILE_FIELDS]
+    
+    @classmethod
+    def recount(cls):
+        """
+        Reset every reference count from the rows using the files
+        
+        Returns the set of referenced names.
+        """
+        counts = Counter()
+        for model, field_name in cls.file_fields():
+            names = model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+            counts.update(names.values_list(field_name, flat=True))
+        with transaction.atomic():
+            cls.objects.bulk_create([cls(name=name) for name in counts], ignore_conflicts=True)
+            cls.objects.exclude(name__in=counts).exclude(references=0).update(references=0, updated_at=timezone.now())
+            for stored in cls.objects.filter(name__in=counts):
+                if stored.references != counts[stored.name]:
+                    stored.references = counts[stored.name]
+                    stored.save(update_fields=['references', 'updated_at'])
+        return set(counts)
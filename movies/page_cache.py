@@ -0,0 +1,141 @@
+import hashlib
+import re
+import uuid
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+
+PAGE_KEY_PREFIX = 'movies:page:'
+TAG_KEY_PREFIX = 'movies:page_tag:'
+PAGE_TIMEOUT = 10 * 60  # Upper bound on staleness for changes no tag covers (e.g. usernames)
+SITE_TAG = 'site'  # Every page renders the site settings
+
+# The login/register modals carry a CSRF token; it is stored blanked out and
+# refilled with the visitor's own token on every hit
+CSRF_INPUT = re.compile(rb'(name="csrfmiddlewaretoken" value=")[^"]*(")')
+CSRF_PLACEHOLDER = b'__csrf_token__'
+
+
+def movie_tag(movie_id):
+    return f'movie:{movie_id}'
+
+
+def genre_tag(genre_id):
+    return f'genre:{genre_id}'
+
+
+def tag_response(response, *tags):
+    """Mark a rendered page as cacheable, depending on `tags`"""
+    response.page_cache_tags = {tag for tag in tags if tag}
+    return response
+
+
+def _tag_key(tag):
+    return f'{TAG_KEY_PREFIX}{tag}'
+
+
+def _bump(tags):
+    cache.set_many({_tag_key(tag): uuid.uuid4().hex for tag in tags}, None)
+
+
+def purge(*tags):
+    """
+    Invalidate every cached page depending on any of `tags`
+
+    Each tag has a version token in the shared cache and cached pages
+    remember the versions they were rendered with, so replacing the token
+    drops exactly the pages using that tag, in every worker.
+    """
+    tags = {tag for tag in tags if tag}
+    if not tags:
+        return
+    _bump(tags)
+    # Bump again once committed, in case a concurrent request cached the old rows
+    transaction.on_commit(lambda: _bump(tags))
+
+
+def _page_key(request):
+    url = request.get_full_path().encode()
+    return PAGE_KEY_PREFIX + hashlib.md5(url).hexdigest()
+
+
+def _is_cacheable(request):
+    if not settings.PAGE_CACHE or request.method != 'GET' or request.user.is_authenticated:
+        return False
+    # Pending flash messages are rendered into (and consumed by) the page
+    return not len(get_messages(request))
+
+
+def _cached_response(request, key):
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    versions = entry['versions']
+    if cache.get_many(versions.keys()) != versions:
+        return None
+    content = entry['content']
+    if CSRF_PLACEHOLDER in content:
+        content = content.replace(CSRF_PLACEHOLDER, get_token(request).encode())
+    return HttpResponse(content, content_type=entry['content_type'])
+
+
+def _store_response(key, response):
+    keys = [_tag_key(tag) for tag in response.page_cache_tags | {SITE_TAG}]
+    versions = cache.get_many(keys)
+    missing = [tag_key for tag_key in keys if tag_key not in versions]
+    for tag_key in missing:
+        cache.add(tag_key, uuid.uuid4().hex, None)
+    if missing:
+        versions.update(cache.get_many(missing))
+    cache.set(key, {
+        'content': CSRF_INPUT.sub(rb'\g<1>' + CSRF_PLACEHOLDER + rb'\g<2>', response.content),
+        'content_type': response['Content-Type'],
+        'versions': versions,
+    }, PAGE_TIMEOUT)
+
+
+def cache_anonymous_page(view):
+    """
+    Serve anonymous GET requests for a view from the shared cache
+
+    Pages are keyed by URL and query string. Only responses the view marked
+    with tag_response() are stored; movies.signals purges their tags when
+    movies, genres, reviews, bookings or the site settings change.
+    Logged-in users always get a fresh render. Works for sync and async views.
+    """
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def async_wrapper(request, *args, **kwargs):
+            # Session-backed checks and cache I/O block, so they leave the event loop
+            if not await sync_to_async(_is_cacheable)(request):
+                return await view(request, *args, **kwargs)
+            key = _page_key(request)
+            response = await sync_to_async(_cached_response)(request, key)
+            if response is not None:
+                return response
+            response = await view(request, *args, **kwargs)
+            if response.status_code == 200 and hasattr(response, 'page_cache_tags'):
+                await sync_to_async(_store_response)(key, response)
+            return response
+        return async_wrapper
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if not _is_cacheable(request):
+            return view(request, *args, **kwargs)
+        key = _page_key(request)
+        response = _cached_response(request, key)
+        if response is not None:
+            return response
+        response = view(request, *args, **kwargs)
+        if response.status_code == 200 and hasattr(response, 'page_cache_tags'):
+            _store_response(key, response)
+        return response
+    return wrapper
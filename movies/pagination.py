@@ -0,0 +1,138 @@
+import base64
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.paginator import Page, Paginator
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from .models import SiteSetting
+
+MAX_PAGE_SIZE = 100
+
+
+def get_page_size():
+    """Items per page, as configured in the site settings (1 to MAX_PAGE_SIZE)"""
+    return max(1, min(SiteSetting.get_cached_settings().items_per_page, MAX_PAGE_SIZE))
+
+
+def paginate(request, queryset):
+    """
+    Page-number pagination for small tables (movies, users)
+    """
+    paginator = Paginator(queryset, get_page_size())
+    return paginator.get_page(request.GET.get('page'))
+
+
+async def apaginate(request, queryset):
+    """
+    paginate() for async views
+
+    Like Paginator.get_page(), an invalid page number shows the first page
+    and one out of range shows the last.
+    """
+    paginator = Paginator(queryset, await sync_to_async(get_page_size)())
+    try:
+        number = int(request.GET.get('page') or 1)
+    except ValueError:
+        number = 1
+    offset = (number - 1) * paginator.per_page
+    paginator.count = await queryset.acount()
+    rows = await sync_to_async(list)(queryset[max(offset, 0):offset + paginator.per_page])
+    if not 1 <= number <= paginator.num_pages:
+        number = paginator.num_pages
+        rows = await sync_to_async(list)(paginator.page(number).object_list)
+    return Page(rows, number, paginator)
+
+
+class KeysetPage:
+    """
+    One page of a keyset (seek) paginated queryset
+
+    Iterates like a Django Page. Instead of page numbers it exposes opaque
+    cursors pointing just past the last row (next) or before the first
+    row (previous) of this page.
+    """
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+def encode_cursor(value, pk):
+    raw = json.dumps([value.isoformat(), pk]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Return (datetime, pk) from a cursor, or None if it is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        value, pk = json.loads(raw)
+        value = parse_datetime(value)
+        pk = int(pk)
+    except (ValueError, TypeError):
+        return None
+    if value is None:
+        return None
+    return value, pk
+
+
+def keyset_paginate(request, queryset, field):
+    """
+    Keyset pagination ordered newest first on (field, id)
+
+    Each page seeks straight past the cursor row (?after= for older rows,
+    ?before= for newer ones) with an indexed range condition, so deep pages
+    cost the same as the first one, unlike OFFSET which scans every skipped
+    row.
+    """
+    per_page = get_page_size()
+    after = decode_cursor(request.GET.get('after', ''))
+    before = decode_cursor(request.GET.get('before', '')) if after is None else None
+
+    rows = []
+    if before is not None:
+        # Walk backwards from the cursor, then restore newest-first order
+        value, pk = before
+        rows = list(
+            queryset.filter(Q(**{f'{field}__gt': value}) | Q(**{field: value, 'pk__gt': pk}))
+            .order_by(field, 'pk')[:per_page + 1]
+        )
+        has_newer = len(rows) > per_page
+        rows = rows[:per_page][::-1]
+        has_older = True
+
+    if not rows:
+        if after is not None:
+            value, pk = after
+            queryset = queryset.filter(Q(**{f'{field}__lt': value}) | Q(**{field: value, 'pk__lt': pk}))
+        rows = list(queryset.order_by(f'-{field}', '-pk')[:per_page + 1])
+        has_older = len(rows) > per_page
+        rows = rows[:per_page]
+        has_newer = after is not None
+
+    if not rows:
+        return KeysetPage(rows)
+
+    first, last = rows[0], rows[-1]
+    return KeysetPage(
+        rows,
+        next_cursor=encode_cursor(getattr(last, field), last.pk) if has_older else None,
+        previous_cursor=encode_cursor(getattr(first, field), first.pk) if has_newer else None,
+    )
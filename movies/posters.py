@@ -0,0 +1,69 @@
+import math
+import posixpath
+from io import BytesIO
+
+from PIL import Image, ImageOps, features
+
+from django.core.files.base import ContentFile
+
+POSTER_WIDTHS = (80, 240, 400, 800)  # Thumbnails, cards, detail page, hero / 2x cards
+VARIANT_FORMAT, VARIANT_EXTENSION = ('WEBP', 'webp') if features.check('webp') else ('JPEG', 'jpg')
+VARIANT_QUALITY = 80
+ORIENTATION_TAG = 0x0112
+
+
+def variant_name(name, width):
+    """Storage name of the `width` variant of the poster stored as `name`: posters/x.jpeg -> posters/x.240w.webp"""
+    stem, _ = posixpath.splitext(name)
+    return f'{stem}.{width}w.{VARIANT_EXTENSION}'
+
+
+def _is_rotated(image):
+    # EXIF orientations 5-8 swap width and height
+    return image.getexif().get(ORIENTATION_TAG, 1) >= 5
+
+
+def _prepare(image):
+    image = ImageOps.exif_transpose(image)
+    has_alpha = image.mode in ('RGBA', 'LA') or 'transparency' in image.info
+    mode = 'RGBA' if has_alpha and VARIANT_FORMAT == 'WEBP' else 'RGB'
+    return image.convert(mode) if image.mode != mode else image
+
+
+def generate_variants(poster):
+    """
+    Write the resized copies of a stored poster next to it
+
+    Only widths narrower than the original are produced. The image is decoded
+    once (JPEGs at a reduced scale when they allow it) and each variant is
+    resized from the next larger one. Returns the widths written, smallest
+    first, for Movie.poster_variants, and the original's width.
+    """
+    storage = poster.storage  # movies.storage.ContentAddressedStorage
+    with poster.open('rb'):
+        image = Image.open(poster)
+        stored_width, stored_height = image.size
+        original_width = stored_height if _is_rotated(image) else stored_width
+        widths = [width for width in POSTER_WIDTHS if width < original_width]
+        if not widths:
+            return [], original_width
+        # Let the JPEG decoder skip detail the largest variant doesn't need
+        scale = widths[-1] / original_width
+        image.draft('RGB', (math.ceil(stored_width * scale), math.ceil(stored_height * scale)))
+        image = _prepare(image)
+
+    for width in reversed(widths):
+        height = max(1, round(image.height * width / image.width))
+        image = image.resize((width, height), Image.LANCZOS)
+        buffer = BytesIO()
+        image.save(buffer, VARIANT_FORMAT, quality=VARIANT_QUALITY)
+        storage.save_derived(variant_name(poster.name, width), ContentFile(buffer.getvalue()))
+    return widths, original_width
+
+
+def poster_srcset(poster, widths, original_width):
+    """srcset value listing the stored variants and the original, e.g. "/media/...80w.webp 80w, ..." """
+    storage = poster.storage
+    candidates = [f'{storage.url(variant_name(poster.name, width))} {width}w' for width in widths]
+    candidates.append(f'{poster.url} {original_width}w')
+    return ', '.join(candidates)
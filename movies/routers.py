@@ -0,0 +1,77 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+
+from django.conf import settings
+
+REPLICA_DB_ALIAS = 'replica'
+
+_replica_reads = ContextVar('replica_reads', default=False)
+_pinned_to_primary = ContextVar('pinned_to_primary', default=False)
+
+
+@contextmanager
+def replica_reads():
+    """
+    Send reads of movies models to the replica for the duration of the block
+
+    The first write inside the block pins every later read in it to the
+    primary, so a request always sees its own writes.
+    """
+    reads_token = _replica_reads.set(True)
+    pinned_token = _pinned_to_primary.set(False)
+    try:
+        yield
+    finally:
+        _pinned_to_primary.reset(pinned_token)
+        _replica_reads.reset(reads_token)
+
+
+def read_from_replica(view):
+    """Run a read-mostly view (catalog pages, dashboard) inside replica_reads()"""
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def async_wrapper(request, *args, **kwargs):
+            # The context variables are copied into the ORM's worker threads
+            with replica_reads():
+                return await view(request, *args, **kwargs)
+        return async_wrapper
+    
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        with replica_reads():
+            return view(request, *args, **kwargs)
+    return wrapper
+
+
+class ReplicaRouter:
+    """
+    Database router for an optional read replica (DATABASES['replica'])
+
+    Only reads of movies models made inside replica_reads() go to the
+    replica; everything else, including sessions and accounts (which must be
+    current right after a login), stays on the primary. Without a replica
+    configured every query uses 'default'.
+    """
+    route_app_labels = {'movies'}
+
+    def db_for_read(self, model, **hints):
+        if (
+            _replica_reads.get()
+            and not _pinned_to_primary.get()
+            and model._meta.app_label in self.route_app_labels
+            and REPLICA_DB_ALIAS in settings.DATABASES
+        ):
+            return REPLICA_DB_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        if _replica_reads.get():
+            _pinned_to_primary.set(True)
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        return True
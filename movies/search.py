@@ -0,0 +1,204 @@
+import re
+from functools import reduce
+from operator import or_
+
+from django.db import connection
+from django.db.models import FloatField, Q
+from django.db.models.expressions import RawSQL
+
+# Words longer than this or beyond MAX_TERMS are ignored
+MAX_TERMS = 8
+MAX_TERM_LENGTH = 50
+
+SEARCH_FIELDS = ('title', 'director', 'cast', 'description')
+PUBLIC_FIELDS = ('title', 'director', 'cast')
+ADMIN_FIELDS = ('title', 'director', 'description')
+
+
+def search_terms(query):
+    """Split user input into lower-case words, dropping punctuation and operators"""
+    words = re.findall(r'\w+', query.lower())
+    return [word[:MAX_TERM_LENGTH] for word in words[:MAX_TERMS]]
+
+
+class SearchBackend:
+    """
+    Movie full-text search
+
+    Every term must match one of `fields`. Terms match as word prefixes, so
+    partially typed words find results.
+    """
+    def match_condition(self, query, fields=SEARCH_FIELDS):
+        """Q object selecting the movies that match `query`"""
+        raise NotImplementedError
+
+    def search(self, queryset, query, fields=SEARCH_FIELDS):
+        """`queryset` narrowed to matches for `query`, best matches first"""
+        return queryset.filter(self.match_condition(query, fields))
+
+    def repair_index(self, connection):
+        """Restore index machinery a schema change dropped; returns what was recreated"""
+        return []
+
+
+class LikeSearchBackend(SearchBackend):
+    """Unindexed icontains fallback for databases without a full-text backend"""
+    def match_condition(self, query, fields=SEARCH_FIELDS):
+        terms = search_terms(query)
+        if not terms:
+            return Q(pk__in=[])
+        return reduce(
+            lambda condition, term: condition & reduce(or_, (Q(**{f'{field}__icontains': term}) for field in fields)),
+            terms,
+            Q(),
+        )
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """
+    SQLite FTS5 search over the movies_fts external-content table
+
+    movies_fts reads its text from the movies table and is kept in sync by
+    triggers (see migration 0005_movie_search_index, and repair_index()
+    for putting them back after migrate), so the index only
+    stores the inverted lists. Results are ranked with bm25, weighting title
+    matches above people and people above the description.
+    """
+    TABLE = 'movies_fts'
+    WEIGHTS = {'title': 10.0, 'director': 4.0, 'cast': 4.0, 'description': 1.0}
+    # The canonical sync triggers. Migration 0005 installs them from its own
+    # frozen copy; a change here needs a migration that replaces the installed
+    # ones. When a later migration makes SQLite rebuild the movies table
+    # (copy, drop, rename) they are dropped with the old table, and
+    # repair_index() puts them back from here.
+    TRIGGERS = {
+        'movies_fts_insert': """
+            CREATE TRIGGER movies_fts_insert AFTER INSERT ON movies BEGIN
+                INSERT INTO movies_fts(rowid, title, director, "cast", description)
+                VALUES (new.id, new.title, new.director, new."cast", new.description);
+            END
+        """,
+        'movies_fts_delete': """
+            CREATE TRIGGER movies_fts_delete AFTER DELETE ON movies BEGIN
+                INSERT INTO movies_fts(movies_fts, rowid, title, director, "cast", description)
+                VALUES ('delete', old.id, old.title, old.director, old."cast", old.description);
+            END
+        """,
+        'movies_fts_update': """
+            CREATE TRIGGER movies_fts_update AFTER UPDATE OF title, director, "cast", description ON movies BEGIN
+                INSERT INTO movies_fts(movies_fts, rowid, title, director, "cast", description)
+                VALUES ('delete', old.id, old.title, old.director, old."cast", old.description);
+                INSERT INTO movies_fts(rowid, title, director, "cast", description)
+                VALUES (new.id, new.title, new.director, new."cast", new.description);
+            END
+        """,
+    }
+
+    def repair_index(self, connection):
+        """
+        Recreate missing sync triggers and rebuild the index from the movies table
+
+        Rows written while a trigger was missing are out of the index (or
+        stale in it), so the whole index is rebuilt whenever one is restored.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT type, name FROM sqlite_master WHERE (type = 'table' AND name = %s) OR type = 'trigger'",
+                [self.TABLE],
+            )
+            existing = {(kind, name) for kind, name in cursor.fetchall()}
+            if ('table', self.TABLE) not in existing:
+                # Migration 0005 hasn't run yet
+                return []
+            missing = [name for name in self.TRIGGERS if ('trigger', name) not in existing]
+            for name in missing:
+                cursor.execute(self.TRIGGERS[name])
+            if missing:
+                cursor.execute(f"INSERT INTO {self.TABLE}({self.TABLE}) VALUES ('rebuild')")
+        return missing
+
+    def match_expression(self, query, fields):
+        terms = search_terms(query)
+        if not terms:
+            return None
+        columns = '{%s}' % ' '.join(fields)
+        # Quoted terms cannot be read as FTS5 operators; `*` makes a prefix query
+        return ' '.join(f'{columns} : "{term}"*' for term in terms)
+
+    def match_condition(self, query, fields=SEARCH_FIELDS):
+        match = self.match_expression(query, fields)
+        if match is None:
+            return Q(pk__in=[])
+        return Q(pk__in=RawSQL(f'SELECT rowid FROM {self.TABLE} WHERE {self.TABLE} MATCH %s', (match,)))
+
+    def search(self, queryset, query, fields=SEARCH_FIELDS):
+        match = self.match_expression(query, fields)
+        if match is None:
+            return queryset.none()
+        weights = ', '.join(str(self.WEIGHTS[field]) for field in SEARCH_FIELDS)
+        rank = RawSQL(
+            f'SELECT bm25({self.TABLE}, {weights}) FROM {self.TABLE} '
+            f'WHERE {self.TABLE} MATCH %s AND rowid = {queryset.model._meta.db_table}.id',
+            (match,),
+            output_field=FloatField(),
+        )
+        # bm25 scores are negative: lower is more relevant
+        return (
+            queryset.filter(self.match_condition(query, fields))
+            .annotate(search_rank=rank)
+            .order_by('search_rank', *queryset.query.order_by or queryset.model._meta.ordering)
+        )
+
+
+class PostgreSQLSearchBackend(SearchBackend):
+    """
+    PostgreSQL search over the movies.search_vector column
+
+    search_vector is a stored generated tsvector with a GIN index (see
+    migration 0005_movie_search_index), weighted title A, director B,
+    cast C, description D. Searching a subset of fields restricts each
+    prefix term to those weights; results are ranked with ts_rank.
+    """
+    WEIGHTS = {'title': 'A', 'director': 'B', 'cast': 'C', 'description': 'D'}
+
+    def tsquery(self, query, fields):
+        terms = search_terms(query)
+        if not terms:
+            return None
+        weights = ''.join(sorted({self.WEIGHTS[field] for field in fields}))
+        return ' & '.join(f"'{term}':*{weights}" for term in terms)
+
+    def match_condition(self, query, fields=SEARCH_FIELDS):
+        tsquery = self.tsquery(query, fields)
+        if tsquery is None:
+            return Q(pk__in=[])
+        return Q(pk__in=RawSQL(
+            "SELECT id FROM movies WHERE search_vector @@ to_tsquery('simple', %s)",
+            (tsquery,),
+        ))
+
+    def search(self, queryset, query, fields=SEARCH_FIELDS):
+        tsquery = self.tsquery(query, fields)
+        if tsquery is None:
+            return queryset.none()
+        rank = RawSQL(
+            f"ts_rank({queryset.model._meta.db_table}.search_vector, to_tsquery('simple', %s))",
+            (tsquery,),
+            output_field=FloatField(),
+        )
+        return (
+            queryset.filter(self.match_condition(query, fields))
+            .annotate(search_rank=rank)
+            .order_by('-search_rank', *queryset.query.order_by or queryset.model._meta.ordering)
+        )
+
+
+BACKENDS = {
+    'sqlite': SQLiteSearchBackend,
+    'postgresql': PostgreSQLSearchBackend,
+}
+
+
+def get_search_backend():
+    """Search backend for the default database"""
+    return BACKENDS.get(connection.vendor, LikeSearchBackend)()
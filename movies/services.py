@@ -0,0 +1,105 @@
+from django.db import transaction
+from django.db.models import F
+from .models import Movie, Showtime
+
+
+class SeatReservation:
+    """
+    Outcome of a seat reservation attempt
+    """
+    def __init__(self, booking=None, available_seats=None):
+        self.booking = booking
+        self.available_seats = available_seats
+
+    @property
+    def sold_out(self):
+        return self.booking is None
+
+    def __bool__(self):
+        return not self.sold_out
+
+
+class _SeatsTaken(Exception):
+    """Raised inside the reservation transaction to roll it back"""
+
+
+def reserve_seats(booking, seats=None):
+    """
+    Reserve booking.number_of_seats and insert the booking.
+
+    Bookings for a showtime draw on that showtime's inventory; older bookings
+    without one draw on booking.movie. Either way the seat count is
+    decremented with a single conditional UPDATE
+    (available_seats = available_seats - n WHERE available_seats >= n), which
+    the database serializes per row, so concurrent bookings can never
+    oversell. The booking insert shares the transaction: if it fails, the
+    seats are put back by the rollback.
+
+    For showtimes, `seats` optionally names the seat numbers wanted; otherwise
+    the first free seats are assigned.
+    """
+    if booking.showtime_id:
+        return _reserve_showtime_seats(booking, seats)
+
+    count = booking.number_of_seats
+    with transaction.atomic():
+        reserved = Movie.objects.filter(
+            pk=booking.movie_id,
+            available_seats__gte=count,
+        ).update(available_seats=F('available_seats') - count)
+
+        if not reserved:
+            available = Movie.objects.filter(pk=booking.movie_id).values_list('available_seats', flat=True).first()
+            return SeatReservation(available_seats=available or 0)
+
+        booking.save()
+
+    # Keep the caller's movie instance in step without another query
+    booking.movie.available_seats -= count
+    return SeatReservation(booking=booking, available_seats=booking.movie.available_seats)
+
+
+def _reserve_showtime_seats(booking, seats=None):
+    count = booking.number_of_seats
+    try:
+        with transaction.atomic():
+            # The conditional decrement also takes the row lock for the seat map update
+            reserved = Showtime.objects.filter(
+                pk=booking.showtime_id,
+                available_seats__gte=count,
+            ).update(available_seats=F('available_seats') - count)
+            if not reserved:
+                raise _SeatsTaken
+
+            showtime = Showtime.objects.select_for_update().get(pk=booking.showtime_id)
+            allocated = showtime.allocate_seats(count, seats)
+            if allocated is None:
+                raise _SeatsTaken
+            Showtime.objects.filter(pk=showtime.pk).update(seat_map=showtime.seat_map)
+
+            booking.seat_numbers = ','.join(str(seat) for seat in allocated)
+            booking.save()
+    except _SeatsTaken:
+        available = Showtime.objects.filter(pk=booking.showtime_id).values_list('available_seats', flat=True).first()
+        return SeatReservation(available_seats=available or 0)
+
+    return SeatReservation(booking=booking, available_seats=showtime.available_seats)
+
+
+def release_seats(booking):
+    """
+    Return a booking's seats to its showtime or movie (e.g. when the booking is cancelled)
+    """
+    if not booking.showtime_id:
+        Movie.objects.filter(pk=booking.movie_id).update(
+            available_seats=F('available_seats') + booking.number_of_seats
+        )
+        return
+
+    with transaction.atomic():
+        showtime = Showtime.objects.select_for_update().get(pk=booking.showtime_id)
+        showtime.free_seats(booking.get_seat_numbers())
+        Showtime.objects.filter(pk=showtime.pk).update(
+            seat_map=showtime.seat_map,
+            available_seats=F('available_seats') + booking.number_of_seats,
+        )
@@ -0,0 +1,164 @@
+from functools import partial
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models.signals import pre_save, post_save, post_delete, post_migrate
+from django.dispatch import receiver
+from . import page_cache
+from .autocomplete import suggestion_index
+from .models import Movie, Genre, Showtime, Booking, Review, DailyMovieStat, SiteSetting, StoredFile
+from .page_cache import movie_tag, genre_tag
+from .search import BACKENDS
+
+
+@receiver([post_save, post_delete], sender=SiteSetting)
+def invalidate_site_settings(sender, **kwargs):
+    """Drop cached settings whenever they change (dashboard or Django admin)"""
+    SiteSetting.clear_cache()
+    # Clear again once committed, in case a concurrent request re-cached the old row
+    transaction.on_commit(SiteSetting.clear_cache)
+    page_cache.purge(page_cache.SITE_TAG)
+
+
+@receiver(post_save, sender=Movie)
+def sync_movie_credits(sender, instance, update_fields=None, **kwargs):
+    """Keep the Person/MovieCredit index in step with the cast text"""
+    if update_fields is not None and 'cast' not in update_fields:
+        return
+    instance.sync_credits()
+
+
+@receiver(post_save, sender=Movie)
+def update_movie_suggestions(sender, instance, **kwargs):
+    """Apply the saved movie to the in-memory autocomplete index once committed"""
+    transaction.on_commit(partial(suggestion_index.update_movie, instance))
+
+
+@receiver(post_delete, sender=Movie)
+def remove_movie_suggestions(sender, instance, **kwargs):
+    transaction.on_commit(partial(suggestion_index.remove_movie, instance.pk))
+
+
+def _deleted_with_movie(instance, origin):
+    """True when the row is being removed as part of deleting its own movie"""
+    return isinstance(origin, Movie) and origin.pk == instance.movie_id
+
+
+@receiver(post_delete, sender=Review)
+def discard_review_rating(sender, instance, origin=None, **kwargs):
+    """Keep movie aggregates right for every delete path, including cascades from Account"""
+    if _deleted_with_movie(instance, origin):
+        # The movie row itself is being deleted
+        return
+    instance.discard_rating()
+    DailyMovieStat.record_review(instance, sign=-1)
+
+
+@receiver(post_save, sender=Review)
+def roll_up_review(sender, instance, created, **kwargs):
+    """Add new reviews and edited ratings to the daily rollup"""
+    if created:
+        DailyMovieStat.record_review(instance)
+    elif getattr(instance, '_loaded_rating', None) is not None:
+        DailyMovieStat.record_review(instance, old_rating=instance._loaded_rating)
+    instance._loaded_rating = instance.rating
+
+
+@receiver(post_save, sender=Booking)
+def roll_up_booking(sender, instance, created, **kwargs):
+    """Add new bookings and status changes (cancellations) to the daily rollup"""
+    if created:
+        DailyMovieStat.record_booking(instance)
+    elif getattr(instance, '_loaded_status', None) is not None:
+        DailyMovieStat.record_booking_status(instance, instance._loaded_status)
+    instance._loaded_status = instance.status
+
+
+@receiver(post_delete, sender=Booking)
+def discard_booking(sender, instance, origin=None, **kwargs):
+    """Take deleted bookings out of the daily rollup (the movie's rows go with the movie)"""
+    if _deleted_with_movie(instance, origin):
+        return
+    DailyMovieStat.record_booking(instance, sign=-1)
+
+
+@receiver([post_save, post_delete], sender=Movie)
+def purge_movie_pages(sender, instance, **kwargs):
+    """A movie can enter or leave the home page and any list, so those go with its own pages"""
+    page_cache.purge('home', 'catalog', movie_tag(instance.pk), instance.genre_id and genre_tag(instance.genre_id))
+
+
+@receiver([post_save, post_delete], sender=Genre)
+def purge_genre_pages(sender, instance, **kwargs):
+    page_cache.purge('genres', genre_tag(instance.pk))
+
+
+@receiver([post_save, post_delete], sender=Review)
+def purge_review_pages(sender, instance, **kwargs):
+    """Reviews show on the movie's pages, and its rating can change the featured movie"""
+    page_cache.purge('home', movie_tag(instance.movie_id))
+
+
+@receiver([post_save, post_delete], sender=Showtime)
+def purge_showtime_pages(sender, instance, **kwargs):
+    """Pages showing the movie count the seats of its bookable showtimes"""
+    page_cache.purge(movie_tag(instance.movie_id))
+
+
+@receiver([post_save, post_delete], sender=Booking)
+def purge_booking_pages(sender, instance, **kwargs):
+    """Pages showing the movie display its remaining seats"""
+    page_cache.purge(movie_tag(instance.movie_id))
+
+
+# Reference counts of the content-addressed poster and logo files
+
+def _file_field_name(sender):
+    return dict(StoredFile.FILE_FIELDS)[sender._meta.label]
+
+
+def _stored_name(instance, field_name):
+    return getattr(instance, field_name).name or ''
+
+
+@receiver(pre_save, sender=Movie)
+@receiver(pre_save, sender=SiteSetting)
+def remember_stored_file(sender, instance, update_fields=None, **kwargs):
+    """Look up the file the row used before this save, unless the save can't change it"""
+    field_name = _file_field_name(sender)
+    if instance._state.adding or (update_fields is not None and field_name not in update_fields):
+        return
+    stored = sender.objects.filter(pk=instance.pk).values_list(field_name, flat=True).first()
+    instance._stored_file_name = stored or ''
+
+
+@receiver(post_save, sender=Movie)
+@receiver(post_save, sender=SiteSetting)
+def count_stored_file(sender, instance, created, update_fields=None, **kwargs):
+    field_name = _file_field_name(sender)
+    if not created and not hasattr(instance, '_stored_file_name'):
+        return
+    old_name = '' if created else instance.__dict__.pop('_stored_file_name')
+    new_name = _stored_name(instance, field_name)
+    if new_name != old_name:
+        StoredFile.add_references(new_name, 1)
+        StoredFile.add_references(old_name, -1)
+
+
+@receiver(post_delete, sender=Movie)
+@receiver(post_delete, sender=SiteSetting)
+def release_stored_file(sender, instance, **kwargs):
+    StoredFile.add_references(_stored_name(instance, _file_field_name(sender)), -1)
+
+
+@receiver(post_migrate)
+def repair_search_index(sender, using=DEFAULT_DB_ALIAS, verbosity=1, **kwargs):
+    """Put back search index triggers that a migration rebuilding the movies table dropped"""
+    if sender.name != 'movies':
+        return
+    connection = connections[using]
+    backend = BACKENDS.get(connection.vendor)
+    if backend is None:
+        return
+    recreated = backend().repair_index(connection)
+    if recreated and verbosity >= 1:
+        print(f"  Recreated movie search triggers: {', '.join(recreated)}")
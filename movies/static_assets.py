@@ -0,0 +1,117 @@
+import functools
+import gzip
+import os
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage, staticfiles_storage
+from django.core.files.base import ContentFile
+from django.utils.cache import patch_vary_headers
+from django.views.static import serve
+
+try:
+    import brotli
+except ImportError:  # Optional: only gzip siblings are written without it
+    brotli = None
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# Unhashed names (e.g. a template linking to a file without {% static %}) can change
+REVALIDATE_CACHE_CONTROL = 'public, max-age=0, must-revalidate'
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Manifest-hashed static files with pre-compressed siblings
+
+    On top of the content-hashed copies ("site.3f2a9c1b7d4e.css") that
+    collectstatic writes through ManifestStaticFilesStorage, every text
+    asset gets "<name>.gz" and, when the brotli package is installed,
+    "<name>.br" next to it, so nothing is compressed per request.
+    """
+    COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.map', '.svg', '.json', '.txt', '.xml', '.html')
+    MIN_SIZE = 256  # Smaller files don't gain enough to be worth an extra request path
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        for name in sorted(set(self.hashed_files.values())):
+            if name.endswith(self.COMPRESSIBLE_EXTENSIONS):
+                for compressed_name in self.compress(name):
+                    yield name, compressed_name, True
+
+    def compress(self, name):
+        """Write the compressed siblings of `name` that are smaller than it"""
+        with self.open(name) as original:
+            content = original.read()
+        if len(content) < self.MIN_SIZE:
+            return
+        encoders = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            encoders.append(('.br', lambda data: brotli.compress(data, quality=11)))
+        for suffix, encode in encoders:
+            compressed = encode(content)
+            if len(compressed) < len(content) * 0.95:
+                compressed_name = name + suffix
+                if self.exists(compressed_name):
+                    self.delete(compressed_name)
+                self._save(compressed_name, ContentFile(compressed))
+                yield compressed_name
+
+
+@functools.cache
+def hashed_names():
+    """Names collectstatic gave a content hash, from the manifest (loaded once per process)"""
+    return frozenset(getattr(staticfiles_storage, 'hashed_files', {}).values())
+
+
+# Pre-compressed siblings written by collectstatic, preferred in this order
+# when the client accepts them equally
+PRECOMPRESSED = (('br', '.br'), ('gzip', '.gz'))
+
+
+def accepted_encodings(header):
+    """Content codings in an Accept-Encoding header, mapped to their q-values"""
+    codings = {}
+    for item in header.split(','):
+        coding, *params = (part.strip() for part in item.split(';'))
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        codings[coding.lower()] = quality
+    if 'x-gzip' in codings:
+        codings.setdefault('gzip', codings['x-gzip'])
+    return codings
+
+
+def encoding_quality(codings, coding):
+    """q-value of `coding` in accepted_encodings() output; `*` covers unlisted codings"""
+    return codings.get(coding, codings.get('*', 0.0))
+
+
+def serve_static(request, path):
+    """
+    Serve a collected static file, preferring its pre-compressed sibling
+
+    For deployments without a web server in front of Django (SERVE_STATIC).
+    Hashed names never change content, so they are cached for a year
+    without revalidation; repeat visits don't download them again.
+    """
+    document_root = settings.STATIC_ROOT
+    codings = accepted_encodings(request.headers.get('Accept-Encoding', ''))
+    served_path = path
+    # Highest q-value first; sorted() keeps PRECOMPRESSED order on ties
+    for encoding, suffix in sorted(PRECOMPRESSED, key=lambda item: -encoding_quality(codings, item[0])):
+        if encoding_quality(codings, encoding) > 0 and os.path.isfile(os.path.join(document_root, path + suffix)):
+            served_path = path + suffix  # serve() sets Content-Encoding from the suffix
+            break
+    response = serve(request, served_path, document_root=document_root)
+    patch_vary_headers(response, ['Accept-Encoding'])
+    response['Cache-Control'] = IMMUTABLE_CACHE_CONTROL if path in hashed_names() else REVALIDATE_CACHE_CONTROL
+    return response
@@ -0,0 +1,87 @@
+import hashlib
+import os
+import posixpath
+import re
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+from django.views.static import serve
+
+# "<sha256>.jpg" and files derived from one, e.g. the poster variant "<sha256>.240w.webp"
+CONTENT_ADDRESSED_NAME = re.compile(r'(?:^|/)[0-9a-f]{64}\.[^/]+$')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def is_content_addressed(name):
+    return bool(CONTENT_ADDRESSED_NAME.search(name))
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Media storage that names every file after the SHA-256 of its bytes
+
+    Uploads are hashed while they are streamed to a temporary file in the
+    target directory, then moved to "<directory>/<sha256><ext>". Saving bytes
+    that are already stored keeps the existing file, so a poster uploaded
+    twice exists once. Since a name always means the same bytes, its URL can
+    be cached forever. How many rows use each file is tracked in StoredFile;
+    `manage.py collect_media_garbage` deletes the files nothing uses.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # The final name comes from the content; equal names are the point
+        return name
+
+    def _save(self, name, content):
+        directory = posixpath.dirname(name)
+        extension = posixpath.splitext(name)[1].lower()
+        digest = hashlib.sha256()
+        temp_path = self._write_temporary(directory, content, digest)
+        name = posixpath.join(directory, digest.hexdigest() + extension)
+        if os.path.exists(self.path(name)):
+            os.remove(temp_path)
+        else:
+            os.replace(temp_path, self.path(name))
+        return name
+
+    def save_derived(self, name, content):
+        """
+        Store a file computed from a stored one (e.g. a poster variant) as `name`
+
+        The name is kept as given and replaces any previous version, so
+        derived files can be found from their source's name.
+        """
+        temp_path = self._write_temporary(posixpath.dirname(name), content)
+        os.replace(temp_path, self.path(name))
+        return name
+
+    def _write_temporary(self, directory, content, digest=None):
+        """Stream `content` into a temporary file next to its destination"""
+        full_directory = self.path(directory)
+        os.makedirs(full_directory, exist_ok=True)
+        if self.directory_permissions_mode is not None:
+            os.chmod(full_directory, self.directory_permissions_mode)
+        fd, temp_path = tempfile.mkstemp(dir=full_directory, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                for chunk in content.chunks():
+                    if digest is not None:
+                        digest.update(chunk)
+                    temp_file.write(chunk)
+            if self.file_permissions_mode is not None:
+                os.chmod(temp_path, self.file_permissions_mode)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        return temp_path
+
+
+content_addressed_storage = ContentAddressedStorage()
+
+
+def serve_media(request, path, document_root=None):
+    """django.views.static.serve, marking content-addressed files as immutable"""
+    response = serve(request, path, document_root=document_root)
+    if is_content_addressed(path):
+        response['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response
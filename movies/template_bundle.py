@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from django.apps import apps
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.http import HttpRequest
+from django.template import engines
+from django.utils import timezone
+
+from .models import Genre, Movie
+
+TEMPLATE_APPS = ('movies', 'accounts')
+
+
+def template_names():
+    """Names of every template shipped with the project's apps, e.g. 'User/home.html'"""
+    names = []
+    for app_label in TEMPLATE_APPS:
+        root = Path(apps.get_app_config(app_label).path) / 'templates'
+        names.extend(path.relative_to(root).as_posix() for path in sorted(root.rglob('*.html')))
+    return names
+
+
+def preload_templates():
+    """
+    Compile every project template into the engine's cached loader
+
+    Called at worker boot (see wsgi.py/asgi.py) so no request pays the
+    parse cost. Returns the number of templates loaded.
+    """
+    engine = engines['django']
+    names = template_names()
+    for name in names:
+        engine.get_template(name)
+    return len(names)
+
+
+def sample_context():
+    """Unsaved placeholder objects for the templates that need a movie to render"""
+    now = timezone.now()
+    genre = Genre(id=0, name='Sample', created_at=now, updated_at=now)
+    movie = Movie(
+        id=0, title='Sample', description='', genre=genre, duration=90,
+        release_date=now.date(), director='', cast='', created_at=now, updated_at=now,
+    )
+    # As if annotated by with_showtime_seats(), so bookable_seats() needs no query
+    movie.showtime_seats = None
+    return {'movie': movie, 'featured_movie': movie}
+
+
+def warm_up_template(name):
+    """Render a template once for an anonymous visitor; raises whatever rendering raises"""
+    request = HttpRequest()
+    request.method = 'GET'
+    request.path = request.path_info = '/'
+    request.user = AnonymousUser()
+    request.session = {}
+    request._messages = FallbackStorage(request)
+    engines['django'].get_template(name).render(sample_context(), request)
@@ -0,0 +1,77 @@
+import hashlib
+
+from django import template
+from django.core.cache import cache
+from django.utils.safestring import mark_safe
+
+register = template.Library()
+
+FRAGMENT_KEY_PREFIX = 'movies:fragment:'
+FRAGMENT_TIMEOUT = 24 * 60 * 60  # Keys change with the movie, so old fragments just expire
+
+
+def fragment_version(movie, authenticated):
+    """
+    Everything a movie fragment renders that can change without a new key
+
+    updated_at moves on every movie save and rating change; seat counts and
+    genre renames are written without touching the movie's updated_at, so
+    they are part of the version too.
+    """
+    genre = movie.genre
+    parts = (
+        movie.updated_at.isoformat(),
+        movie.review_count,
+        movie.rating_sum,
+        movie.available_seats,
+        genre.pk if genre else None,
+        genre.updated_at.isoformat() if genre else None,
+        authenticated,
+    )
+    return hashlib.md5(repr(parts).encode()).hexdigest()
+
+
+def render_movie_fragments(context, movies, template_name):
+    """
+    Render `template_name` once per movie, reusing cached copies
+
+    Every fragment is looked up in a single get_many call; only the misses
+    are rendered (with `movie` in the context) and written back together.
+    """
+    movies = list(movies)
+    if not movies:
+        return ''
+    user = context.get('user')
+    authenticated = bool(user and user.is_authenticated)
+    keys = [
+        f'{FRAGMENT_KEY_PREFIX}{template_name}:{movie.pk}:{fragment_version(movie, authenticated)}'
+        for movie in movies
+    ]
+    fragments = cache.get_many(keys)
+    
+    missing = {}
+    fragment_template = None
+    for key, movie in zip(keys, movies):
+        if key in fragments:
+            continue
+        if fragment_template is None:
+            fragment_template = context.template.engine.get_template(template_name)
+        with context.push(movie=movie):
+            missing[key] = fragment_template.render(context)
+    if missing:
+        cache.set_many(missing, FRAGMENT_TIMEOUT)
+        fragments.update(missing)
+    
+    return mark_safe(''.join(fragments[key] for key in keys))
+
+
+@register.simple_tag(takes_context=True)
+def movie_cards(context, movies, template_name):
+    """{% movie_cards movies 'includes/now_showing_card.html' %}"""
+    return render_movie_fragments(context, movies, template_name)
+
+
+@register.simple_tag(takes_context=True)
+def movie_fragment(context, template_name, movie):
+    """{% movie_fragment 'includes/featured_hero.html' featured_movie %}"""
+    return render_movie_fragments(context, [movie], template_name)
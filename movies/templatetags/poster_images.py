@@ -0,0 +1,22 @@
+from django import template
+from django.utils.html import format_html
+
+register = template.Library()
+
+# CSS width each layout shows a poster at, for the browser to pick a variant
+POSTER_SIZES = {
+    'thumbnail': '100px',                           # Admin movie form previews
+    'card': '(min-width: 576px) 270px, 100vw',      # Catalog and home grid cards
+    'side': '(min-width: 768px) 240px, 100vw',      # Booking and review forms
+    'detail': '(min-width: 768px) 440px, 100vw',    # Movie detail page
+    'hero': '100vw',                                # Featured movie background
+}
+
+
+@register.simple_tag
+def poster_attrs(movie, layout):
+    """<img {% poster_attrs movie 'card' %} ...>: src plus srcset/sizes over the poster's variants"""
+    srcset = movie.poster_srcset()
+    if not srcset:
+        return format_html('src="{}"', movie.poster.url)
+    return format_html('src="{}" srcset="{}" sizes="{}"', movie.poster.url, srcset, POSTER_SIZES[layout])
@@ -1,3 +1,1545 @@
-from django.test import TestCase
+import datetime
+import gzip
+import io
+import os
+import posixpath
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.apps import apps
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.core.management import call_command
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.db import connection, OperationalError
+from django.db.models import Avg, Count
+from django.http import Http404
+from django.template import Context, Engine, engines
+from django.template.loaders.app_directories import Loader as AppDirectoriesLoader
+from django.template.loaders.cached import Loader as CachedLoader
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+
+from accounts.models import Account
+from . import api, async_views, views
+from .autocomplete import suggestion_index
+from .dashboard import DashboardStats, growth_percent
+from .forms import BookingForm, MovieForm
+from .models import Genre, Movie, Person, Showtime, Booking, Review, DailyMovieStat, SiteSetting, StoredFile
+from .pagination import MAX_PAGE_SIZE, get_page_size, keyset_paginate, paginate
+from .posters import variant_name
+from .routers import ReplicaRouter, read_from_replica, replica_reads
+from .search import get_search_backend, PUBLIC_FIELDS
+from .static_assets import hashed_names, serve_static
+from .template_bundle import preload_templates, template_names
+from .services import reserve_seats, release_seats
+from .signals import repair_search_index
+from .storage import content_addressed_storage, serve_media
+from .uploads import LimitedTemporaryFileUploadHandler
+
+
+def create_movie(**kwargs):
+    fields = {
+        'title': 'Test Movie',
+        'description': 'A test movie',
+        'duration': 120,
+        'release_date': datetime.date(2025, 1, 1),
+        'director': 'Director',
+        'cast': 'Actor One, Actor Two',
+        'ticket_price': 10,
+    }
+    fields.update(kwargs)
+    return Movie.objects.create(**fields)
+
+
+class SiteSettingCacheTests(TestCase):
+    def setUp(self):
+        SiteSetting.get_settings()
+        cache.clear()
+        SiteSetting.clear_cache()
+        # Don't leave this test's settings row cached for the next tests
+        self.addCleanup(SiteSetting.clear_cache)
+
+    def test_cached_reads_make_no_queries(self):
+        with self.assertNumQueries(1):
+            settings = SiteSetting.get_cached_settings()
+        with self.assertNumQueries(0):
+            self.assertIs(SiteSetting.get_cached_settings(), settings)
+        # Another worker: a cold in-process copy is refilled from the shared cache
+        SiteSetting._local_cache = (None, 0.0)
+        with self.assertNumQueries(0):
+            self.assertEqual(SiteSetting.get_cached_settings().site_name, settings.site_name)
+
+    def test_saving_settings_clears_the_cached_copy(self):
+        self.client.force_login(Account.objects.create(username='admin', role='admin'))
+        self.assertEqual(SiteSetting.get_cached_settings().site_name, 'Movie Management System')
+        response = self.client.post('/dashboard/settings/', {'site_name': 'Renamed Cinema', 'items_per_page': 12})
+        self.assertRedirects(response, '/dashboard/settings/')
+        self.assertEqual(SiteSetting.get_cached_settings().site_name, 'Renamed Cinema')
+        self.assertEqual(SiteSetting.get_cached_settings().items_per_page, 12)
+
+
+class PaginationTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        # Equal timestamps, so keyset pages have to break ties on the id
+        created_at = timezone.now()
+        for i in range(7):
+            create_movie(title=f'Movie {i}')
+        Movie.objects.update(created_at=created_at)
+        self.set_page_size(3)
+        self.addCleanup(SiteSetting.clear_cache)
+
+    def set_page_size(self, size):
+        SiteSetting.get_settings()
+        SiteSetting.objects.update(items_per_page=size)
+        SiteSetting.clear_cache()
+
+    def keyset_page(self, **params):
+        return keyset_paginate(self.factory.get('/', params), Movie.objects.all(), 'created_at')
+
+    def test_keyset_cursors_round_trip(self):
+        expected = list(Movie.objects.order_by('-created_at', '-pk').values_list('pk', flat=True))
+        pages, page = [], self.keyset_page()
+        while True:
+            pages.append([movie.pk for movie in page])
+            if not page.has_next():
+                break
+            page = self.keyset_page(after=page.next_cursor)
+        self.assertEqual([len(rows) for rows in pages], [3, 3, 1])
+        self.assertEqual(sum(pages, []), expected)
+        # And back again from the last page
+        self.assertTrue(page.has_previous())
+        self.assertEqual([movie.pk for movie in self.keyset_page(before=page.previous_cursor)], pages[1])
+        self.assertFalse(self.keyset_page(before=self.keyset_page(after=self.keyset_page().next_cursor).previous_cursor).has_previous())
+
+    def test_malformed_cursors_show_the_first_page(self):
+        first = [movie.pk for movie in self.keyset_page()]
+        for cursor in ('', 'not-a-cursor', '%%%', 'WyJub3QgYSBkYXRlIiwgMV0', 'WzFd'):
+            with self.subTest(cursor=cursor):
+                self.assertEqual([movie.pk for movie in self.keyset_page(after=cursor)], first)
+                self.assertEqual([movie.pk for movie in self.keyset_page(before=cursor)], first)
+
+    def test_page_numbers(self):
+        queryset = Movie.objects.order_by('pk')
+        self.assertEqual(len(paginate(self.factory.get('/', {'page': 3}), queryset)), 1)
+        self.assertEqual(paginate(self.factory.get('/', {'page': 99}), queryset).number, 3)
+        self.assertEqual(paginate(self.factory.get('/', {'page': 'x'}), queryset).number, 1)
+
+    def test_page_size_is_clamped(self):
+        for stored, expected in ((0, 1), (-5, 1), (1000, MAX_PAGE_SIZE), (7, 7)):
+            with self.subTest(stored=stored):
+                self.set_page_size(stored)
+                self.assertEqual(get_page_size(), expected)
+                self.assertEqual(len(paginate(self.factory.get('/'), Movie.objects.all())), min(expected, 7))
+                self.assertEqual(len(self.keyset_page()), min(expected, 7))
+
+    def test_settings_reject_invalid_page_size(self):
+        self.client.force_login(Account.objects.create(username='admin', role='admin'))
+        for value in ('0', '-3', '1000', 'ten', '²', ''):
+            with self.subTest(value=value):
+                response = self.client.post('/dashboard/settings/', {'site_name': 'Renamed', 'items_per_page': value}, follow=True)
+                self.assertContains(response, 'Settings not saved')
+                self.assertEqual(SiteSetting.objects.get().items_per_page, 3)
+                self.assertNotEqual(SiteSetting.objects.get().site_name, 'Renamed')
+
+
+class ReviewModerationTests(TestCase):
+    def setUp(self):
+        self.client.force_login(Account.objects.create(username='admin', role='admin'))
+        self.movie = create_movie()
+        self.review = Review.objects.create(
+            user=Account.objects.create(username='critic'), movie=self.movie, rating=4, comment='Good',
+        )
+
+    def moderate(self, action):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(f'/dashboard/reviews/{self.review.pk}/{action}/')
+        return [query['sql'] for query in queries if query['sql'].startswith('UPDATE')]
+
+    def assert_aggregates(self, count, total):
+        self.movie.refresh_from_db()
+        self.assertEqual((self.movie.review_count, self.movie.rating_sum), (count, total))
+
+    def test_approving_twice_counts_once(self):
+        self.assertEqual(len(self.moderate('approve')), 2)  # The review and the movie aggregates
+        self.assert_aggregates(1, 4)
+        self.assertEqual(self.moderate('approve'), [])
+        self.assert_aggregates(1, 4)
+
+    def test_rejecting_twice_discounts_once(self):
+        self.moderate('approve')
+        self.assertEqual(len(self.moderate('reject')), 2)
+        self.assert_aggregates(0, 0)
+        self.assertEqual(self.moderate('reject'), [])
+        self.assert_aggregates(0, 0)
+
+
+class ReviewAggregateTests(TestCase):
+    """The incremental review_count/rating_sum deltas must match a full recompute"""
+
+    def setUp(self):
+        self.movies = [create_movie(title='First'), create_movie(title='Second')]
+        self.users = [Account.objects.create(username=f'critic{i}') for i in range(3)]
+
+    def assert_consistent(self):
+        for movie in Movie.objects.all():
+            expected = Review.objects.filter(movie=movie, is_approved=True).aggregate(count=Count('id'), average=Avg('rating'))
+            self.assertEqual(movie.review_count, expected['count'], movie)
+            self.assertEqual(movie.get_review_count(), expected['count'], movie)
+            self.assertEqual(movie.average_rating(), round(expected['average'] or 0, 1), movie)
+            self.assertEqual(float(movie.rating), round(expected['average'] or 0, 1), movie)
+
+    def review(self, user, movie, rating, approved=True):
+        return Review.objects.create(user=user, movie=movie, rating=rating, comment='Text', is_approved=approved)
+
+    def test_lifecycle(self):
+        first, second = self.movies
+        approved = self.review(self.users[0], first, 5)
+        pending = self.review(self.users[1], first, 2, approved=False)
+        self.review(self.users[2], first, 3)
+        self.review(self.users[0], second, 4)
+        self.assert_consistent()
+
+        pending.is_approved = True
+        pending.save()
+        self.assert_consistent()
+
+        approved.is_approved = False
+        approved.save(update_fields=['is_approved', 'updated_at'])
+        self.assert_consistent()
+
+        pending.rating = 5
+        pending.save()
+        self.assert_consistent()
+
+        # Loaded without the rating state, e.g. by the admin with deferred fields
+        edited = Review.objects.only('id', 'comment').get(pk=pending.pk)
+        edited.rating, edited.movie_id, edited.is_approved = 1, pending.movie_id, True
+        edited.save()
+        self.assert_consistent()
+
+        pending.refresh_from_db()
+        pending.movie = second
+        pending.save()
+        self.assert_consistent()
+
+        pending.delete()
+        self.assert_consistent()
+
+    def test_saving_a_stale_movie_keeps_newer_aggregates(self):
+        first = self.movies[0]
+        Movie.objects.filter(pk=first.pk).update(genre=Genre.objects.create(name='Drama'))
+        stale = Movie.objects.get(pk=first.pk)
+        admin_copy = Movie.objects.get(pk=first.pk)
+        self.review(self.users[0], first, 5)
+        stale.title = 'Renamed'
+        stale.save()
+        self.assert_consistent()
+        self.assertEqual(Movie.objects.get(pk=first.pk).title, 'Renamed')
+
+        # The same through the dashboard's edit form, posted from a page loaded before the review
+        self.client.force_login(Account.objects.create(username='admin', role='admin'))
+        form = MovieForm(instance=admin_copy)
+        data = {name: form[name].value() for name in form.fields if name != 'poster'}
+        self.review(self.users[1], first, 1)
+        data.update(title='Edited', rating=9)
+        response = self.client.post(f'/dashboard/movies/{first.pk}/edit/', {k: v for k, v in data.items() if v is not None})
+        self.assertEqual(response.status_code, 302)
+        self.assert_consistent()
+        self.assertEqual(Movie.objects.get(pk=first.pk).title, 'Edited')
+        self.assertNotIn('rating', MovieForm.base_fields)
+
+    def test_cascade_deletes(self):
+        first, second = self.movies
+        for user in self.users:
+            self.review(user, first, 4)
+            self.review(user, second, 2)
+        self.users[0].delete()
+        self.assert_consistent()
+        first.delete()
+        self.assert_consistent()
+        self.assertEqual(Movie.objects.get().review_count, 2)
+
+
+class SeatReservationTests(TestCase):
+    def setUp(self):
+        self.user = Account.objects.create_user(username='viewer', password='pass12345')
+        self.movie = create_movie(available_seats=5)
+
+    def make_booking(self, seats):
+        return Booking(
+            user=self.user,
+            movie=self.movie,
+            show_date=datetime.date(2025, 1, 2),
+            show_time=datetime.time(19, 30),
+            number_of_seats=seats,
+            total_price=self.movie.ticket_price * seats,
+            status='confirmed',
+        )
+
+    def test_reserve_decrements_and_saves_booking(self):
+        reservation = reserve_seats(self.make_booking(3))
+        self.assertFalse(reservation.sold_out)
+        self.assertIsNotNone(reservation.booking.pk)
+        self.movie.refresh_from_db()
+        self.assertEqual(self.movie.available_seats, 2)
+
+    def test_sold_out_leaves_no_booking(self):
+        reservation = reserve_seats(self.make_booking(6))
+        self.assertTrue(reservation.sold_out)
+        self.assertEqual(reservation.available_seats, 5)
+        self.assertFalse(Booking.objects.exists())
+
+    def test_book_view_reports_sold_out(self):
+        self.client.login(username='viewer', password='pass12345')
+        response = self.client.post(f'/movies/{self.movie.id}/book/', {
+            'show_date': '2025-01-02',
+            'show_time': '19:30',
+            'number_of_seats': 6,
+            'payment_method': 'Cash',
+        })
+        self.assertContains(response, 'Not enough seats available!')
+        self.assertFalse(Booking.objects.exists())
+
+    def test_cancelling_a_booking_frees_its_seats_once(self):
+        booking = reserve_seats(self.make_booking(3)).booking
+        self.client.force_login(Account.objects.create(username='admin', role='admin'))
+        for _ in range(2):
+            response = self.client.post(f'/dashboard/bookings/{booking.pk}/update/', {'status': 'cancelled'})
+            self.assertRedirects(response, '/dashboard/bookings/', fetch_redirect_response=False)
+            self.movie.refresh_from_db()
+            self.assertEqual(self.movie.available_seats, 5)
+        booking.refresh_from_db()
+        self.assertEqual(booking.status, 'cancelled')
+
+
+class ConcurrentSeatReservationTests(TransactionTestCase):
+    """
+    Load test: hundreds of simultaneous bookings against one movie must never
+    sell more seats than it has. Requests are released in waves of WORKERS
+    threads that hit the database at the same instant.
+    """
+    REQUESTS = 300
+    WORKERS = 100
+    CAPACITY = 120
+
+    def test_concurrent_bookings_never_oversell(self):
+        users = Account.objects.bulk_create(
+            Account(username=f'user{i}') for i in range(self.REQUESTS)
+        )
+        movie = create_movie(available_seats=self.CAPACITY)
+        start = threading.Barrier(self.WORKERS)
+
+        def book(user):
+            start.wait()
+            seats = 1 + user.pk % 2
+            booking = Booking(
+                user=user,
+                movie=Movie(pk=movie.pk, available_seats=0),
+                show_date=datetime.date(2025, 1, 2),
+                show_time=datetime.time(19, 30),
+                number_of_seats=seats,
+                total_price=10 * seats,
+                status='confirmed',
+            )
+            try:
+                # A client retries while the database reports lock contention
+                while True:
+                    try:
+                        return seats if reserve_seats(booking) else 0
+                    except OperationalError:
+                        time.sleep(random.uniform(0.01, 0.05))
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=self.WORKERS) as pool:
+            sold = sum(pool.map(book, users))
+
+        movie.refresh_from_db()
+        booked = sum(Booking.objects.values_list('number_of_seats', flat=True))
+        self.assertGreaterEqual(movie.available_seats, 0)
+        self.assertEqual(sold, booked)
+        self.assertEqual(movie.available_seats, self.CAPACITY - booked)
+        # Demand exceeds capacity, so the movie must end up (nearly) sold out
+        self.assertLessEqual(movie.available_seats, 1)
+
+
+class ShowtimeReservationTests(TestCase):
+    def setUp(self):
+        self.user = Account.objects.create(username='viewer')
+        self.movie = create_movie(available_seats=50)
+        self.showtime = Showtime.objects.create(
+            movie=self.movie,
+            auditorium='Hall 1',
+            start_time=timezone.now() + datetime.timedelta(days=1),
+            capacity=10,
+        )
+
+    def make_booking(self, seats):
+        return Booking(
+            user=self.user,
+            movie=self.movie,
+            showtime=self.showtime,
+            show_date=datetime.date(2025, 1, 2),
+            show_time=datetime.time(19, 30),
+            number_of_seats=seats,
+            total_price=self.movie.ticket_price * seats,
+            status='confirmed',
+        )
+
+    def test_new_showtime_starts_empty(self):
+        self.assertEqual(self.showtime.available_seats, 10)
+        self.assertEqual(len(self.showtime.seat_map), 2)
+        self.assertEqual(self.showtime.taken_seats(), [])
+
+    def test_reserve_marks_seats_and_leaves_movie_untouched(self):
+        reservation = reserve_seats(self.make_booking(3))
+        self.assertFalse(reservation.sold_out)
+        self.assertEqual(reservation.booking.get_seat_numbers(), [1, 2, 3])
+        self.showtime.refresh_from_db()
+        self.movie.refresh_from_db()
+        self.assertEqual(self.showtime.available_seats, 7)
+        self.assertEqual(self.showtime.taken_seats(), [1, 2, 3])
+        self.assertEqual(self.movie.available_seats, 50)
+
+    def test_requested_seat_already_taken(self):
+        reserve_seats(self.make_booking(1), seats=[9])
+        reservation = reserve_seats(self.make_booking(2), seats=[8, 9])
+        self.assertTrue(reservation.sold_out)
+        self.showtime.refresh_from_db()
+        self.assertEqual(self.showtime.available_seats, 9)
+        self.assertEqual(self.showtime.taken_seats(), [9])
+
+    def test_release_frees_seats(self):
+        booking = reserve_seats(self.make_booking(4)).booking
+        release_seats(booking)
+        self.showtime.refresh_from_db()
+        self.assertEqual(self.showtime.available_seats, 10)
+        self.assertEqual(self.showtime.taken_seats(), [])
+
+    def test_booking_form_uses_showtimes(self):
+        form = BookingForm({
+            'showtime': self.showtime.pk,
+            'number_of_seats': 2,
+            'payment_method': 'Cash',
+        }, movie=self.movie)
+        self.assertNotIn('show_date', form.fields)
+        self.assertTrue(form.is_valid(), form.errors)
+        booking = form.save(commit=False)
+        self.assertEqual(booking.show_date, timezone.localtime(self.showtime.start_time).date())
+
+    def test_book_view_reports_the_showtime_seats_when_sold_out(self):
+        reserve_seats(self.make_booking(8))
+        self.client.force_login(self.user)
+        response = self.client.post(f'/movies/{self.movie.id}/book/', {
+            'showtime': self.showtime.pk,
+            'number_of_seats': 3,
+            'payment_method': 'Cash',
+        })
+        self.assertContains(response, 'Not enough seats available!')
+        self.assertContains(response, 'Only 2 seats left for the')
+        self.assertEqual(response.context['movie'].available_seats, 50)
+        self.assertEqual(response.context['showtime_seats'], 2)
+
+    def test_pages_show_the_seats_left_in_bookable_showtimes(self):
+        Showtime.objects.create(
+            movie=self.movie, auditorium='Hall 2',
+            start_time=timezone.now() + datetime.timedelta(days=2), capacity=6,
+        )
+        Showtime.objects.create(
+            movie=self.movie, auditorium='Hall 3',
+            start_time=timezone.now() - datetime.timedelta(days=1), capacity=30,
+        )
+        reserve_seats(self.make_booking(4))
+        self.assertEqual(Movie.objects.with_showtime_seats().get(pk=self.movie.pk).bookable_seats(), 12)
+        self.assertEqual(self.movie.bookable_seats(), 12)
+        self.assertContains(self.client.get(f'/movies/{self.movie.id}/'), 'Available Seats:</strong> 12')
+        self.assertContains(self.client.get('/'), '<i class="bi bi-people"></i> 12')
+
+    def test_movie_without_bookable_showtimes_uses_its_own_seats(self):
+        reserve_seats(self.make_booking(10))
+        movie = Movie.objects.with_showtime_seats().get(pk=self.movie.pk)
+        self.assertIsNone(movie.showtime_seats)
+        self.assertEqual(movie.bookable_seats(), 50)
+        self.assertTrue(movie.is_available())
+
+
+class DailyMovieStatTests(TestCase):
+    FIELDS = ('date', 'movie_id', 'bookings', 'seats_sold', 'revenue', 'reviews') + DailyMovieStat.RATING_FIELDS
+
+    def setUp(self):
+        self.users = [Account.objects.create(username=f'user{i}') for i in range(3)]
+        self.movie = create_movie()
+
+    def book(self, user, seats, status='confirmed'):
+        return Booking.objects.create(
+            user=user, movie=self.movie, show_date=datetime.date(2025, 1, 2),
+            show_time=datetime.time(19, 30), number_of_seats=seats,
+            total_price=10 * seats, status=status,
+        )
+
+    def snapshot(self):
+        return list(DailyMovieStat.objects.order_by('date', 'movie_id').values_list(*self.FIELDS))
+
+    def test_incremental_updates_match_rebuild(self):
+        self.book(self.users[0], 2)
+        self.book(self.users[1], 3, status='pending')
+        cancelled = self.book(self.users[2], 4)
+        Review.objects.create(user=self.users[0], movie=self.movie, rating=4, comment='Good')
+        edited = Review.objects.create(user=self.users[1], movie=self.movie, rating=2, comment='Meh')
+
+        booking = Booking.objects.get(pk=cancelled.pk)
+        booking.status = 'cancelled'
+        booking.save()
+        review = Review.objects.get(pk=edited.pk)
+        review.rating = 5
+        review.save()
+        Booking.objects.filter(user=self.users[1]).delete()
+        self.users[0].delete()
+
+        stat = DailyMovieStat.objects.get()
+        self.assertEqual((stat.bookings, stat.seats_sold, stat.revenue, stat.reviews), (1, 0, 0, 1))
+        self.assertEqual((stat.rating_2, stat.rating_5), (0, 1))
+
+        incremental = self.snapshot()
+        DailyMovieStat.rebuild()
+        self.assertEqual(incremental, self.snapshot())
+
+    def test_deleting_movie_drops_its_rows(self):
+        self.book(self.users[0], 1)
+        self.movie.delete()
+        self.assertFalse(DailyMovieStat.objects.exists())
+
+
+class DashboardStatsTests(TestCase):
+    NOW = timezone.make_aware(datetime.datetime(2025, 6, 15, 12))
+
+    def days_ago(self, days):
+        return self.NOW - datetime.timedelta(days=days)
+
+    def setUp(self):
+        drama, comedy = Genre.objects.create(name='Drama'), Genre.objects.create(name='Comedy')
+        Genre.objects.create(name='Empty')
+        movies = []
+        for days, genre in ((5, drama), (10, None), (40, drama), (100, comedy)):
+            movie = create_movie(genre=genre)
+            Movie.objects.filter(pk=movie.pk).update(created_at=self.days_ago(days))
+            movies.append(movie)
+        users = []
+        for days in (1, 2, 45):
+            user = Account.objects.create(username=f'user{days}')
+            Account.objects.filter(pk=user.pk).update(created_at=self.days_ago(days))
+            users.append(user)
+        Account.objects.create(username='admin', role='admin')
+
+        for days, movie, status in ((2, movies[0], 'pending'), (35, movies[0], 'confirmed'), (70, movies[2], 'cancelled')):
+            booking = Booking.objects.create(
+                user=users[0], movie=movie, show_date=datetime.date(2025, 7, 1), show_time=datetime.time(19, 30),
+                number_of_seats=2, total_price=20, status=status,
+            )
+            Booking.objects.filter(pk=booking.pk).update(booking_date=self.days_ago(days))
+        for days, user, movie, rating in ((3, users[0], movies[0], 5), (4, users[1], movies[0], 4),
+                                          (50, users[2], movies[2], 4), (80, users[0], movies[2], 1)):
+            review = Review.objects.create(user=user, movie=movie, rating=rating, comment='Text')
+            Review.objects.filter(pk=review.pk).update(created_at=self.days_ago(days))
+        # The rows were backdated after the signals had filed them under today
+        DailyMovieStat.rebuild()
+
+    def test_context_matches_fixture(self):
+        with self.assertNumQueries(6):
+            context = DashboardStats(now=self.NOW).as_context()
+        self.assertEqual(context, {
+            'total_movies': 4,
+            'total_users': 3,
+            'total_bookings': 3,
+            'total_reviews': 4,
+            'pending_bookings': 1,
+            'movies_growth': 100.0,  # 2 in the last 30 days, 1 in the 30 before
+            'users_growth': 100.0,
+            'reviews_growth': 100.0,
+            'monthly_activity': [
+                {'month': 'Jan', 'bookings': 0, 'reviews': 0},
+                {'month': 'Feb', 'bookings': 0, 'reviews': 0},
+                {'month': 'Mar', 'bookings': 0, 'reviews': 1},
+                {'month': 'Apr', 'bookings': 1, 'reviews': 1},
+                {'month': 'May', 'bookings': 1, 'reviews': 0},
+                {'month': 'Jun', 'bookings': 1, 'reviews': 2},
+            ],
+            'movies_by_genre': [{'genre': 'Comedy', 'count': 1}, {'genre': 'Drama', 'count': 2}],
+            'rating_distribution': [
+                {'rating': '1 Star', 'count': 1},
+                {'rating': '2 Stars', 'count': 0},
+                {'rating': '3 Stars', 'count': 0},
+                {'rating': '4 Stars', 'count': 2},
+                {'rating': '5 Stars', 'count': 1},
+            ],
+        })
+
+    def test_async_context_matches(self):
+        stats = DashboardStats(now=self.NOW)
+        with self.assertNumQueries(6):
+            context = async_to_sync(stats.async_dashboard_context)()
+        self.assertEqual(context, stats.as_context())
+
+    def test_totals(self):
+        with self.assertNumQueries(3):
+            totals = DashboardStats(now=self.NOW).totals()
+        self.assertEqual(totals, {'total_movies': 4, 'total_users': 3, 'total_bookings': 3, 'total_reviews': 4})
+
+    def test_growth_without_baseline(self):
+        self.assertEqual(growth_percent(3, 0), 0)
+        self.assertEqual(growth_percent(1, 4), -75.0)
+
+
+class MovieSearchTests(TestCase):
+    def setUp(self):
+        self.backend = get_search_backend()
+        self.starship = create_movie(title='Starship Voyage', director='Ann Lee', cast='Mia Stone')
+        self.drama = create_movie(title='Quiet Rooms', director='Bo Park', cast='Lars Starling',
+                                  description='A starship captain retires')
+
+    def titles(self, query, fields=PUBLIC_FIELDS):
+        return [movie.title for movie in self.backend.search(Movie.objects.all(), query, fields)]
+
+    def test_prefix_matches_ranked_by_field(self):
+        self.assertEqual(self.titles('star'), ['Starship Voyage', 'Quiet Rooms'])
+        self.assertEqual(self.titles('starship'), ['Starship Voyage'])
+        self.assertEqual(self.titles('starship', fields=('title', 'description')), ['Starship Voyage', 'Quiet Rooms'])
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self.titles('quiet lars'), ['Quiet Rooms'])
+        self.assertEqual(self.titles('quiet mia'), [])
+
+    def test_operators_and_punctuation_are_plain_text(self):
+        self.assertEqual(self.titles('"star" (* -:^'), ['Starship Voyage', 'Quiet Rooms'])
+        self.assertEqual(self.titles('***'), [])
+
+    def test_index_follows_movie_writes(self):
+        self.starship.title = 'Galaxy Voyage'
+        self.starship.save()
+        self.assertEqual(self.titles('galaxy'), ['Galaxy Voyage'])
+        self.assertEqual(self.titles('starship'), [])
+        self.drama.delete()
+        self.assertEqual(self.titles('quiet'), [])
+
+    @skipUnless(connection.vendor == 'sqlite', 'FTS5 triggers are SQLite only')
+    def test_migrate_restores_dropped_triggers(self):
+        triggers = "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'movies_fts_%' ORDER BY name"
+        with connection.cursor() as cursor:
+            cursor.execute(triggers)
+            self.assertEqual([row[0] for row in cursor.fetchall()], sorted(self.backend.TRIGGERS))
+            # What a migration that rebuilds the movies table leaves behind
+            cursor.execute('DROP TRIGGER movies_fts_update')
+            cursor.execute('DROP TRIGGER movies_fts_insert')
+        self.starship.title = 'Galaxy Voyage'
+        self.starship.save()
+        create_movie(title='Starlight Express')
+        self.assertEqual(self.titles('galaxy'), [])
+
+        repair_search_index(sender=apps.get_app_config('movies'), using=connection.alias, verbosity=0)
+        self.assertEqual(self.titles('galaxy'), ['Galaxy Voyage'])
+        self.assertEqual(self.titles('starlight'), ['Starlight Express'])
+        self.drama.title = 'Loud Rooms'
+        self.drama.save()
+        self.assertEqual(self.titles('loud'), ['Loud Rooms'])
+        self.assertEqual(self.backend.repair_index(connection), [])
+
+    def test_admin_search_includes_genre_names(self):
+        self.drama.genre = Genre.objects.create(name='Documentary')
+        self.drama.save()
+        self.client.force_login(Account.objects.create(username='admin', role='admin'))
+        response = self.client.get('/dashboard/movies/', {'search': 'docu'})
+        self.assertEqual([movie.title for movie in response.context['movies']], ['Quiet Rooms'])
+
+
+class AutocompleteTests(TestCase):
+    def setUp(self):
+        self.movie = create_movie(title='The Dark Knight', director='Christopher Nolan', cast='Christian Bale, Heath Ledger')
+        create_movie(title='Old Classic', director='Chris Doe', cast='Heath Ledger', status='archived')
+        suggestion_index.load()
+
+    def suggest(self, query):
+        response = self.client.get('/movies/autocomplete/', {'q': query})
+        return [(item['kind'], item['label']) for item in response.json()['suggestions']]
+
+    def test_suggests_titles_people_and_inner_words(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(self.suggest('chris'), [('cast', 'Christian Bale'), ('director', 'Christopher Nolan')])
+        self.assertEqual(self.suggest('knig'), [('title', 'The Dark Knight')])
+        self.assertEqual(self.suggest('heath'), [('cast', 'Heath Ledger')])
+        self.assertEqual(self.suggest('k'), [])
+
+    def test_movie_writes_update_index(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.movie.title = 'Batman Begins'
+            self.movie.cast = 'Christian Bale'
+            self.movie.save()
+        self.assertEqual(self.suggest('dark'), [])
+        self.assertEqual(self.suggest('batm'), [('title', 'Batman Begins')])
+        self.assertEqual(self.suggest('heath'), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.movie.delete()
+        self.assertEqual(self.suggest('chris'), [])
+
+
+class MovieCreditTests(TestCase):
+    def test_cast_text_becomes_shared_credits(self):
+        first = create_movie(cast='Tom Hanks,  meg ryan , Tom  Hanks')
+        second = create_movie(cast='tom hanks, Bill Pullman')
+        self.assertEqual([c.person.name for c in first.credits.select_related('person')], ['Tom Hanks', 'meg ryan'])
+        self.assertEqual(Person.objects.count(), 3)
+
+        hanks = Person.objects.get(normalized_name='tom hanks')
+        self.assertEqual(set(hanks.credits.values_list('movie_id', flat=True)), {first.pk, second.pk})
+
+        first.cast = 'Meg Ryan'
+        first.save()
+        self.assertEqual(list(hanks.credits.values_list('movie_id', flat=True)), [second.pk])
+
+    def test_movie_list_filters_by_person(self):
+        movie = create_movie(title='Sleepless', cast='Tom Hanks')
+        create_movie(title='Other', cast='Someone Else')
+        hanks = Person.objects.get(normalized_name='tom hanks')
+        response = self.client.get('/movies/', {'person': hanks.pk})
+        self.assertEqual([m.title for m in response.context['movies']], ['Sleepless'])
+        self.assertContains(response, 'Movies featuring')
+        detail = self.client.get(f'/movies/{movie.pk}/')
+        self.assertContains(detail, f'?person={hanks.pk}')
+
+    def test_invalid_person_and_genre_filters_are_ignored(self):
+        create_movie(title='Sleepless', cast='Tom Hanks')
+        for value in ('²', 'x', '99999999999999999999999', ' '):
+            with self.subTest(value=value):
+                for param in ('person', 'genre'):
+                    response = self.client.get('/movies/', {param: value})
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual([m.title for m in response.context['movies']], ['Sleepless'])
+
+
+class PageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.genre = Genre.objects.create(name='Drama')
+        self.movie = create_movie(title='Cached Movie', genre=self.genre)
+        self.other = create_movie(title='Other Movie')
+
+    def assert_cached(self, url, cached=True):
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        # The list and detail pages still run their conditional GET check: one
+        # query, plus the genre lookup of a genre-filtered list
+        self.assertEqual(len(queries) <= 2, cached, url)
+        return response
+
+    def test_anonymous_pages_are_cached(self):
+        for url in ('/', '/movies/', f'/movies/?genre={self.genre.pk}', f'/movies/{self.movie.pk}/'):
+            self.assert_cached(url)
+        self.client.force_login(Account.objects.create(username='viewer'))
+        self.assert_cached('/', cached=False)
+
+    def test_csrf_token_is_per_visitor(self):
+        first = self.client.get('/').content.decode()
+        self.client.cookies.clear()
+        second = self.assert_cached('/')
+        token = re.search(r'name="csrfmiddlewaretoken" value="([^"]+)"', second.content.decode()).group(1)
+        self.assertNotIn(token, first)
+        self.assertIn('csrftoken', second.cookies)
+
+    def test_writes_purge_affected_pages_only(self):
+        detail, other_detail = f'/movies/{self.movie.pk}/', f'/movies/{self.other.pk}/'
+        for url in (detail, other_detail, f'/movies/?genre={self.genre.pk}'):
+            self.client.get(url)
+
+        self.movie.title = 'Renamed Movie'
+        self.movie.save()
+        self.assertContains(self.assert_cached(detail), 'Renamed Movie')
+        self.assertContains(self.client.get(f'/movies/?genre={self.genre.pk}'), 'Renamed Movie')
+        self.assert_cached(other_detail)
+
+        Review.objects.create(user=Account.objects.create(username='critic'), movie=self.other,
+                              rating=5, comment='Loved it', is_approved=True)
+        self.assertContains(self.client.get(other_detail), 'Loved it')
+
+        self.genre.name = 'Thriller'
+        self.genre.save()
+        self.assertContains(self.client.get(detail), 'Thriller')
+
+
+class MovieCardFragmentTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.movies = [create_movie(title=f'Card {i}') for i in range(3)]
+        self.client.force_login(Account.objects.create(username='viewer'))
+
+    def test_cards_come_from_one_cache_lookup(self):
+        self.client.get('/movies/')
+        # Bypass save() so updated_at stays put: the cached card must be reused
+        Movie.objects.filter(pk=self.movies[0].pk).update(title='Silently Renamed')
+        with mock.patch.object(cache, 'get_many', wraps=cache.get_many) as get_many:
+            response = self.client.get('/movies/')
+        self.assertEqual(get_many.call_count, 1)
+        self.assertContains(response, 'Card 0')
+
+        self.movies[0].title = 'Saved Title'
+        self.movies[0].save()
+        self.assertContains(self.client.get('/movies/'), 'Saved Title')
+
+    def test_cards_vary_by_login_and_seats(self):
+        self.assertContains(self.client.get('/'), '<i class="bi bi-ticket"></i> Book')
+        Movie.objects.filter(pk=self.movies[1].pk).update(available_seats=42)
+        self.assertContains(self.client.get('/'), '<i class="bi bi-people"></i> 42')
+        self.client.logout()
+        self.assertNotContains(self.client.get('/'), '<i class="bi bi-ticket"></i> Book')
+
+
+class TemplateBundleTests(TestCase):
+    def test_preload_compiles_every_template(self):
+        names = template_names()
+        self.assertIn('User/home.html', names)
+        self.assertIn('login.html', names)
+        engine = engines['django'].engine
+        loader = engine.template_loaders[0]
+        self.assertIsInstance(loader, CachedLoader)
+        loader.reset()
+        self.assertEqual(preload_templates(), len(names))
+        self.assertLessEqual(set(names), set(loader.get_template_cache))
+        compiled = {name: engine.get_template(name) for name in names}
+        # Later lookups reuse the compiled templates without reading the files again
+        with mock.patch.object(AppDirectoriesLoader, 'get_contents', side_effect=AssertionError('template read again')):
+            for name in names:
+                self.assertIs(engine.get_template(name), compiled[name])
+
+    def test_preloaded_templates_render_like_fresh_ones(self):
+        engine = engines['django'].engine
+        preload_templates()
+        fresh = Engine(
+            loaders=['django.template.loaders.app_directories.Loader'],
+            libraries=engine.libraries,
+        )
+        context = {'movie': create_movie(genre=Genre.objects.create(name='Drama'))}
+        for name in ('includes/movie_list_card.html', 'includes/now_showing_card.html', 'includes/coming_soon_card.html'):
+            with self.subTest(name=name):
+                rendered = engine.get_template(name).render(Context(context))
+                self.assertIn('Test Movie', rendered)
+                self.assertEqual(rendered, fresh.get_template(name).render(Context(context)))
+
+    def test_check_templates_renders_them_all(self):
+        out = io.StringIO()
+        call_command('check_templates', stdout=out)
+        self.assertIn(f'Checked {len(template_names())} templates', out.getvalue())
+
+
+class SettingsProfileTests(SimpleTestCase):
+    """DJANGO_ENV picks the settings profile, loaded in a fresh interpreter"""
+    SCRIPT = (
+        'import django; django.setup()\n'
+        'from django.conf import settings; from django.db import connection\n'
+        'with connection.cursor() as cursor: cursor.execute("PRAGMA busy_timeout"); timeout = cursor.fetchone()[0]\n'
+        'print(settings.DEBUG, timeout)\n'
+    )
+
+    def load(self, **environ):
+        env = {name: value for name, value in os.environ.items()
+               if name not in ('DJANGO_ENV', 'SECRET_KEY', 'ALLOWED_HOSTS', 'SQLITE_PATH', 'SQLITE_REPLICA_PATH')}
+        env.update(DJANGO_SETTINGS_MODULE='Movie_management_system_3.settings', **environ)
+        return subprocess.run([sys.executable, '-c', self.SCRIPT], cwd=settings.BASE_DIR, env=env,
+                              capture_output=True, text=True)
+
+    def test_development_is_the_default(self):
+        result = self.load()
+        self.assertEqual(result.stdout.split()[0], 'True', result.stderr)
+
+    def test_production_requires_a_secret_key(self):
+        with tempfile.TemporaryDirectory() as directory:
+            environ = {'DJANGO_ENV': 'production', 'ALLOWED_HOSTS': 'example.com',
+                       'SQLITE_PATH': os.path.join(directory, 'db.sqlite3')}
+            result = self.load(**environ)
+            self.assertNotEqual(result.returncode, 0)
+            self.assertIn('The SECRET_KEY environment variable is required in production', result.stderr)
+
+            result = self.load(SECRET_KEY='not-a-real-secret', **environ)
+            # DEBUG off, and one lock timeout of 5 seconds
+            self.assertEqual(result.stdout.split(), ['False', '5000'], result.stderr)
+
+
+@mock.patch.dict(settings.DATABASES, {'replica':{'ENGINE': 'django.db.backends.sqlite3', 'NAME': 'replica.sqlite3'}})
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+
+    def test_only_movies_reads_in_block_use_replica(self):
+        self.assertIsNone(self.router.db_for_read(Movie))
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(Movie), 'replica')
+            self.assertIsNone(self.router.db_for_read(Account))
+        self.assertIsNone(self.router.db_for_read(Movie))
+
+    def test_write_pins_rest_of_block_to_primary(self):
+        with replica_reads():
+            self.assertEqual(self.router.db_for_write(Review), 'default')
+            self.assertIsNone(self.router.db_for_read(Movie))
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(Movie), 'replica')
+
+    def test_view_decorator(self):
+        view = read_from_replica(lambda request: self.router.db_for_read(Movie))
+        self.assertEqual(view(None), 'replica')
+
+    def test_no_replica_configured(self):
+        del settings.DATABASES['replica']
+        with replica_reads():
+            self.assertIsNone(self.router.db_for_read(Movie))
+
+
+def image_upload(name, width, height, format='JPEG'):
+    buffer = io.BytesIO()
+    Image.new('RGB', (width, height), 'navy').save(buffer, format)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type=f'image/{format.lower()}')
+
+
+def use_temporary_media(test):
+    media_root = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, media_root)
+    media = override_settings(MEDIA_ROOT=media_root)
+    media.enable()
+    test.addCleanup(media.disable)
+
+
+def save_movie_form(poster, instance=None, **data):
+    genre, _ = Genre.objects.get_or_create(name='Drama')
+    fields = {
+        'title': 'Poster Movie', 'description': 'Posters', 'genre': genre.pk, 'duration': 100,
+        'release_date': '2025-01-01', 'director': 'Director', 'cast': 'Actor',
+        'status': 'now_showing', 'ticket_price': 10, 'available_seats': 50,
+    }
+    fields.update(data)
+    form = MovieForm(data=fields, files={'poster': poster} if poster else {}, instance=instance)
+    assert form.is_valid(), form.errors
+    return form.save()
+
+
+class PosterVariantTests(TestCase):
+    def setUp(self):
+        use_temporary_media(self)
+        cache.clear()
+
+    def save_with_form(self, poster):
+        return save_movie_form(poster)
+
+    def test_form_save_writes_narrower_variants(self):
+        movie = self.save_with_form(image_upload('big.jpg', 1000, 1500))
+        
+        self.assertEqual(movie.poster_variants, [80, 240, 400, 800])
+        self.assertEqual(movie.poster_width, 1000)
+        storage = movie.poster.storage
+        for width in movie.poster_variants:
+            with storage.open(variant_name(movie.poster.name, width)) as variant:
+                self.assertEqual(Image.open(variant).size, (width, width * 3 // 2))
+        movie.refresh_from_db()
+        self.assertIn('240w.', movie.poster_srcset())
+        self.assertTrue(movie.poster_srcset().endswith(f'{movie.poster.url} 1000w'))
+
+    def test_small_poster_is_not_upscaled(self):
+        movie = self.save_with_form(image_upload('small.png', 300, 450, 'PNG'))
+        
+        self.assertEqual(movie.poster_variants, [80, 240])
+        self.assertEqual(movie.poster_width, 300)
+
+    def test_cards_render_srcset(self):
+        movie = self.save_with_form(image_upload('card.jpg', 500, 750))
+        
+        response = self.client.get('/movies/')
+        
+        self.assertContains(response, f'srcset="{movie.poster_srcset()}"')
+        self.assertContains(response, 'sizes="(min-width: 576px) 270px, 100vw"')
+
+    def test_command_backfills_existing_posters(self):
+        movie = self.save_with_form(image_upload('old.jpg', 500, 750))
+        Movie.objects.filter(pk=movie.pk).update(poster_variants=None, poster_width=None)
+        
+        call_command('generate_poster_variants', stdout=io.StringIO())
+        
+        movie.refresh_from_db()
+        self.assertEqual(movie.poster_variants, [80, 240, 400])
+        self.assertEqual(movie.poster_width, 500)
+
+
+class ContentAddressedStorageTests(TestCase):
+    def setUp(self):
+        use_temporary_media(self)
+
+    def references(self, name):
+        return StoredFile.objects.get(name=name).references
+
+    def poster_files(self):
+        return sorted(content_addressed_storage.listdir('movies/posters')[1])
+
+    def test_identical_uploads_are_stored_once(self):
+        first = save_movie_form(image_upload('a.jpg', 300, 450))
+        second = save_movie_form(image_upload('copy of a.jpg', 300, 450), title='Second')
+        
+        self.assertEqual(first.poster.name, second.poster.name)
+        self.assertRegex(first.poster.name, r'^movies/posters/[0-9a-f]{64}\.jpg$')
+        self.assertEqual(len(self.poster_files()), 3)  # The poster and its 80w and 240w variants
+        self.assertEqual(self.references(first.poster.name), 2)
+
+    def test_references_follow_replacements_and_deletes(self):
+        movie = save_movie_form(image_upload('a.jpg', 300, 450))
+        old_name = movie.poster.name
+        movie = save_movie_form(image_upload('b.png', 300, 450, 'PNG'), instance=movie)
+        
+        self.assertEqual(self.references(old_name), 0)
+        self.assertEqual(self.references(movie.poster.name), 1)
+        
+        save_movie_form(None, instance=movie, title='Renamed')
+        self.assertEqual(self.references(movie.poster.name), 1)
+        
+        movie.delete()
+        self.assertEqual(self.references(movie.poster.name), 0)
+
+    def test_garbage_collection_keeps_used_files(self):
+        movie = save_movie_form(image_upload('a.jpg', 300, 450))
+        old_name = movie.poster.name
+        movie = save_movie_form(image_upload('b.png', 300, 450, 'PNG'), instance=movie)
+        
+        call_command('collect_media_garbage', '--grace=0', stdout=io.StringIO())
+        
+        self.assertEqual(self.poster_files(), sorted(
+            posixpath.basename(name) for name in
+            [movie.poster.name] + [variant_name(movie.poster.name, width) for width in movie.poster_variants]
+        ))
+        self.assertFalse(StoredFile.objects.filter(name=old_name).exists())
+
+    def test_rehash_merges_legacy_duplicates(self):
+        content = image_upload('legacy.jpg', 100, 150).read()
+        for name in ('movies/posters/legacy.jpg', 'movies/posters/legacy_x1Y2z3.jpg'):
+            content_addressed_storage.save_derived(name, ContentFile(content))
+        first = create_movie(title='First')
+        second = create_movie(title='Second')
+        Movie.objects.filter(pk=first.pk).update(poster='movies/posters/legacy.jpg')
+        Movie.objects.filter(pk=second.pk).update(poster='movies/posters/legacy_x1Y2z3.jpg')
+        
+        call_command('collect_media_garbage', '--rehash', '--grace=0', stdout=io.StringIO())
+        
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.poster.name, second.poster.name)
+        self.assertRegex(first.poster.name, r'[0-9a-f]{64}\.jpg$')
+        self.assertEqual(self.poster_files(), sorted(
+            posixpath.basename(name) for name in [first.poster.name, variant_name(first.poster.name, 80)]
+        ))
+        self.assertEqual(self.references(first.poster.name), 2)
+
+    def test_content_addressed_media_is_served_immutable(self):
+        movie = save_movie_form(image_upload('a.jpg', 100, 150))
+        request = RequestFactory().get(movie.poster.url)
+        
+        response = serve_media(request, movie.poster.name, document_root=settings.MEDIA_ROOT)
+        
+        self.assertEqual(response['Cache-Control'], 'public, max-age=31536000, immutable')
+
+
+@override_settings(IMAGE_UPLOAD_MAX_SIZE=50_000, IMAGE_UPLOAD_MAX_DIMENSION=1000)
+class ImageUploadLimitTests(TestCase):
+    def setUp(self):
+        use_temporary_media(self)
+        self.client.force_login(Account.objects.create(username='admin', role='admin'))
+        self.genre = Genre.objects.create(name='Drama')
+
+    def post_movie(self, poster):
+        return self.client.post('/dashboard/movies/create/', {
+            'title': 'Upload', 'description': 'Upload', 'genre': self.genre.pk, 'duration': 100,
+            'release_date': '2025-01-01', 'director': 'Director', 'cast': 'Actor',
+            'status': 'now_showing', 'ticket_price': 10, 'available_seats': 50, 'poster': poster,
+        }, headers={'x-requested-with': 'XMLHttpRequest'})
+
+    def test_uploads_are_streamed_to_temporary_files(self):
+        response = self.post_movie(image_upload('poster.jpg', 300, 450))
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(Movie.objects.get(title='Upload').poster_width)
+        self.assertIsInstance(response.wsgi_request.FILES['poster'], TemporaryUploadedFile)
+
+    def test_oversized_upload_is_rejected_without_keeping_it(self):
+        poster = SimpleUploadedFile('huge.bmp', b'BM' + bytes(100_000), content_type='image/bmp')
+        
+        response = self.post_movie(poster)
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('at most 48.8', response.json()['errors']['poster'][0])
+        self.assertEqual(response.wsgi_request.FILES['poster'].size, 100_002)
+
+    def test_handler_stops_writing_past_the_limit(self):
+        handler = LimitedTemporaryFileUploadHandler()
+        handler.new_file('poster', 'huge.jpg', 'image/jpeg', None)
+        for start in range(0, 80_000, 20_000):
+            handler.receive_data_chunk(b'x' * 20_000, start)
+        upload = handler.file_complete(80_000)
+        
+        self.assertEqual(upload.size, 80_000)
+        self.assertEqual(os.path.getsize(upload.temporary_file_path()), 0)
+        upload.close()
+
+    def test_dimensions_are_checked_from_the_header(self):
+        # Fail loudly if anything decodes the pixels
+        poster = image_upload('wide.png', 1200, 100, 'PNG')
+        with mock.patch.object(Image.Image, 'load', side_effect=AssertionError('decoded')):
+            response = self.post_movie(poster)
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('1200×100', response.json()['errors']['poster'][0])
+        self.assertFalse(Movie.objects.exists())
+
+    def test_settings_logo_uses_the_same_limits(self):
+        # Following the redirect caches this test's settings row
+        self.addCleanup(SiteSetting.clear_cache)
+        response = self.client.post('/dashboard/settings/', {
+            'site_name': 'Cinema', 'site_email': 'cinema@example.com', 'items_per_page': 10,
+            'site_logo': image_upload('logo.png', 1200, 100, 'PNG'),
+        }, follow=True)
+        
+        settings_row = SiteSetting.get_settings()
+        self.assertEqual(settings_row.site_name, 'Cinema')
+        self.assertFalse(settings_row.site_logo)
+        shown = [str(message) for message in response.context['messages']]
+        self.assertEqual(len(shown), 1)
+        self.assertIn('Settings saved without the logo', shown[0])
+        self.assertNotContains(response, 'Settings saved successfully!')
+
+
+class StaticAssetTests(SimpleTestCase):
+    def setUp(self):
+        static_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, static_root)
+        static = override_settings(STATIC_ROOT=static_root, STORAGES={
+            **settings.STORAGES,
+            'staticfiles': {'BACKEND': 'movies.static_assets.CompressedManifestStaticFilesStorage'},
+        })
+        static.enable()
+        self.addCleanup(static.disable)
+        hashed_names.cache_clear()
+        self.addCleanup(hashed_names.cache_clear)
+        call_command('collectstatic', '--noinput', verbosity=0)
+        self.static_root = static_root
+
+    def test_hashed_assets_get_compressed_siblings(self):
+        hashed = staticfiles_storage.stored_name('css/site.css')
+        self.assertRegex(hashed, r'^css/site\.[0-9a-f]{12}\.css$')
+        with open(os.path.join(self.static_root, hashed), 'rb') as original, \
+                gzip.open(os.path.join(self.static_root, hashed + '.gz')) as compressed:
+            self.assertEqual(compressed.read(), original.read())
+
+    def test_hashed_assets_are_served_compressed_and_immutable(self):
+        hashed = staticfiles_storage.stored_name('js/main.js')
+        request = RequestFactory().get('/static/' + hashed, headers={'accept-encoding': 'gzip, deflate'})
+        
+        response = serve_static(request, hashed)
+        
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Content-Type'], 'text/javascript')
+        self.assertEqual(response['Cache-Control'], 'public, max-age=31536000, immutable')
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_encoding_follows_accept_encoding_q_values(self):
+        hashed = staticfiles_storage.stored_name('js/main.js')
+        # brotli may not be installed; any file will do to check which sibling is picked
+        with open(os.path.join(self.static_root, hashed + '.br'), 'wb') as compressed:
+            compressed.write(b'brotli')
+        for header, expected in (
+            ('gzip, br', 'br'),
+            ('br;q=0, gzip', 'gzip'),
+            ('br;q=0.5, gzip;q=0.8', 'gzip'),
+            ('gzip;q=0, deflate', None),
+            ('gzip;q=0.0, br;q=0', None),
+            ('identity', None),
+            ('xbr, gzip;q=0', None),  # No substring matches
+            ('*', 'br'),
+            ('*;q=0', None),
+            ('br;q=0, *', 'gzip'),
+            ('x-gzip', 'gzip'),
+            ('BR;Q=1', 'br'),
+            ('br;q=high', None),
+            ('', None),
+        ):
+            with self.subTest(header=header):
+                request = RequestFactory().get('/static/' + hashed, headers={'accept-encoding': header})
+                self.assertEqual(serve_static(request, hashed).get('Content-Encoding'), expected)
+
+    def test_unhashed_names_are_revalidated(self):
+        response = serve_static(RequestFactory().get('/static/js/main.js'), 'js/main.js')
+        
+        self.assertNotIn('Content-Encoding', response)
+        self.assertIn('must-revalidate', response['Cache-Control'])
+
+
+class AsyncViewTests(TestCase):
+    CSRF_VALUE = re.compile(r'(name="csrfmiddlewaretoken" value=")[^"]*')
+
+    def setUp(self):
+        self.user = Account.objects.create(username='admin', role='admin')
+        genre = Genre.objects.create(name='Drama')
+        self.movie = create_movie(title='Async Movie', genre=genre, trailer_url='https://youtu.be/abc')
+        create_movie(title='Soon', status='coming_soon')
+        Review.objects.create(user=self.user, movie=self.movie, rating=4, comment='Good', is_approved=True)
+
+    def request(self, path):
+        request = RequestFactory().get(path)
+        request.user = self.user
+        request.session = {}
+        request._messages = FallbackStorage(request)
+
+        async def auser():
+            return self.user
+        request.auser = auser
+        return request
+
+    def assert_same_page(self, path, sync_view, async_view, *args):
+        expected = sync_view(self.request(path), *args)
+        actual = async_to_sync(async_view)(self.request(path), *args)
+        self.assertEqual(actual.status_code, expected.status_code)
+        self.assertEqual(
+            self.CSRF_VALUE.sub(r'\1', actual.content.decode()),
+            self.CSRF_VALUE.sub(r'\1', expected.content.decode()),
+        )
+        return actual
+
+    def test_async_views_render_the_same_pages(self):
+        self.assertContains(self.assert_same_page('/', views.home_view, async_views.home_view), 'Async Movie')
+        self.assert_same_page('/movies/?search=async', views.movie_list_view, async_views.movie_list_view)
+        self.assert_same_page('/movies/?page=9', views.movie_list_view, async_views.movie_list_view)
+        self.assert_same_page('/movies/1/', views.movie_detail_view, async_views.movie_detail_view, self.movie.pk)
+        self.assert_same_page('/dashboard/', views.admin_dashboard, async_views.admin_dashboard)
+
+    def test_async_detail_404(self):
+        with self.assertRaises(Http404):
+            async_to_sync(async_views.movie_detail_view)(self.request('/movies/0/'), 0)
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.genre = Genre.objects.create(name='Drama')
+        self.movie = create_movie(title='Validated Movie', genre=self.genre)
+        self.critic = Account.objects.create(username='critic')
+        self.detail = f'/movies/{self.movie.pk}/'
+
+    def revalidate(self, url, response, **headers):
+        headers.setdefault('if_none_match', response['ETag'])
+        return self.client.get(url, headers={name.replace('_', '-'): value for name, value in headers.items()})
+
+    def assert_not_modified(self, url, queries=1):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        with CaptureQueriesContext(connection) as captured:
+            revalidated = self.revalidate(url, response)
+        self.assertEqual(revalidated.status_code, 304, url)
+        self.assertEqual(revalidated.content, b'')
+        self.assertEqual(revalidated['ETag'], response['ETag'])
+        self.assertEqual(len(captured), queries, url)
+        return response
+
+    def assert_changed(self, url, response, change):
+        change()
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_unchanged_pages_are_not_modified(self):
+        pages = [(self.detail, 1), ('/movies/', 1), ('/movies/?search=validated', 1),
+                 # The filter form looks the genre up
+                 (f'/movies/?genre={self.genre.pk}', 2)]
+        for url, queries in pages:
+            response = self.assert_not_modified(url, queries)
+            self.assertIn('Last-Modified', response)
+            self.assertIn('no-cache', response['Cache-Control'])
+            self.assertIn('private', response['Cache-Control'])
+
+    def test_if_modified_since_alone(self):
+        response = self.client.get(self.detail)
+        self.assertEqual(self.revalidate(self.detail, response, if_none_match='',
+                                         if_modified_since=response['Last-Modified']).status_code, 304)
+
+    def test_detail_changes(self):
+        changes = [
+            lambda: Review.objects.create(user=self.critic, movie=self.movie, rating=4, comment='Good'),
+            lambda: Review.objects.filter(movie=self.movie).delete(),
+            lambda: Movie.objects.filter(pk=self.movie.pk).update(available_seats=5),
+            lambda: Genre.objects.filter(pk=self.genre.pk).update(name='Thriller', updated_at=timezone.now()),
+            lambda: SiteSetting.get_settings().save(),
+        ]
+        for change in changes:
+            self.assert_changed(self.detail, self.client.get(self.detail), change)
+
+    def test_list_changes(self):
+        changes = [
+            lambda: create_movie(title='Another'),
+            lambda: Movie.objects.filter(title='Another').update(status='archived'),
+            lambda: Genre.objects.create(name='Comedy'),
+            lambda: self.movie.save(),
+        ]
+        for change in changes:
+            self.assert_changed('/movies/', self.client.get('/movies/'), change)
+
+    def test_validators_are_per_visitor(self):
+        anonymous = self.client.get(self.detail)
+        self.client.force_login(self.critic)
+        self.assertEqual(self.revalidate(self.detail, anonymous).status_code, 200)
+        # Plus the session and the user
+        self.assert_not_modified(self.detail, queries=3)
+
+    def test_pending_messages_render_the_page(self):
+        site_settings = SiteSetting.get_settings()
+        site_settings.enable_review = False
+        site_settings.save()
+        self.client.force_login(self.critic)
+        response = self.client.get(self.detail)
+        # Redirects back to the page with a message
+        self.client.get(f'/movies/{self.movie.pk}/review/')
+        self.assertContains(self.revalidate(self.detail, response), 'Reviews are currently disabled')
+
+    def test_missing_movie(self):
+        self.assertEqual(self.client.get('/movies/0/').status_code, 404)
+
+    def test_async_views(self):
+        response = self.client.get(self.detail)
+        request = RequestFactory().get(self.detail, headers={'if-none-match': response['ETag']})
+        request.META['CSRF_COOKIE'] = response.cookies['csrftoken'].value
+        request.user = AnonymousUser()
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        self.assertEqual(async_to_sync(async_views.movie_detail_view)(request, self.movie.pk).status_code, 304)
+
+
+class ReadApiTests(TestCase):
+    def setUp(self):
+        self.genre = Genre.objects.create(name='Drama')
+        self.movies = [create_movie(title=f'Movie {i}', genre=self.genre, ticket_price='12.50') for i in range(5)]
+        self.viewer = Account.objects.create(username='viewer')
+        self.review = Review.objects.create(user=self.viewer, movie=self.movies[0], rating=4, comment='Good', is_approved=True)
+        Review.objects.create(user=Account.objects.create(username='pending'), movie=self.movies[0], rating=1, comment='Bad')
+        self.showtime = Showtime.objects.create(
+            movie=self.movies[0], auditorium='Hall 1', start_time=timezone.now() + datetime.timedelta(days=1), capacity=10,
+        )
+
+    def get(self, url, status=200):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status, response.content)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        return response.json()
+
+    def test_sparse_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.get('/api/v1/movies/?fields=id,title,rating,ticket_price,genre_name')['data']
+        self.assertEqual(data[0], {
+            'id': self.movies[0].pk, 'title': 'Movie 0', 'rating': 4.0, 'ticket_price': '12.50', 'genre_name': 'Drama',
+        })
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('description', queries[0]['sql'])
+        self.assertEqual(set(self.get(f'/api/v1/movies/{self.movies[1].pk}/')['data']), set(api.MovieResource.FIELDS))
+        self.assertIn('Unknown fields: budget', self.get('/api/v1/movies/?fields=title,budget', 400)['error'])
+
+    def test_cursor_pagination(self):
+        seen, url = [], '/api/v1/movies/?fields=id&limit=2'
+        while url:
+            page = self.get(url)
+            seen += [row['id'] for row in page['data']]
+            url = page['next'] and f'/api/v1/movies/?fields=id&limit=2&after={page["next"]}'
+        self.assertEqual(seen, [movie.pk for movie in self.movies])
+        self.get('/api/v1/movies/?limit=500', 400)
+        self.get('/api/v1/movies/?after=not-a-cursor', 400)
+
+    def test_batch_fetch(self):
+        ids = [self.movies[3].pk, self.movies[1].pk, 0]
+        data = self.get(f'/api/v1/movies/?fields=id,title&ids={",".join(map(str, ids))}')['data']
+        self.assertEqual([row['id'] for row in data], ids[:2])
+        self.get('/api/v1/movies/?ids=1,x', 400)
+
+    def test_collections(self):
+        self.assertEqual(self.get('/api/v1/genres/')['data'], [{'id': self.genre.pk, 'name': 'Drama', 'description': None}])
+        self.assertEqual(self.get(f'/api/v1/showtimes/?movie={self.movies[0].pk}&fields=id,available_seats')['data'],
+                         [{'id': self.showtime.pk, 'available_seats': 10}])
+        self.assertEqual(self.get(f'/api/v1/movies/?genre={self.genre.pk}&status=coming_soon')['data'], [])
+        # Unapproved reviews are never listed
+        reviews = self.get('/api/v1/reviews/?fields=id,user,rating')['data']
+        self.assertEqual(reviews, [{'id': self.review.pk, 'user': 'viewer', 'rating': 4}])
+        self.get(f'/api/v1/reviews/{self.review.pk + 1}/', 404)
+        self.get('/api/v1/bookings/', 404)
+        self.get('/api/v1/reviews/?movie=x', 400)
+
+    def test_malformed_numbers_are_rejected(self):
+        too_big = '99999999999999999999999'
+        for url in (
+            '/api/v1/movies/?limit=²', '/api/v1/movies/?limit=0', '/api/v1/movies/?limit=1.5',
+            f'/api/v1/movies/?limit={too_big}',
+            '/api/v1/reviews/?movie=²', f'/api/v1/reviews/?movie={too_big}', f'/api/v1/movies/?genre={too_big}',
+            '/api/v1/movies/?ids=²', f'/api/v1/movies/?ids=1,{too_big}',
+            f'/api/v1/movies/?after={api.encode_cursor(too_big)}', f'/api/v1/movies/?after={api.encode_cursor("²")}',
+        ):
+            with self.subTest(url=url):
+                self.assertIn('error', self.get(url, 400))
+        self.assertEqual(self.get(f'/api/v1/movies/{too_big}/', 404), {'error': 'Not found'})
+
+    def test_read_only(self):
+        self.assertEqual(self.client.post('/api/v1/movies/').status_code, 405)
+
+    def test_json_fallback_matches_orjson(self):
+        url = '/api/v1/movies/?fields=id,release_date,updated_at,poster,rating'
+        expected = self.client.get(url).content
+        with mock.patch.object(api, 'orjson', None):
+            self.assertEqual(self.client.get(url).content, expected)
+
+
+class QueryCountTests(TestCase):
+    """
+    N+1 regression guard: every page must issue the same, bounded number of
+    queries however many rows it displays.
+    """
+    PUBLIC_PAGES = {
+        'home': ('/', 4),
+        # One query each for the conditional GET check
+        'movie_list': ('/movies/', 4),
+        'movie_detail': ('/movies/{movie}/', 4),
+        'login': ('/accounts/login/', 0),
+        'register': ('/accounts/register/', 0),
+    }
+    # Authenticated pages include two queries for the session and the user
+    USER_PAGES = {
+        'home': ('/', 6),
+        'movie_list': ('/movies/', 6),
+        'movie_detail': ('/movies/{movie}/', 6),
+        'book_movie': ('/movies/{movie}/book/', 4),
+        'review_movie': ('/movies/{movie}/review/', 4),
+        'profile': ('/accounts/profile/', 2),
+        'my_bookings': ('/accounts/my-bookings/', 3),
+        'my_reviews': ('/accounts/my-reviews/', 3),
+    }
+    ADMIN_PAGES = {
+        'admin_dashboard': ('/dashboard/', 10),
+        'admin_profile': ('/dashboard/profile/', 5),
+        'manage_movies': ('/dashboard/movies/', 5),
+        'create_movie': ('/dashboard/movies/create/', 3),
+        'edit_movie': ('/dashboard/movies/{movie}/edit/', 4),
+        'manage_genres': ('/dashboard/genres/', 3),
+        'edit_genre': ('/dashboard/genres/{genre}/edit/', 3),
+        'manage_bookings': ('/dashboard/bookings/', 3),
+        'manage_reviews': ('/dashboard/reviews/', 3),
+        'manage_users': ('/dashboard/users/', 4),
+        'edit_account': ('/dashboard/users/{user}/edit/', 3),
+        'admin_settings': ('/dashboard/settings/', 3),
+    }
+
+    def setUp(self):
+        self.admin = Account.objects.create(username='admin', role='admin')
+        self.viewer = Account.objects.create(username='viewer')
+        self.movie = create_movie(trailer_url='https://youtu.be/abc')
+        self.add_rows(2)
+        SiteSetting.clear_cache()
+        SiteSetting.get_cached_settings()
+
+    def add_rows(self, count):
+        """Add `count` genres, movies, users and their bookings and reviews"""
+        start = Genre.objects.count()
+        for i in range(start, start + count):
+            genre = Genre.objects.create(name=f'Genre {i}')
+            movie = create_movie(title=f'Movie {i}', genre=genre)
+            user = Account.objects.create(username=f'user{i}')
+            for booker, film in ((user, movie), (user, self.movie), (self.viewer, movie)):
+                Booking.objects.create(
+                    user=booker, movie=film, show_date=datetime.date(2025, 1, 2),
+                    show_time=datetime.time(19, 30), number_of_seats=1, total_price=10,
+                )
+            Review.objects.create(user=user, movie=self.movie, rating=4, comment='Good', is_approved=True)
+            Review.objects.create(user=self.viewer, movie=movie, rating=3, comment='Fine', is_approved=True)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        return len(queries)
+
+    def assert_bounded(self, pages):
+        urls = {
+            name: url.format(movie=self.movie.pk, genre=self.movie.genre_id or Genre.objects.first().pk, user=self.viewer.pk)
+            for name, (url, limit) in pages.items()
+        }
+        before = {name: self.count_queries(url) for name, url in urls.items()}
+        self.add_rows(10)
+        for name, url in urls.items():
+            with self.subTest(view=name):
+                after = self.count_queries(url)
+                self.assertEqual(before[name], after, f'{name} query count grows with row count')
+                self.assertLessEqual(after, pages[name][1])
+
+    def test_anonymous_pages(self):
+        self.assert_bounded(self.PUBLIC_PAGES)
+
+    def test_user_pages(self):
+        self.client.force_login(self.viewer)
+        self.assert_bounded(self.USER_PAGES)
+
+    def test_admin_pages(self):
+        self.client.force_login(self.admin)
+        self.assert_bounded(self.ADMIN_PAGES)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Query plans are checked with SQLite EXPLAIN QUERY PLAN')
+class QueryPlanTests(TestCase):
+    """
+    Core pages must reach movies, bookings and reviews through an index;
+    a plain "SCAN <table>" in EXPLAIN QUERY PLAN means a full table scan.
+    """
+    FULL_SCAN = re.compile(r'SCAN (movies|bookings|reviews)(?: AS \w+)?$')
+    PAGES = {
+        None: ['/', '/movies/', '/movies/{movie}/'],
+        'viewer': ['/accounts/my-bookings/', '/accounts/my-reviews/'],
+        'admin': ['/dashboard/movies/', '/dashboard/bookings/', '/dashboard/reviews/'],
+    }
+
+    def setUp(self):
+        self.users = {
+            'viewer': Account.objects.create(username='viewer'),
+            'admin': Account.objects.create(username='admin', role='admin'),
+        }
+        self.movie = create_movie(trailer_url='https://youtu.be/abc')
+        Booking.objects.create(
+            user=self.users['viewer'], movie=self.movie, show_date=datetime.date(2025, 1, 2),
+            show_time=datetime.time(19, 30), number_of_seats=1, total_price=10,
+        )
+        Review.objects.create(user=self.users['viewer'], movie=self.movie, rating=4, comment='Good')
+        SiteSetting.objects.update_or_create(id=1, defaults={'require_approval': True})
+        SiteSetting.clear_cache()
+
+    def full_scans(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall() if self.FULL_SCAN.match(row[-1])]
+
+    def test_core_pages_use_indexes(self):
+        for user, urls in self.PAGES.items():
+            if user:
+                self.client.force_login(self.users[user])
+            for url in urls:
+                url = url.format(movie=self.movie.pk)
+                with CaptureQueriesContext(connection) as queries:
+                    self.assertEqual(self.client.get(url).status_code, 200, url)
+                for query in queries:
+                    if query['sql'].startswith('SELECT'):
+                        with self.subTest(url=url, sql=query['sql']):
+                            self.assertEqual(self.full_scans(query['sql']), [])
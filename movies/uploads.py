@@ -0,0 +1,85 @@
+from PIL import Image
+
+from django import forms
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.template.defaultfilters import filesizeformat
+
+
+class LimitedTemporaryFileUploadHandler(TemporaryFileUploadHandler):
+    """
+    Stream every uploaded file to a temporary file, chunk by chunk
+
+    Nothing is kept in memory whatever the size. Once a file passes
+    IMAGE_UPLOAD_MAX_SIZE the rest of it is read off the request but not
+    written, and what was written is emptied, so a partial image can never
+    pass validation. The file still reports its full size for the error message.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > settings.IMAGE_UPLOAD_MAX_SIZE:
+            if self.received - len(raw_data) <= settings.IMAGE_UPLOAD_MAX_SIZE:
+                self.file.truncate(0)
+            return None
+        return super().receive_data_chunk(raw_data, start)
+
+
+def validate_image_upload(file):
+    """
+    Check an uploaded image against the size and dimension limits
+
+    Only the image header is read: Pillow's open() parses the format and
+    dimensions without decoding any pixels. Returns the PIL image, already
+    closed, for callers that want its format or size.
+    """
+    if file.size > settings.IMAGE_UPLOAD_MAX_SIZE:
+        raise ValidationError(
+            'Images can be at most %(limit)s (this one is %(size)s).',
+            code='file_too_large',
+            params={'limit': filesizeformat(settings.IMAGE_UPLOAD_MAX_SIZE), 'size': filesizeformat(file.size)},
+        )
+    source = file.temporary_file_path() if hasattr(file, 'temporary_file_path') else file
+    try:
+        # Closed right away: only the parsed header (format, size, mode) is used
+        with Image.open(source) as image:
+            width, height = image.size
+    except Exception as exc:
+        # Not an image Pillow recognizes, or past its decompression bomb limit
+        raise ValidationError(
+            'Upload a valid image. The file you uploaded was either not an image or a corrupted image.',
+            code='invalid_image',
+        ) from exc
+    limit = settings.IMAGE_UPLOAD_MAX_DIMENSION
+    if width > limit or height > limit:
+        raise ValidationError(
+            'Images can be at most %(limit)s pixels wide and tall (this one is %(width)s×%(height)s).',
+            code='image_too_large',
+            params={'limit': limit, 'width': width, 'height': height},
+        )
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    return image
+
+
+class HeaderValidatedImageField(forms.ImageField):
+    """
+    ImageField validated by validate_image_upload() instead of Pillow's verify()
+
+    The stock field copies in-memory uploads into a second buffer and, for
+    some formats, reads the whole file to verify it.
+    """
+
+    def to_python(self, data):
+        file = forms.FileField.to_python(self, data)
+        if file is None:
+            return None
+        image = validate_image_upload(file)
+        file.image = image
+        file.content_type = Image.MIME.get(image.format)
+        return file
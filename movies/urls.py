@@ -1,18 +1,23 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import api, async_views, views
+
+# Catalog pages and the dashboard have async versions for ASGI deployments
+catalog_views = async_views if settings.ASYNC_VIEWS else views
 
 urlpatterns = [
     # Public URLs
-    path('', views.home_view, name='home'),
-    path('movies/', views.movie_list_view, name='movie_list'),
-    path('movies/<int:movie_id>/', views.movie_detail_view, name='movie_detail'),
+    path('', catalog_views.home_view, name='home'),
+    path('movies/', catalog_views.movie_list_view, name='movie_list'),
+    path('movies/autocomplete/', views.movie_autocomplete_view, name='movie_autocomplete'),
+    path('movies/<int:movie_id>/', catalog_views.movie_detail_view, name='movie_detail'),
     
     # User URLs (Authenticated)
     path('movies/<int:movie_id>/book/', views.book_movie_view, name='book_movie'),
     path('movies/<int:movie_id>/review/', views.review_movie_view, name='review_movie'),
     
     # Admin URLs (Changed from /admin/ to /dashboard/)
-    path('dashboard/', views.admin_dashboard, name='admin_dashboard'),
+    path('dashboard/', catalog_views.admin_dashboard, name='admin_dashboard'),
     path('dashboard/profile/', views.admin_profile, name='admin_profile'),
     
     # Admin - Movies
@@ -45,4 +50,8 @@ urlpatterns = [
     
     # Admin - Settings
     path('dashboard/settings/', views.admin_settings, name='admin_settings'),
+    
+    # Read-only JSON API (movies, genres, showtimes, reviews)
+    path('api/v1/<slug:resource>/', api.resource_list, name='api_list'),
+    path('api/v1/<slug:resource>/<int:pk>/', api.resource_detail, name='api_detail'),
 ]
@@ -1,58 +1,157 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.db.models import Q, Avg
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q, Count, Func, OuterRef, Subquery
 from django.http import JsonResponse
-from .models import Movie, Genre, Booking, Review, SiteSetting
+from .models import Movie, Genre, Person, Booking, Review, SiteSetting
 from .forms import MovieForm, GenreForm, BookingForm, ReviewForm, BookingStatusForm, MovieSearchForm
+from .autocomplete import suggestion_index
+from .conditional import conditional_page, latest
+from .dashboard import DashboardStats
+from .page_cache import cache_anonymous_page, tag_response, movie_tag, genre_tag
+from .pagination import paginate, keyset_paginate
+from .routers import read_from_replica
+from .search import get_search_backend, PUBLIC_FIELDS, ADMIN_FIELDS
+from .services import reserve_seats, release_seats
+from .uploads import validate_image_upload
 from accounts.models import Account
 from accounts.forms import AdminCreateAccountForm, AdminEditAccountForm
 
 
 # ==================== PUBLIC VIEWS ====================
 
+@cache_anonymous_page
+@read_from_replica
 def home_view(request):
     """
     Home page - show featured movies
     """
-    # Get featured movie (highest rated now showing movie with trailer)
-    featured_movie = Movie.objects.filter(
-        status='now_showing', 
-        trailer_url__isnull=False
-    ).exclude(trailer_url='').order_by('-rating', '-created_at').first()
+    sections = home_sections()
     
-    # If no featured movie with trailer, get the latest now showing movie as fallback
-    if not featured_movie:
-        featured_movie = Movie.objects.filter(status='now_showing').order_by('-rating', '-created_at').first()
-    
-    now_showing = Movie.objects.filter(status='now_showing').order_by('-created_at')[:6]
-    coming_soon = Movie.objects.filter(status='coming_soon').order_by('release_date')[:3]
-    genres = Genre.objects.all()
+    # Highest rated now showing movie with a trailer, else without one
+    featured_movie = sections['featured'].first() or sections['featured_fallback'].first()
     
     context = {
         'featured_movie': featured_movie,
-        'now_showing': now_showing,
-        'coming_soon': coming_soon,
-        'genres': genres,
+        'now_showing': sections['now_showing'],
+        'coming_soon': sections['coming_soon'],
+        'genres': sections['genres'],
     }
     
-    return render(request, 'User/home.html', context)
+    response = render(request, 'User/home.html', context)
+    
+    return tag_response(response, *home_page_tags(context))
+
+
+def home_sections():
+    """Querysets behind the home page, independent of each other"""
+    catalog = Movie.objects.select_related('genre')
+    now_showing = catalog.filter(status='now_showing').with_showtime_seats()
+    return {
+        'featured': now_showing.filter(trailer_url__isnull=False).exclude(trailer_url='').order_by('-rating', '-created_at'),
+        'featured_fallback': now_showing.order_by('-rating', '-created_at'),
+        'now_showing': now_showing.order_by('-created_at')[:6],
+        'coming_soon': catalog.filter(status='coming_soon').order_by('release_date')[:3],
+        'genres': Genre.objects.all(),
+    }
 
 
+def home_page_tags(context):
+    """Page cache tags for a rendered home page"""
+    shown = [*context['now_showing'], *context['coming_soon']]
+    if context['featured_movie']:
+        shown.append(context['featured_movie'])
+    return ['home', 'genres', *(movie_tag(movie.id) for movie in shown)]
+
+
+@read_from_replica
+def movie_list_validators(request):
+    """
+    Conditional GET state of a movie list page, from one query (plus the
+    person or genre lookups of a filtered list)
+
+    Covers the filtered movies (their seats too, which bookings change
+    without touching updated_at) and the genres in the filter form; removing
+    a movie or genre changes the counts.
+    """
+    movies, *_ = filter_catalog(request)
+    genres = Genre.objects.order_by()
+    # Plain SQL MAX/COUNT/SUM rather than aggregate(): no GROUP BY, so the
+    # genre subqueries share the single row even when no movie matches
+    state = movies.order_by().values(
+        last_movie=Func('updated_at', function='MAX'),
+        movie_total=Func('id', function='COUNT'),
+        seats=Func('available_seats', function='SUM'),
+        last_genre=Subquery(genres.values(last=Func('updated_at', function='MAX'))),
+        genre_total=Subquery(genres.values(count=Func('id', function='COUNT'))),
+    ).get()
+    return state, latest(state['last_movie'], state['last_genre'])
+
+
+@conditional_page(movie_list_validators)
+@cache_anonymous_page
+@read_from_replica
 def movie_list_view(request):
     """
     List all movies with search and filter
     """
-    movies = Movie.objects.filter(status='now_showing')
-    genres = Genre.objects.all()
+    movies, form, person, filtered_genres = filter_catalog(request)
+    
+    page_obj = paginate(request, movies)
+    
+    context = {
+        'movies': page_obj,
+        'page_obj': page_obj,
+        'form': form,
+        'person': person,
+    }
+    
+    response = render(request, 'User/movie_list.html', context)
+    
+    return tag_response(response, *movie_list_page_tags(page_obj, filtered_genres))
+
+
+def parse_id(model, value):
+    """
+    A query string value as a primary key of `model`, or None if it can't be one
+    
+    Rejects what int() would (including digits like '²' that pass isdigit())
+    and numbers outside the column's range, which the database driver would
+    otherwise fail on.
+    """
+    if not value:
+        return None
+    try:
+        return model._meta.pk.clean(value, None)
+    except ValidationError:
+        return None
+
+
+def filter_catalog(request):
+    """
+    Now-showing movies matching the list page's query string
+    
+    Returns (movies, form, person, filtered_genres); filtered_genres holds
+    the ids of any genres the list was narrowed to, for the page cache tags.
+    """
+    movies = Movie.objects.filter(status='now_showing').select_related('genre')
+    filtered_genres = set()
     
     # Check for genre parameter in URL
-    genre_id = request.GET.get('genre')
-    if genre_id:
-        try:
-            movies = movies.filter(genre_id=genre_id)
-        except (ValueError, Genre.DoesNotExist):
-            pass
+    genre_id = parse_id(Genre, request.GET.get('genre'))
+    if genre_id is not None:
+        movies = movies.filter(genre_id=genre_id)
+        filtered_genres.add(genre_id)
+    
+    # Movies featuring a cast member (indexed join through MovieCredit)
+    person = None
+    person_id = parse_id(Person, request.GET.get('person'))
+    if person_id is not None:
+        person = Person.objects.filter(id=person_id).first()
+        if person:
+            movies = movies.filter(credits__person=person)
     
     form = MovieSearchForm(request.GET)
     
@@ -60,50 +159,94 @@ def movie_list_view(request):
         # Search
         search_query = form.cleaned_data.get('search', '')
         if search_query:
-            movies = movies.filter(
-                Q(title__icontains=search_query) | 
-                Q(director__icontains=search_query) |
-                Q(cast__icontains=search_query)
-            )
+            movies = get_search_backend().search(movies, search_query, PUBLIC_FIELDS)
         
         # Filter by genre from form
         genre = form.cleaned_data.get('genre')
         if genre:
             movies = movies.filter(genre=genre)
+            filtered_genres.add(genre.id)
     
-    context = {
-        'movies': movies,
-        'form': form,
-    }
+    return movies, form, person, filtered_genres
+
+
+def movie_list_page_tags(page_obj, filtered_genres):
+    """Page cache tags for a rendered movie list page"""
+    # Cached copies of a genre-filtered list only depend on that genre's movies
+    catalog_tags = [genre_tag(genre) for genre in filtered_genres] or ['catalog']
+    return ['genres', *catalog_tags, *(movie_tag(movie.id) for movie in page_obj)]
+
+
+def movie_autocomplete_view(request):
+    """
+    Typeahead suggestions (titles, directors, cast) for the search boxes
+    """
+    suggestions = suggestion_index.suggest(request.GET.get('q', ''))
     
-    return render(request, 'User/movie_list.html', context)
+    return JsonResponse({
+        'suggestions': [{'label': label, 'kind': kind} for kind, label in suggestions],
+    })
+
+
+@read_from_replica
+def movie_detail_validators(request, movie_id):
+    """
+    Conditional GET state of a movie detail page, from one query
+
+    Covers the movie (and its seats, or its showtimes' seats), its genre and
+    its reviews; deleting a review changes their count. Reviewers renaming
+    themselves is not covered.
+    """
+    reviews = Review.objects.filter(movie_id=OuterRef('pk')).order_by()
+    state = Movie.objects.filter(id=movie_id).with_showtime_seats().values(
+        'updated_at', 'available_seats', 'showtime_seats', 'genre__updated_at',
+        last_review=Subquery(reviews.values(last=Func('updated_at', function='MAX'))),
+        review_total=Subquery(reviews.values(count=Func('id', function='COUNT'))),
+    ).first()
+    if state is None:
+        return None
+    return state, latest(state['updated_at'], state['genre__updated_at'], state['last_review'])
 
 
+@conditional_page(movie_detail_validators)
+@cache_anonymous_page
+@read_from_replica
 def movie_detail_view(request, movie_id):
     """
     Movie detail page with reviews
     """
-    movie = get_object_or_404(Movie, id=movie_id)
+    movie = get_object_or_404(Movie.objects.select_related('genre').with_showtime_seats(), id=movie_id)
     
     # Get site settings
-    settings = SiteSetting.get_settings()
+    settings = SiteSetting.get_cached_settings()
     
     # Only show approved reviews (or all if approval not required)
+    reviews = movie.reviews.select_related('user').order_by('-created_at')
     if settings.require_approval:
-        reviews = movie.reviews.filter(is_approved=True).order_by('-created_at')
-    else:
-        reviews = movie.reviews.all().order_by('-created_at')
+        reviews = reviews.filter(is_approved=True)
+    reviews = list(reviews)
+    
+    # Average the reviews already fetched instead of running a separate aggregate
+    avg_rating = sum(review.rating for review in reviews) / len(reviews) if reviews else None
     
-    avg_rating = reviews.aggregate(Avg('rating'))['rating__avg']
+    credits = movie.credits.select_related('person')
     
     context = {
         'movie': movie,
+        'credits': credits,
         'reviews': reviews,
         'avg_rating': avg_rating,
         'enable_review': settings.enable_review,
     }
     
-    return render(request, 'User/movie_detail.html', context)
+    response = render(request, 'User/movie_detail.html', context)
+    
+    return tag_response(response, *movie_detail_page_tags(movie))
+
+
+def movie_detail_page_tags(movie):
+    """Page cache tags for a rendered movie detail page"""
+    return [movie_tag(movie.id), movie.genre_id and genre_tag(movie.genre_id)]
 
 
 # ==================== USER VIEWS (Authenticated) ====================
@@ -113,54 +256,69 @@ def book_movie_view(request, movie_id):
     """
     Book movie tickets
     """
-    movie = get_object_or_404(Movie, id=movie_id)
+    movie = get_object_or_404(Movie.objects.select_related('genre'), id=movie_id)
     
     if request.method == 'POST':
-        form = BookingForm(request.POST)
+        form = BookingForm(request.POST, movie=movie)
         if form.is_valid():
             booking = form.save(commit=False)
             booking.user = request.user
             booking.movie = movie
             
-            # Validation
-            if booking.number_of_seats > movie.available_seats:
-                messages.error(request, 'Not enough seats available!')
-                return render(request, 'User/book_movie.html', {'movie': movie, 'form': form})
-            
             # Calculate total price
             booking.total_price = movie.ticket_price * booking.number_of_seats
             booking.status = 'confirmed'
-            booking.save()
             
-            # Update available seats
-            movie.available_seats -= booking.number_of_seats
-            movie.save()
+            # Atomically take the seats and save the booking
+            reservation = reserve_seats(booking)
+            if reservation.sold_out:
+                messages.error(request, 'Not enough seats available!')
+                return render(request, 'User/book_movie.html', sold_out_context(movie, form, booking, reservation))
             
             messages.success(request, 'Booking confirmed successfully!')
             return redirect('my_bookings')
     else:
-        form = BookingForm()
+        form = BookingForm(movie=movie)
     
     context = {
         'movie': movie,
         'form': form,
+        'available_seats': movie.available_seats,
     }
     
     return render(request, 'User/book_movie.html', context)
 
 
+def sold_out_context(movie, form, booking, reservation):
+    """
+    Booking page context after a failed reservation, with the seats left in
+    whatever the booking drew on: its showtime, or else the movie
+    """
+    context = {
+        'movie': movie,
+        'form': form,
+        'available_seats': movie.available_seats,
+    }
+    if booking.showtime_id:
+        context['sold_out_showtime'] = booking.showtime
+        context['showtime_seats'] = reservation.available_seats
+    else:
+        context['available_seats'] = reservation.available_seats
+    return context
+
+
 @login_required
 def review_movie_view(request, movie_id):
     """
     Add or edit movie review
     """
     # Check if reviews are enabled
-    settings = SiteSetting.get_settings()
+    settings = SiteSetting.get_cached_settings()
     if not settings.enable_review:
         messages.error(request, 'Reviews are currently disabled by the administrator.')
         return redirect('movie_detail', movie_id=movie_id)
     
-    movie = get_object_or_404(Movie, id=movie_id)
+    movie = get_object_or_404(Movie.objects.select_related('genre'), id=movie_id)
     
     # Check if user already reviewed this movie
     existing_review = Review.objects.filter(user=request.user, movie=movie).first()
@@ -217,6 +375,7 @@ def review_movie_view(request, movie_id):
 # ==================== ADMIN VIEWS ====================
 
 @login_required
+@read_from_replica
 def admin_dashboard(request):
     """
     Admin dashboard - only accessible to admin users
@@ -225,118 +384,24 @@ def admin_dashboard(request):
         messages.error(request, 'Access denied! Admin only.')
         return redirect('home')
     
-    from django.utils import timezone
-    from datetime import timedelta
-    import json
-    
-    # Basic Statistics
-    total_movies = Movie.objects.count()
-    total_users = Account.objects.filter(role='user').count()
-    total_bookings = Booking.objects.count()
-    total_reviews = Review.objects.count()
-    pending_bookings = Booking.objects.filter(status='pending').count()
-    
-    # Monthly Growth Calculations
-    now = timezone.now()
-    last_month = now - timedelta(days=30)
-    
-    # Movies growth
-    movies_this_month = Movie.objects.filter(created_at__gte=last_month).count()
-    movies_last_month = Movie.objects.filter(
-        created_at__gte=last_month - timedelta(days=30),
-        created_at__lt=last_month
-    ).count()
-    movies_growth = ((movies_this_month - movies_last_month) / movies_last_month * 100) if movies_last_month > 0 else 0
-    
-    # Users growth
-    users_this_month = Account.objects.filter(created_at__gte=last_month, role='user').count()
-    users_last_month = Account.objects.filter(
-        created_at__gte=last_month - timedelta(days=30),
-        created_at__lt=last_month,
-        role='user'
-    ).count()
-    users_growth = ((users_this_month - users_last_month) / users_last_month * 100) if users_last_month > 0 else 0
-    
-    # Reviews growth
-    reviews_this_month = Review.objects.filter(created_at__gte=last_month).count()
-    reviews_last_month = Review.objects.filter(
-        created_at__gte=last_month - timedelta(days=30),
-        created_at__lt=last_month
-    ).count()
-    reviews_growth = ((reviews_this_month - reviews_last_month) / reviews_last_month * 100) if reviews_last_month > 0 else 0
-    
-    # Monthly Activity Chart Data (Last 6 months)
-    monthly_activity = []
-    for i in range(5, -1, -1):
-        month_start = now - timedelta(days=30 * i)
-        month_end = now - timedelta(days=30 * (i - 1)) if i > 0 else now
-        
-        bookings_count = Booking.objects.filter(
-            booking_date__gte=month_start,
-            booking_date__lt=month_end
-        ).count()
-        
-        reviews_count = Review.objects.filter(
-            created_at__gte=month_start,
-            created_at__lt=month_end
-        ).count()
-        
-        monthly_activity.append({
-            'month': month_start.strftime('%b'),
-            'bookings': bookings_count,
-            'reviews': reviews_count
-        })
-    
-    # Movies by Genres Chart Data
-    genres = Genre.objects.all()
-    movies_by_genre = []
-    for genre in genres:
-        count = genre.movies.count()
-        if count > 0:
-            movies_by_genre.append({
-                'genre': genre.name,
-                'count': count
-            })
-    
-    # Rating Distribution Chart Data
-    rating_distribution = []
-    for rating in range(1, 6):
-        count = Review.objects.filter(rating=rating).count()
-        rating_distribution.append({
-            'rating': f'{rating} Star{"s" if rating > 1 else ""}',
-            'count': count
-        })
-    
-    # Recent Movies (Last 5)
-    recent_movies = Movie.objects.order_by('-created_at')[:5]
-    
-    # Recent Reviews (Last 5)
-    recent_reviews = Review.objects.select_related('movie', 'user').order_by('-created_at')[:5]
-    
-    # Recent data
-    recent_bookings = Booking.objects.all().order_by('-booking_date')[:5]
+    stats = DashboardStats().as_context()
     
-    context = {
-        'total_movies': total_movies,
-        'total_users': total_users,
-        'total_bookings': total_bookings,
-        'total_reviews': total_reviews,
-        'pending_bookings': pending_bookings,
-        'movies_growth': round(movies_growth, 1),
-        'users_growth': round(users_growth, 1),
-        'reviews_growth': round(reviews_growth, 1),
-        'monthly_activity': json.dumps(monthly_activity),
-        'movies_by_genre': json.dumps(movies_by_genre),
-        'rating_distribution': json.dumps(rating_distribution),
-        'recent_movies': recent_movies,
-        'recent_reviews': recent_reviews,
-        'recent_bookings': recent_bookings,
-    }
+    # The template embeds the chart data with json_script
+    context = {**stats, **recent_activity()}
     
     return render(request, 'Admin/dashboard.html', context)
 
 
+def recent_activity():
+    """The last five movies and reviews shown on the dashboard"""
+    return {
+        'recent_movies': Movie.objects.select_related('genre').order_by('-created_at')[:5],
+        'recent_reviews': Review.objects.select_related('movie', 'user').order_by('-created_at')[:5],
+    }
+
+
 @login_required
+@read_from_replica
 def admin_profile(request):
     """
     Admin profile view - Shows admin account information
@@ -347,18 +412,9 @@ def admin_profile(request):
     
     user = request.user
     
-    # Get admin statistics
-    total_movies = Movie.objects.count()
-    total_users = Account.objects.filter(role='user').count()
-    total_bookings = Booking.objects.count()
-    total_reviews = Review.objects.count()
-    
     context = {
         'user': user,
-        'total_movies': total_movies,
-        'total_users': total_users,
-        'total_bookings': total_bookings,
-        'total_reviews': total_reviews,
+        **DashboardStats().totals(),
     }
     
     return render(request, 'Admin/admin_profile.html', context)
@@ -373,21 +429,23 @@ def manage_movies(request):
         messages.error(request, 'Access denied! Admin only.')
         return redirect('home')
     
-    movies = Movie.objects.all().order_by('-created_at')
+    movies = Movie.objects.select_related('genre').order_by('-created_at')
     genres = Genre.objects.all().order_by('name')
     
     # Search functionality
     search_query = request.GET.get('search', '')
     if search_query:
+        # Genre names are a handful of short rows, so a plain LIKE is fine there
         movies = movies.filter(
-            Q(title__icontains=search_query) |
-            Q(director__icontains=search_query) |
-            Q(genre__name__icontains=search_query) |
-            Q(description__icontains=search_query)
+            get_search_backend().match_condition(search_query, ADMIN_FIELDS) |
+            Q(genre__in=Genre.objects.filter(name__icontains=search_query))
         )
     
+    page_obj = paginate(request, movies)
+    
     context = {
-        'movies': movies,
+        'movies': page_obj,
+        'page_obj': page_obj,
         'genres': genres,
         'search_query': search_query,
     }
@@ -503,7 +561,7 @@ def manage_genres(request):
         messages.error(request, 'Access denied! Admin only.')
         return redirect('home')
     
-    genres = Genre.objects.all().order_by('name')
+    genres = Genre.objects.annotate(num_movies=Count('movies')).order_by('name')
     
     # Search functionality
     search_query = request.GET.get('search', '')
@@ -629,10 +687,11 @@ def manage_bookings(request):
         messages.error(request, 'Access denied! Admin only.')
         return redirect('home')
     
-    bookings = Booking.objects.all().order_by('-booking_date')
+    page_obj = keyset_paginate(request, Booking.objects.select_related('user', 'movie'), 'booking_date')
     
     context = {
-        'bookings': bookings,
+        'bookings': page_obj,
+        'page_obj': page_obj,
     }
     
     return render(request, 'Admin/manage_bookings.html', context)
@@ -647,22 +706,22 @@ def update_booking_status(request, booking_id):
         messages.error(request, 'Access denied! Admin only.')
         return redirect('home')
     
-    booking = get_object_or_404(Booking, id=booking_id)
-    
     if request.method == 'POST':
-        form = BookingStatusForm(request.POST, instance=booking)
-        if form.is_valid():
+        with transaction.atomic():
+            # Lock the booking so two cancellations can't both return its seats
+            booking = get_object_or_404(Booking.objects.select_for_update(), id=booking_id)
+            # Read before validation, which already copies the new status onto the instance
             old_status = booking.status
-            new_booking = form.save()
-            
-            # If cancelled, return seats to movie
-            if new_booking.status == 'cancelled' and old_status != 'cancelled':
-                movie = new_booking.movie
-                movie.available_seats += new_booking.number_of_seats
-                movie.save()
-            
-            messages.success(request, 'Booking status updated!')
-            return redirect('manage_bookings')
+            form = BookingStatusForm(request.POST, instance=booking)
+            if form.is_valid():
+                new_booking = form.save()
+                
+                # If cancelled, return seats to movie
+                if new_booking.status == 'cancelled' and old_status != 'cancelled':
+                    release_seats(new_booking)
+                
+                messages.success(request, 'Booking status updated!')
+                return redirect('manage_bookings')
     
     return redirect('manage_bookings')
 
@@ -676,10 +735,11 @@ def manage_reviews(request):
         messages.error(request, 'Access denied! Admin only.')
         return redirect('home')
     
-    reviews = Review.objects.all().order_by('-created_at')
+    page_obj = keyset_paginate(request, Review.objects.select_related('user', 'movie'), 'created_at')
     
     context = {
-        'reviews': reviews,
+        'reviews': page_obj,
+        'page_obj': page_obj,
     }
     
     return render(request, 'Admin/manage_reviews.html', context)
@@ -695,8 +755,10 @@ def approve_review(request, review_id):
         return redirect('home')
     
     review = get_object_or_404(Review, id=review_id)
-    review.is_approved = True
-    review.save()
+    if not review.is_approved:
+        # Only the approval flag changed; Review.save() adjusts the movie aggregates
+        review.is_approved = True
+        review.save(update_fields=['is_approved', 'updated_at'])
     
     messages.success(request, 'Review approved successfully!')
     return redirect('manage_reviews')
@@ -712,8 +774,10 @@ def reject_review(request, review_id):
         return redirect('home')
     
     review = get_object_or_404(Review, id=review_id)
-    review.is_approved = False
-    review.save()
+    if review.is_approved:
+        # Only the approval flag changed; Review.save() adjusts the movie aggregates
+        review.is_approved = False
+        review.save(update_fields=['is_approved', 'updated_at'])
     
     messages.success(request, 'Review rejected successfully!')
     return redirect('manage_reviews')
@@ -744,7 +808,7 @@ def manage_users(request):
         messages.error(request, 'Access denied! Admin only.')
         return redirect('home')
     
-    users = Account.objects.all().order_by('-created_at')
+    users = Account.objects.annotate(num_reviews=Count('reviews')).order_by('-created_at')
     
     # Search functionality
     search_query = request.GET.get('search', '')
@@ -754,8 +818,11 @@ def manage_users(request):
             Q(email__icontains=search_query)
         )
     
+    page_obj = paginate(request, users)
+    
     context = {
-        'users': users,
+        'users': page_obj,
+        'page_obj': page_obj,
         'search_query': search_query,
     }
     
@@ -891,11 +958,23 @@ def admin_settings(request):
         # Update settings from form
         settings.site_name = request.POST.get('site_name', settings.site_name)
         settings.site_email = request.POST.get('site_email', settings.site_email)
-        settings.items_per_page = int(request.POST.get('items_per_page', settings.items_per_page))
+        try:
+            settings.items_per_page = SiteSetting._meta.get_field('items_per_page').clean(
+                request.POST.get('items_per_page', settings.items_per_page), settings
+            )
+        except ValidationError as error:
+            messages.error(request, f'Settings not saved: {error.messages[0]}')
+            return redirect('admin_settings')
         
         # Handle file upload
+        logo_error = None
         if request.FILES.get('site_logo'):
-            settings.site_logo = request.FILES['site_logo']
+            try:
+                validate_image_upload(request.FILES['site_logo'])
+            except ValidationError as error:
+                logo_error = error.messages[0]
+            else:
+                settings.site_logo = request.FILES['site_logo']
         
         # Handle checkboxes (they're only present if checked)
         settings.enable_review = 'enable_review' in request.POST
@@ -905,7 +984,10 @@ def admin_settings(request):
         
         settings.save()
         
-        messages.success(request, 'Settings saved successfully!')
+        if logo_error:
+            messages.error(request, f'Settings saved without the logo: {logo_error}')
+        else:
+            messages.success(request, 'Settings saved successfully!')
         return redirect('admin_settings')
     
     context = {
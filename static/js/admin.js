@@ -0,0 +1,10 @@
+function toggleSidebar() {
+    document.getElementById('sidebar').classList.toggle('collapsed');
+}
+
+// Mobile sidebar toggle
+if (window.innerWidth <= 768) {
+    document.querySelector('.toggle-sidebar').addEventListener('click', function() {
+        document.getElementById('sidebar').classList.toggle('show');
+    });
+}
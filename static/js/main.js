@@ -10,3 +10,56 @@ document.addEventListener('DOMContentLoaded', function() {
         }, 5000);
     });
 });
+
+// Typeahead suggestions for search boxes with a data-autocomplete-url
+document.addEventListener('DOMContentLoaded', function() {
+    const inputs = document.querySelectorAll('input[data-autocomplete-url]');
+    
+    inputs.forEach(function(input, index) {
+        const list = document.createElement('datalist');
+        list.id = 'autocomplete-list-' + index;
+        input.after(list);
+        input.setAttribute('list', list.id);
+        
+        let timer = null;
+        let pending = null;
+        
+        input.addEventListener('input', function() {
+            clearTimeout(timer);
+            const query = input.value.trim();
+            if (query.length < 2) {
+                list.replaceChildren();
+                return;
+            }
+            
+            // Wait for a pause in typing and drop responses to older keystrokes
+            timer = setTimeout(function() {
+                if (pending) {
+                    pending.abort();
+                }
+                pending = new AbortController();
+                
+                const url = input.dataset.autocompleteUrl + '?q=' + encodeURIComponent(query);
+                fetch(url, { signal: pending.signal })
+                    .then(function(response) { return response.json(); })
+                    .then(function(data) {
+                        list.replaceChildren(...data.suggestions.map(function(suggestion) {
+                            const option = document.createElement('option');
+                            option.value = suggestion.label;
+                            option.label = suggestion.kind;
+                            return option;
+                        }));
+                    })
+                    .catch(function() {});
+            }, 150);
+        });
+    });
+});
+
+// Open the login modal after registration (base.html marks the body)
+document.addEventListener('DOMContentLoaded', function() {
+    const modal = document.getElementById('loginModal');
+    if (modal && document.body.hasAttribute('data-show-login')) {
+        new bootstrap.Modal(modal).show();
+    }
+});